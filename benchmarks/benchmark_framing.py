@@ -0,0 +1,80 @@
+"""
+Compares the runtime and the peak memory of the STFT framing in `get_X_km` with the
+previous framing that copied every frame into a list before stacking them.
+
+Usage: python benchmarks/benchmark_framing.py
+"""
+
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from mel_cepstral_distance.computation import adjust_win_len_to_n_fft, get_X_km
+
+SAMPLE_RATE = 22050
+N_FFT = 1024
+WIN_LEN = 1024
+HOP_LEN = 256
+WINDOW = "hanning"
+DURATIONS_MIN = (1, 5, 20)
+REPETITIONS = 3
+
+
+def get_X_km_copied_frames(
+  S: npt.NDArray, n_fft: int, win_len: int, hop_length: int
+) -> npt.NDArray[np.complex128]:
+  # framing as it was implemented before
+  K = len(S)
+  windowed_frames = np.array(
+    [S[k : k + win_len] for k in np.arange(0, K - win_len, hop_length, int)]
+  )
+  windowed_frames, adjusted_win_len = adjust_win_len_to_n_fft(windowed_frames, n_fft)
+  win = np.hanning(adjusted_win_len)
+  return np.fft.rfft(windowed_frames * win, n=n_fft)
+
+
+def get_X_km_strided_frames(
+  S: npt.NDArray, n_fft: int, win_len: int, hop_length: int
+) -> npt.NDArray[np.complex128]:
+  return get_X_km(S, n_fft, win_len, hop_length, WINDOW)
+
+
+def measure(
+  method: Callable[[npt.NDArray, int, int, int], npt.NDArray], S: npt.NDArray
+) -> Tuple[float, float]:
+  """returns the best runtime in seconds and the peak memory in MiB"""
+  durations = []
+  for _ in range(REPETITIONS):
+    start = time.perf_counter()
+    method(S, N_FFT, WIN_LEN, HOP_LEN)
+    durations.append(time.perf_counter() - start)
+
+  tracemalloc.start()
+  method(S, N_FFT, WIN_LEN, HOP_LEN)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return min(durations), peak / 2**20
+
+
+def main() -> None:
+  rng = np.random.default_rng(1234)
+  print(f"{'signal':>8} {'method':>8} {'time (s)':>10} {'peak (MiB)':>11}")  # noqa: T201
+  for duration_min in DURATIONS_MIN:
+    S = rng.uniform(-1, 1, duration_min * 60 * SAMPLE_RATE)
+    assert np.array_equal(
+      get_X_km_copied_frames(S, N_FFT, WIN_LEN, HOP_LEN),
+      get_X_km_strided_frames(S, N_FFT, WIN_LEN, HOP_LEN),
+    )
+    for name, method in (
+      ("copied", get_X_km_copied_frames),
+      ("strided", get_X_km_strided_frames),
+    ):
+      runtime, peak = measure(method, S)
+      print(f"{duration_min:>6}min {name:>8} {runtime:>10.3f} {peak:>11.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,71 @@
+"""
+Measures the time to import `mel_cepstral_distance`, which imports scipy.io,
+scipy.signal, scipy.fft, scipy.spatial, fastdtw and the multiprocessing modules only on
+first use, and compares it with importing these modules eagerly as the package did
+before. The first comparison of two audio files shows which part of the deferred
+imports is still needed for it. Every measurement runs in a new interpreter.
+
+Usage: python benchmarks/benchmark_import.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPETITIONS = 10
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+STATEMENTS = (
+  ("numpy", "import numpy"),
+  ("package", "import mel_cepstral_distance"),
+  (
+    "package + eager",
+    "import mel_cepstral_distance, scipy.io.wavfile, scipy.signal, scipy.fft, "
+    "scipy.spatial.distance, fastdtw.fastdtw, concurrent.futures.process",
+  ),
+  (
+    "package + compare",
+    "import mel_cepstral_distance; mel_cepstral_distance.compare_audio_files("
+    f"{str(EXAMPLES_DIR / 'GT.wav')!r}, {str(EXAMPLES_DIR / 'WaveGlow.wav')!r})",
+  ),
+  (
+    "eager + compare",
+    "import mel_cepstral_distance, scipy.io.wavfile, scipy.signal, scipy.fft, "
+    "scipy.spatial.distance, fastdtw.fastdtw, concurrent.futures.process; "
+    "mel_cepstral_distance.compare_audio_files("
+    f"{str(EXAMPLES_DIR / 'GT.wav')!r}, {str(EXAMPLES_DIR / 'WaveGlow.wav')!r})",
+  ),
+)
+
+CODE = """
+import logging, time
+logging.disable()
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str) -> float:
+  """returns the best runtime of the statement in a new interpreter in seconds"""
+  durations = []
+  for _ in range(REPETITIONS):
+    output = subprocess.run(
+      [sys.executable, "-c", CODE.format(statement=statement)],
+      capture_output=True,
+      check=True,
+      text=True,
+    ).stdout
+    durations.append(float(output))
+  return min(durations)
+
+
+def main() -> None:
+  print(f"{'statement':>18} {'time (s)':>10}")  # noqa: T201
+  for name, statement in STATEMENTS:
+    runtime = measure(statement)
+    print(f"{name:>18} {runtime:>10.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,90 @@
+"""
+Compares the runtime and the peak memory of `get_X_kn`, which computes the energy of
+the spectrogram in place for one chunk of frames at a time, with the previous
+implementation that created the magnitude and the energy of the whole spectrogram
+before applying the filterbank, and with the dense instead of the banded filterbank.
+`get_X_kn_from_energy` is measured on a precomputed energy spectrogram.
+
+Usage: python benchmarks/benchmark_mel_spectrogram.py
+"""
+
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from mel_cepstral_distance import computation
+from mel_cepstral_distance.computation import get_w_n_m, get_X_kn, get_X_kn_from_energy
+from mel_cepstral_distance.helper import amp_to_mag, energy_to_bel, mag_to_energy
+
+SAMPLE_RATE = 16000
+# number of frames, FFT lengths and number of mel bands, 200000 frames are about 27min
+# with a hop of 8ms
+SHAPES = ((50000, 512, 80), (200000, 512, 80), (50000, 2048, 20), (50000, 2048, 80))
+REPETITIONS = 3
+
+
+def get_X_kn_whole_energy(X_km: npt.NDArray, w_n_m: npt.NDArray) -> npt.NDArray:
+  # implementation as it was before
+  X_km_energy = mag_to_energy(amp_to_mag(X_km))
+  return energy_to_bel(X_km_energy @ w_n_m.T)
+
+
+def get_X_kn_dense(X_km: npt.NDArray, w_n_m: npt.NDArray) -> npt.NDArray:
+  banded_min_frames = computation.BANDED_MIN_FRAMES
+  computation.BANDED_MIN_FRAMES = X_km.shape[0] + 1
+  try:
+    return get_X_kn(X_km, w_n_m)
+  finally:
+    computation.BANDED_MIN_FRAMES = banded_min_frames
+
+
+def measure(
+  method: Callable[[npt.NDArray, npt.NDArray], npt.NDArray],
+  X: npt.NDArray,
+  w_n_m: npt.NDArray,
+) -> Tuple[float, float]:
+  """returns the best runtime in seconds and the peak memory in MiB"""
+  durations = []
+  for _ in range(REPETITIONS):
+    start = time.perf_counter()
+    method(X, w_n_m)
+    durations.append(time.perf_counter() - start)
+
+  tracemalloc.start()
+  method(X, w_n_m)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return min(durations), peak / 2**20
+
+
+def main() -> None:
+  rng = np.random.default_rng(1234)
+  print(  # noqa: T201
+    f"{'frames':>7} {'n_fft':>6} {'M':>3} {'method':>12} {'time (s)':>10} "
+    f"{'peak (MiB)':>11}"
+  )
+  for n_frames, n_fft, M in SHAPES:
+    shape = (n_frames, n_fft // 2 + 1)
+    X_km = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    X_km_energy = np.abs(X_km) ** 2
+    w_n_m = get_w_n_m(SAMPLE_RATE, n_fft, M, 0, SAMPLE_RATE // 2)
+    np.testing.assert_allclose(
+      get_X_kn(X_km, w_n_m), get_X_kn_whole_energy(X_km, w_n_m), atol=1e-12
+    )
+    for name, method, X in (
+      ("whole", get_X_kn_whole_energy, X_km),
+      ("dense", get_X_kn_dense, X_km),
+      ("banded", get_X_kn, X_km),
+      ("precomputed", get_X_kn_from_energy, X_km_energy),
+    ):
+      runtime, peak = measure(method, X, w_n_m)
+      print(  # noqa: T201
+        f"{n_frames:>7} {n_fft:>6} {M:>3} {name:>12} {runtime:>10.3f} {peak:>11.1f}"
+      )
+
+
+if __name__ == "__main__":
+  main()
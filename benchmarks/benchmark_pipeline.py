@@ -0,0 +1,291 @@
+"""
+Measures the runtime and the peak memory of the stages of the MCD pipeline
+(`get_X_km`, `get_w_n_m`, `get_X_kn`, `get_MC_X_ik`, `remove_silence_rms` and
+`align_2d_sequences_using_dtw`) and of `compare_audio_files` end-to-end for several
+durations, sample rates and alignment modes. The audios are synthetic speech-like
+signals, the second one is a slowed down version of the first one. The results are
+printed as a table and can be written to a JSON file to track regressions, e.g., by
+comparing the files of two commits.
+
+Usage: python benchmarks/benchmark_pipeline.py [--durations 1 10] [--output out.json]
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from importlib.metadata import version
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from scipy.io import wavfile
+
+from mel_cepstral_distance import computation
+from mel_cepstral_distance.alignment import align_2d_sequences_using_dtw
+from mel_cepstral_distance.api import compare_audio_files
+from mel_cepstral_distance.computation import get_MC_X_ik, get_w_n_m, get_X_km, get_X_kn
+from mel_cepstral_distance.helper import norm_audio_signal, samples_to_ms
+from mel_cepstral_distance.silence import remove_silence_rms
+
+# durations in seconds
+DURATIONS = (1, 10, 60, 600, 1800)
+SAMPLE_RATES = (16000, 22050, 44100)
+REPETITIONS = 3
+# fastdtw takes minutes for longer audios
+MAX_FASTDTW_DURATION = 60
+
+# feature parameters, the FFT length is the power of 2 closest to 32ms
+WIN_MS = 32
+WINDOW: Literal["hamming", "hanning"] = "hanning"
+M = 20
+S = 1
+D = 16
+DTW_RADIUS = 10
+SILENCE_THRESHOLD = 0.01
+DTW_BACKENDS: Tuple[Literal["fastdtw", "multires", "sakoe-chiba"], ...] = (
+  "fastdtw",
+  "multires",
+  "sakoe-chiba",
+)
+
+# synthetic signal: harmonic tone with a pitch between 100 and 200 Hz, amplitude
+# modulated with 4 syllables per second, pauses of 0.5s in about 20% of the time and
+# background noise
+F0 = 150
+F0_DEVIATION = 50
+F0_RATE = 0.3
+N_HARMONICS = 10
+SYLLABLE_RATE = 4
+PAUSE_LEN = 0.5
+PAUSE_PROBABILITY = 0.2
+NOISE_LEVEL = 0.001
+# factor by which the second audio is slowed down
+STRETCH = 1.05
+# the signal is generated in blocks of 10s to bound its memory
+BLOCK_LEN = 10
+
+
+def get_signal(
+  duration: float, sample_rate: int, stretch: float = 1.0, seed: int = 1234
+) -> npt.NDArray[np.int16]:
+  """returns the synthetic signal with `duration` seconds slowed down by `stretch`"""
+  n_samples = int(duration * stretch * sample_rate)
+  rng = np.random.default_rng(seed)
+  # the pauses do not depend on the stretch
+  is_voiced = rng.random(int(duration / PAUSE_LEN) + 1) >= PAUSE_PROBABILITY
+  signal = np.empty(n_samples, dtype=np.int16)
+  block_len = BLOCK_LEN * sample_rate
+  for start in range(0, n_samples, block_len):
+    t = np.arange(start, min(start + block_len, n_samples)) / (sample_rate * stretch)
+    # integral of the pitch F0 + F0_DEVIATION * sin(2 * pi * F0_RATE * t)
+    phase = 2 * np.pi * F0 * t - F0_DEVIATION / F0_RATE * np.cos(
+      2 * np.pi * F0_RATE * t
+    )
+    tone = sum(np.sin(h * phase) / h for h in range(1, N_HARMONICS + 1))
+    envelope = (
+      np.sin(np.pi * SYLLABLE_RATE * t) ** 2 * is_voiced[(t / PAUSE_LEN).astype(int)]
+    )
+    block = 0.3 * envelope * tone + NOISE_LEVEL * rng.standard_normal(len(t))
+    signal[start : start + len(t)] = np.clip(block, -1, 1) * np.iinfo(np.int16).max
+  return signal
+
+
+def get_n_fft(sample_rate: int) -> int:
+  return int(2 ** np.round(np.log2(WIN_MS / 1000 * sample_rate)))
+
+
+def measure(method: Callable[[], Any], repetitions: int) -> Tuple[List[float], float]:
+  """returns the runtimes in seconds and the peak memory in MiB"""
+  durations = []
+  for _ in range(repetitions):
+    start = time.perf_counter()
+    method()
+    durations.append(time.perf_counter() - start)
+
+  tracemalloc.start()
+  method()
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return durations, peak / 2**20
+
+
+def get_w_n_m_uncached(sample_rate: int, n_fft: int) -> npt.NDArray:
+  computation._get_w_n_m.cache_clear()
+  return get_w_n_m(sample_rate, n_fft, M, 0, sample_rate / 2)
+
+
+def get_stage_methods(
+  signal_A: npt.NDArray, signal_B: npt.NDArray, sample_rate: int
+) -> List[Tuple[str, str, int, Callable[[], Any]]]:
+  """returns stage, variant, number of frames and method of every stage"""
+  n_fft = get_n_fft(sample_rate)
+  hop_len = n_fft // 4
+  S_A = norm_audio_signal(signal_A)
+  X_km = get_X_km(S_A, n_fft, n_fft, hop_len, WINDOW)
+  w_n_m = get_w_n_m(sample_rate, n_fft, M, 0, sample_rate / 2)
+  X_kn = get_X_kn(X_km, w_n_m)
+  MC_X_ik_A = get_MC_X_ik(X_kn, M, s=S, D=D)
+  X_kn_B = get_X_kn(
+    get_X_km(norm_audio_signal(signal_B), n_fft, n_fft, hop_len, WINDOW), w_n_m
+  )
+  MC_X_ik_B = get_MC_X_ik(X_kn_B, M, s=S, D=D)
+  n_frames = len(X_km)
+
+  methods: List[Tuple[str, str, int, Callable[[], Any]]] = [
+    ("get_X_km", "-", n_frames, lambda: get_X_km(S_A, n_fft, n_fft, hop_len, WINDOW)),
+    ("get_w_n_m", "cold", 0, lambda: get_w_n_m_uncached(sample_rate, n_fft)),
+    (
+      "get_w_n_m",
+      "warm",
+      0,
+      lambda: get_w_n_m(sample_rate, n_fft, M, 0, sample_rate / 2),
+    ),
+    ("get_X_kn", "-", n_frames, lambda: get_X_kn(X_km, w_n_m)),
+    ("get_MC_X_ik", "-", n_frames, lambda: get_MC_X_ik(X_kn, M, s=S, D=D)),
+    (
+      "remove_silence_rms",
+      "-",
+      n_frames,
+      lambda: remove_silence_rms(S_A, SILENCE_THRESHOLD, n_fft),
+    ),
+  ]
+  methods.extend(
+    (
+      "align_2d_sequences_using_dtw",
+      backend,
+      n_frames,
+      partial(align_2d_sequences_using_dtw, MC_X_ik_A, MC_X_ik_B, DTW_RADIUS, backend),
+    )
+    for backend in DTW_BACKENDS
+  )
+  return methods
+
+
+def get_compare_methods(
+  path_A: Path, path_B: Path, sample_rate: int, n_frames: int
+) -> List[Tuple[str, str, int, Callable[[], Any]]]:
+  """returns stage, variant, number of frames and method of every alignment mode"""
+  n_fft = get_n_fft(sample_rate)
+  params: Dict[str, Any] = {
+    "sample_rate": sample_rate,
+    "n_fft": samples_to_ms(n_fft, sample_rate),
+    "win_len": samples_to_ms(n_fft, sample_rate),
+    "hop_len": samples_to_ms(n_fft // 4, sample_rate),
+    "window": WINDOW,
+    "M": M,
+    "s": S,
+    "D": D,
+    "dtw_radius": DTW_RADIUS,
+  }
+  methods: List[Tuple[str, str, int, Callable[[], Any]]] = [
+    (
+      "compare_audio_files",
+      "pad",
+      n_frames,
+      lambda: compare_audio_files(path_A, path_B, aligning="pad", **params),
+    )
+  ]
+  methods.extend(
+    (
+      "compare_audio_files",
+      f"dtw/{backend}",
+      n_frames,
+      partial(
+        compare_audio_files,
+        path_A,
+        path_B,
+        aligning="dtw",
+        dtw_backend=backend,
+        **params,
+      ),
+    )
+    for backend in DTW_BACKENDS
+  )
+  return methods
+
+
+def get_metadata(repetitions: int) -> Dict[str, Any]:
+  return {
+    "date": datetime.now(timezone.utc).isoformat(),
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "processor": platform.processor(),
+    "mel-cepstral-distance": version("mel-cepstral-distance"),
+    "numpy": np.__version__,
+    "scipy": version("scipy"),
+    "fastdtw": version("fastdtw"),
+    "repetitions": repetitions,
+  }
+
+
+def main(
+  durations: List[float],
+  sample_rates: List[int],
+  repetitions: int,
+  output: Optional[Path],
+) -> None:
+  results = []
+  print(  # noqa: T201
+    f"{'duration':>8} {'sr':>6} {'stage':>28} {'variant':>16} {'frames':>7} "
+    f"{'time (s)':>10} {'peak (MiB)':>11}"
+  )
+  for duration in durations:
+    for sample_rate in sample_rates:
+      signal_A = get_signal(duration, sample_rate)
+      signal_B = get_signal(duration, sample_rate, STRETCH)
+      with TemporaryDirectory() as tmp_dir:
+        path_A = Path(tmp_dir) / "A.wav"
+        path_B = Path(tmp_dir) / "B.wav"
+        wavfile.write(path_A, sample_rate, signal_A)
+        wavfile.write(path_B, sample_rate, signal_B)
+        methods = get_stage_methods(signal_A, signal_B, sample_rate)
+        n_frames = methods[0][2]
+        methods += get_compare_methods(path_A, path_B, sample_rate, n_frames)
+        for stage, variant, n_frames, method in methods:
+          if "fastdtw" in variant and duration > MAX_FASTDTW_DURATION:
+            continue
+          runtimes, peak = measure(method, repetitions)
+          results.append(
+            {
+              "stage": stage,
+              "variant": variant,
+              "duration_s": duration,
+              "sample_rate": sample_rate,
+              "frames": n_frames,
+              "runtimes_s": runtimes,
+              "best_s": min(runtimes),
+              "median_s": float(np.median(runtimes)),
+              "peak_mib": peak,
+            }
+          )
+          print(  # noqa: T201
+            f"{duration:>8g} {sample_rate:>6} {stage:>28} {variant:>16} "
+            f"{n_frames:>7} {min(runtimes):>10.3f} {peak:>11.1f}"
+          )
+
+  if output is not None:
+    output.write_text(
+      json.dumps({"metadata": get_metadata(repetitions), "results": results}, indent=2)
+    )
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+  parser.add_argument(
+    "--durations", type=float, nargs="+", default=DURATIONS, help="durations in s"
+  )
+  parser.add_argument("--sample-rates", type=int, nargs="+", default=SAMPLE_RATES)
+  parser.add_argument("--repetitions", type=int, default=REPETITIONS)
+  parser.add_argument("--output", type=Path, help="JSON file to write the results to")
+  return parser.parse_args()
+
+
+if __name__ == "__main__":
+  args = parse_args()
+  main(args.durations, args.sample_rates, args.repetitions, args.output)
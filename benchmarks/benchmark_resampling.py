@@ -0,0 +1,59 @@
+"""
+Compares the runtime and the peak memory of the FFT-based and the polyphase resampling
+in `resample_if_necessary`. The number of samples of the signals are chosen to have
+large prime factors, for which the FFT-based resampling is slowest.
+
+Usage: python benchmarks/benchmark_resampling.py
+"""
+
+import time
+import tracemalloc
+from typing import Literal, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from mel_cepstral_distance.helper import resample_if_necessary
+
+SAMPLE_RATE = 44100
+TARGET_SAMPLE_RATES = (22050, 16000)
+# number of samples: 10s + 7 (= 7 * 251 * 251), 1min + 11 and 5min + 1 (both prime)
+N_SAMPLES = (441007, 2646011, 13230001)
+REPETITIONS = 3
+
+
+def measure(
+  S: npt.NDArray, target_sr: int, method: Literal["fft", "polyphase"]
+) -> Tuple[float, float]:
+  """returns the best runtime in seconds and the peak memory in MiB"""
+  durations = []
+  for _ in range(REPETITIONS):
+    start = time.perf_counter()
+    resample_if_necessary(S, SAMPLE_RATE, target_sr, method)
+    durations.append(time.perf_counter() - start)
+
+  tracemalloc.start()
+  resample_if_necessary(S, SAMPLE_RATE, target_sr, method)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return min(durations), peak / 2**20
+
+
+def main() -> None:
+  rng = np.random.default_rng(1234)
+  print(  # noqa: T201
+    f"{'samples':>9} {'target':>7} {'method':>10} {'time (s)':>10} {'peak (MiB)':>11}"
+  )
+  for n_samples in N_SAMPLES:
+    S = (rng.uniform(-1, 1, n_samples) * 2**14).astype(np.int16)
+    for target_sr in TARGET_SAMPLE_RATES:
+      methods: Tuple[Literal["fft", "polyphase"], ...] = ("fft", "polyphase")
+      for method in methods:
+        runtime, peak = measure(S, target_sr, method)
+        print(  # noqa: T201
+          f"{n_samples:>9} {target_sr:>7} {method:>10} {runtime:>10.3f} {peak:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+  main()
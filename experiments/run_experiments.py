@@ -3,7 +3,6 @@ import itertools
 import logging
 import pickle
 from collections import OrderedDict
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from typing import OrderedDict as ODType
@@ -16,7 +15,7 @@ from datasets import (
 from scipy.stats import kendalltau, spearmanr
 from tqdm import tqdm
 
-from mel_cepstral_distance import compare_audio_files
+from mel_cepstral_distance import compare_audio_files_batch
 from mel_cepstral_distance.helper import samples_to_ms
 
 EXPERIMENTS_BASE_DIR = Path("experiments")
@@ -69,34 +68,36 @@ PARAMS_PROTOTYPE = {
 }
 
 
-def compare_mel_spectrograms_main(
+def get_compare_kwargs(params: Dict) -> Dict[str, Any]:
+  return {
+    "s": params[PARAM_S],
+    "D": params[PARAM_D],
+    "align_target": params[PARAM_ALIGN_TARGET],
+    "aligning": params[PARAM_ALIGN_METHOD],
+    "remove_silence": params[PARAM_REMOVE_SILENCE],
+    "silence_threshold_A": params[PARAM_SILENCE_THRESHOLD_A],
+    "silence_threshold_B": params[PARAM_SILENCE_THRESHOLD_B],
+    "dtw_radius": params[PARAM_DTW_RADIUS],
+    "fmax": params[PARAM_FMAX],
+    "fmin": params[PARAM_FMIN],
+    "n_fft": params[PARAM_N_FFT],
+    "M": params[PARAM_M],
+    "hop_len": params[PARAM_HOP_LEN],
+    "win_len": params[PARAM_WIN_LEN],
+    "window": params[PARAM_WINDOW],
+    "sample_rate": params[PARAM_SAMPLE_RATE],
+    "norm_audio": params[PARAM_NORM_AUDIO],
+  }
+
+
+def create_result(
   alg_name: str,
   wav_a: Path,
   wav_b: Path,
   params: Dict,
+  mcd: float,
+  pen: float,
 ) -> ODType[str, Any]:
-  mcd, pen = compare_audio_files(
-    wav_a,
-    wav_b,
-    s=params[PARAM_S],
-    D=params[PARAM_D],
-    align_target=params[PARAM_ALIGN_TARGET],
-    aligning=params[PARAM_ALIGN_METHOD],
-    remove_silence=params[PARAM_REMOVE_SILENCE],
-    silence_threshold_A=params[PARAM_SILENCE_THRESHOLD_A],
-    silence_threshold_B=params[PARAM_SILENCE_THRESHOLD_B],
-    dtw_radius=params[PARAM_DTW_RADIUS],
-    fmax=params[PARAM_FMAX],
-    fmin=params[PARAM_FMIN],
-    n_fft=params[PARAM_N_FFT],
-    M=params[PARAM_M],
-    hop_len=params[PARAM_HOP_LEN],
-    win_len=params[PARAM_WIN_LEN],
-    window=params[PARAM_WINDOW],
-    sample_rate=params[PARAM_SAMPLE_RATE],
-    norm_audio=params[PARAM_NORM_AUDIO],
-  )
-
   result = OrderedDict()
   result["algo_a"] = "gt"
   result["algo_b"] = alg_name
@@ -157,32 +158,22 @@ def get_obj_val(
 
   jobs: List[Tuple] = []
   for gt_file, impl_file in zip(gt_files, impl_files):
-    jobs.append(
-      (
-        "impl",
-        Path(gt_file),
-        Path(impl_file),
-        params,
-      )
-    )
+    jobs.append(("impl", Path(gt_file), Path(impl_file)))
   for gt_file, expl_file in zip(gt_files, expl_files):
-    jobs.append(("expl", Path(gt_file), Path(expl_file), params))
-
-  results = []
-  if multicore:
-    with ProcessPoolExecutor() as executor:
-      futures = [executor.submit(run_job, args) for args in jobs]
-      for future in tqdm(as_completed(futures), total=len(futures)):
-        results.append(future.result())
-  else:
-    for job in tqdm(jobs, desc="Processing jobs"):
-      result = run_job(job)
-      results.append(result)
-  return results
+    jobs.append(("expl", Path(gt_file), Path(expl_file)))
 
+  # the results are returned in the order of the pairs
+  mcd_pen = compare_audio_files_batch(
+    [(wav_a, wav_b) for _, wav_a, wav_b in jobs],
+    n_jobs=-1 if multicore else 1,
+    **get_compare_kwargs(params),
+  )
 
-def run_job(args):
-  return compare_mel_spectrograms_main(*args)
+  results = [
+    create_result(alg_name, wav_a, wav_b, params, float(mcd), float(pen))
+    for (alg_name, wav_a, wav_b), (mcd, pen) in zip(jobs, mcd_pen)
+  ]
+  return results
 
 
 def get_mos_df(dimension: str, reset_cache: bool = False) -> pd.DataFrame:
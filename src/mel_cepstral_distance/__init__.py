@@ -7,14 +7,34 @@ Functions
 ---------
 - `get_amplitude_spectrogram`: Computes the Short-Time Fourier Transform (STFT)
   of an audio signal and returns the amplitude spectrogram.
+- `get_amplitude_spectrogram_from_signal`: Same as `get_amplitude_spectrogram` for a
+  signal that is already in memory.
 - `get_mel_spectrogram`: Converts an amplitude spectrogram to a Mel spectrogram
   using mel filterbanks.
 - `get_mfccs`: Extracts MFCCs from a Mel spectrogram.
+- `MCDExtractor`: Extracts features and compares audio files with a fixed
+  configuration, reusing the precomputed window, filterbank and DCT matrices.
 - `compare_audio_files`: Compares two audio files by calculating the MCD and
   alignment penalty.
+- `compare_audio_signals`: Same as `compare_audio_files` for signals that are already
+  in memory.
+- `compare_audio_files_batch`: Compares many pairs of audio files with the same
+  parameters.
+- `pairwise_mcd`: Compares all pairs of a collection of audios and returns the MCD and
+  penalty matrices.
+- `FeatureCache`: Directory-based cache for the features of audio files that can be
+  passed to `compare_audio_files` and `compare_audio_files_batch`.
+- `MemoryFeatureCache`: In-memory counterpart of `FeatureCache` with hit, miss and
+  eviction counters.
 - `compare_amplitude_spectrograms`: Compares two amplitude spectrograms.
 - `compare_mel_spectrograms`: Compares two Mel spectrograms.
 - `compare_mfccs`: Compares two sets of MFCCs.
+- `MCDResult`: Detailed result of the `compare_*` functions with the MCD of every
+  aligned frame, the DTW warping path and the durations of the stages.
+- `add_stage_hook`, `remove_stage_hook` and `instrument`: Register functions that are
+  called with a `StageEvent` with the duration, input shapes and output size of every
+  stage of the comparisons, e.g., a `StageTimingCollector` that aggregates the
+  durations of many comparisons.
 
 The `get_*` functions, while not directly invoked elsewhere in the module, can be used
 independently to experiment with silence removal and parameter configurations. This
@@ -45,21 +65,48 @@ Notes
 """
 
 from mel_cepstral_distance.api import (
+  MCDExtractor,
   compare_amplitude_spectrograms,
   compare_audio_files,
+  compare_audio_files_batch,
+  compare_audio_signals,
   compare_mel_spectrograms,
   compare_mfccs,
   get_amplitude_spectrogram,
+  get_amplitude_spectrogram_from_signal,
   get_mel_spectrogram,
   get_mfccs,
+  pairwise_mcd,
 )
+from mel_cepstral_distance.cache import FeatureCache, MemoryFeatureCache
+from mel_cepstral_distance.instrumentation import (
+  StageEvent,
+  StageTimingCollector,
+  add_stage_hook,
+  instrument,
+  remove_stage_hook,
+)
+from mel_cepstral_distance.result import MCDResult
 
 __all__ = [
   "get_mfccs",
   "get_mel_spectrogram",
   "get_amplitude_spectrogram",
+  "get_amplitude_spectrogram_from_signal",
   "compare_amplitude_spectrograms",
   "compare_mel_spectrograms",
   "compare_audio_files",
+  "compare_audio_files_batch",
+  "compare_audio_signals",
+  "pairwise_mcd",
   "compare_mfccs",
+  "MCDExtractor",
+  "FeatureCache",
+  "MemoryFeatureCache",
+  "MCDResult",
+  "StageEvent",
+  "StageTimingCollector",
+  "add_stage_hook",
+  "remove_stage_hook",
+  "instrument",
 ]
@@ -2,18 +2,21 @@ from typing import Literal, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
-from fastdtw.fastdtw import fastdtw
-from scipy.spatial.distance import euclidean
 
+from mel_cepstral_distance.dtw import (
+  dtw_multires_with_path_costs,
+  dtw_sakoe_chiba_with_path_costs,
+)
 from mel_cepstral_distance.helper import amp_to_mag
 
 
 def align_X_km(
-  X_km_A: npt.NDArray[np.complex128],
-  X_km_B: npt.NDArray[np.complex128],
+  X_km_A: npt.NDArray[np.complexfloating],
+  X_km_B: npt.NDArray[np.complexfloating],
   aligning: Literal["dtw", "pad"],
   custom_radius: Optional[int],
-) -> Tuple[npt.NDArray[np.complex128], npt.NDArray[np.complex128], float]:
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+) -> Tuple[npt.NDArray[np.complexfloating], npt.NDArray[np.complexfloating], float]:
   """Aligns two 2D sequences of complex numbers using either Dynamic Time Warping (DTW)
   or padding with zeros. For DTW, the sequences are temporarily converted to
   magnitude spectrograms.
@@ -24,10 +27,8 @@ def align_X_km(
   former_len_B = X_km_B.shape[0]
   paths: Optional[npt.NDArray] = None
   if aligning == "dtw":
-    _, _, paths = align_2d_sequences_using_dtw(
-      amp_to_mag(X_km_A).T,
-      amp_to_mag(X_km_B).T,
-      custom_radius,
+    _, paths, _ = get_dtw_path_with_costs_X_km(
+      X_km_A, X_km_B, custom_radius, dtw_backend
     )
     X_km_A = X_km_A[paths[:, 0], :]
     X_km_B = X_km_B[paths[:, 1], :]
@@ -42,14 +43,32 @@ def align_X_km(
   return X_km_A, X_km_B, penalty
 
 
+def get_dtw_path_with_costs_X_km(
+  X_km_A: npt.NDArray[np.complexfloating],
+  X_km_B: npt.NDArray[np.complexfloating],
+  custom_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+) -> Tuple[float, npt.NDArray, Optional[npt.NDArray]]:
+  """Calculates the warping path of two spectrograms based on their magnitudes
+  returns the same as get_dtw_path_with_costs
+  """
+  assert X_km_A.shape[1] == X_km_B.shape[1]
+  return get_dtw_path_with_costs(
+    amp_to_mag(X_km_A).T, amp_to_mag(X_km_B).T, custom_radius, dtw_backend
+  )
+
+
 def align_X_kn(
   X_kn_A: npt.NDArray,
   X_kn_B: npt.NDArray,
   aligning: Literal["dtw", "pad"],
   custom_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
 ) -> Tuple[npt.NDArray, npt.NDArray, float]:
   assert aligning in ["dtw", "pad"]
-  X_kn_A, X_kn_B, pen = align_frames_2d(X_kn_A.T, X_kn_B.T, aligning, custom_radius)
+  X_kn_A, X_kn_B, pen = align_frames_2d(
+    X_kn_A.T, X_kn_B.T, aligning, custom_radius, dtw_backend
+  )
   X_kn_A = X_kn_A.T
   X_kn_B = X_kn_B.T
   return X_kn_A, X_kn_B, pen
@@ -73,6 +92,7 @@ def align_MC_s_D(
   D: int,
   aligning: Literal["dtw", "pad"],
   custom_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
 ) -> Tuple[npt.NDArray, npt.NDArray, float]:
   assert MC_X_ik.shape[0] == MC_Y_ik.shape[0]
   M = MC_X_ik.shape[0]
@@ -81,9 +101,7 @@ def align_MC_s_D(
   former_len_A = MC_X_ik.shape[1]
   former_len_B = MC_Y_ik.shape[1]
   if aligning == "dtw":
-    _, _, paths = align_2d_sequences_using_dtw(
-      MC_X_ik[s:D, :], MC_Y_ik[s:D, :], custom_radius
-    )
+    paths = get_dtw_path(MC_X_ik[s:D, :], MC_Y_ik[s:D, :], custom_radius, dtw_backend)
 
     MC_X_ik = MC_X_ik[:, paths[:, 0]]
     MC_Y_ik = MC_Y_ik[:, paths[:, 1]]
@@ -101,13 +119,14 @@ def align_frames_2d(
   seq2: npt.NDArray,
   aligning: Literal["dtw", "pad"],
   custom_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
 ) -> Tuple[npt.NDArray, npt.NDArray, float]:
   assert aligning in ["dtw", "pad"]
   assert seq1.shape[0] == seq2.shape[0]
   former_len_A = seq1.shape[1]
   former_len_B = seq2.shape[1]
   if aligning == "dtw":
-    seq1, seq2, _ = align_2d_sequences_using_dtw(seq1, seq2, custom_radius)
+    seq1, seq2, _ = align_2d_sequences_using_dtw(seq1, seq2, custom_radius, dtw_backend)
   else:
     assert aligning == "pad"
     seq1, seq2 = fill_with_zeros_2d(seq1, seq2)
@@ -118,9 +137,44 @@ def align_frames_2d(
 
 
 def align_2d_sequences_using_dtw(
-  seq_1: npt.NDArray, seq_2: npt.NDArray, custom_radius: Optional[int] = None
+  seq_1: npt.NDArray,
+  seq_2: npt.NDArray,
+  custom_radius: Optional[int] = None,
+  backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
 ) -> Tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+  path_np = get_dtw_path(seq_1, seq_2, custom_radius, backend)
+  stretched_seq_1 = seq_1[:, path_np[:, 0]]
+  stretched_seq_2 = seq_2[:, path_np[:, 1]]
+  return stretched_seq_1, stretched_seq_2, path_np
+
+
+def get_dtw_path(
+  seq_1: npt.NDArray,
+  seq_2: npt.NDArray,
+  custom_radius: Optional[int] = None,
+  backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+) -> npt.NDArray:
+  """Calculates the warping path of two sequences with shape (#features, #frames)
+  without stretching them
+  returns path with shape (#steps, 2)
+  """
+  _, path_np, _ = get_dtw_path_with_costs(seq_1, seq_2, custom_radius, backend)
+  return path_np
+
+
+def get_dtw_path_with_costs(
+  seq_1: npt.NDArray,
+  seq_2: npt.NDArray,
+  custom_radius: Optional[int] = None,
+  backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+) -> Tuple[float, npt.NDArray, Optional[npt.NDArray]]:
+  """Calculates the warping path of two sequences with shape (#features, #frames)
+  returns the accumulated cost, the path with shape (#steps, 2) and the Euclidean
+  distances of the frames along the path with shape (#steps,), the latter are None for
+  fastdtw because it does not expose them
+  """
   assert custom_radius is None or custom_radius >= 1
+  assert backend in ["fastdtw", "multires", "sakoe-chiba"]
   assert seq_1.shape[0] == seq_2.shape[0], (
     "both sequences must have the same number of features (rows)"
   )
@@ -131,11 +185,25 @@ def align_2d_sequences_using_dtw(
     max_len = max(seq_1.shape[1], seq_2.shape[1])
   else:
     max_len = custom_radius
-  _, path = fastdtw(seq_1.T, seq_2.T, dist=euclidean, radius=max_len)
-  path_np = np.array(path)
-  stretched_seq_1 = seq_1[:, path_np[:, 0]]
-  stretched_seq_2 = seq_2[:, path_np[:, 1]]
-  return stretched_seq_1, stretched_seq_2, path_np
+  path_costs: Optional[npt.NDArray] = None
+  if backend == "fastdtw":
+    # fastdtw and scipy.spatial are imported on first use because importing them
+    # takes long
+    from fastdtw.fastdtw import fastdtw
+    from scipy.spatial.distance import euclidean
+
+    distance, path = fastdtw(seq_1.T, seq_2.T, dist=euclidean, radius=max_len)
+    path_np = np.array(path)
+  elif backend == "multires":
+    distance, path_np, path_costs = dtw_multires_with_path_costs(
+      seq_1.T, seq_2.T, max_len
+    )
+  else:
+    assert backend == "sakoe-chiba"
+    distance, path_np, path_costs = dtw_sakoe_chiba_with_path_costs(
+      seq_1.T, seq_2.T, custom_radius
+    )
+  return float(distance), path_np, path_costs
 
 
 def get_penalty(
@@ -1,32 +1,79 @@
+import math
+import os
+import time
+from collections import deque
+from dataclasses import replace
 from logging import getLogger
 from pathlib import Path
-from typing import Literal, Optional, Tuple, Union
+from typing import (
+  Any,
+  Callable,
+  Deque,
+  Dict,
+  Iterable,
+  Iterator,
+  List,
+  Literal,
+  Optional,
+  Tuple,
+  Union,
+)
 
 import numpy as np
 import numpy.typing as npt
-from scipy.io import wavfile
 
-from mel_cepstral_distance.alignment import align_MC_s_D, align_X_km, align_X_kn
+from mel_cepstral_distance.alignment import (
+  align_MC_s_D,
+  align_X_km,
+  align_X_kn,
+  get_dtw_path_with_costs,
+  get_dtw_path_with_costs_X_km,
+  get_penalty,
+)
+from mel_cepstral_distance.cache import FeatureCache, MemoryFeatureCache
 from mel_cepstral_distance.computation import (
   get_average_MCD,
+  get_cos_terms,
   get_MC_X_ik,
   get_MCD_k,
+  get_MCD_k_along_path,
   get_w_n_m,
+  get_w_n_m_bands,
+  get_window,
   get_X_km,
   get_X_kn,
 )
 from mel_cepstral_distance.helper import (
+  get_complex_dtype,
   get_n_fft_bins,
   ms_to_samples,
   norm_audio_signal,
+  read_wav,
   resample_if_necessary,
 )
+from mel_cepstral_distance.instrumentation import run_stage
+from mel_cepstral_distance.result import MCDResult, add_duration, get_nan_result
 from mel_cepstral_distance.silence import (
   remove_silence_MC_X_ik,
   remove_silence_rms,
   remove_silence_X_km,
   remove_silence_X_kn,
 )
+from mel_cepstral_distance.streaming import (
+  get_max_abs,
+  get_MCD_k_sum_of_padded_streams,
+  iter_signal_blocks,
+  iter_X_km,
+)
+
+# result of comparing a pair in a batch
+MCD_RESULT_DTYPE = np.dtype([("mcd", np.float64), ("penalty", np.float64)])
+
+# number of samples for which the maximum amplitude is determined at once
+NORM_BLOCK_SIZE = 2**18
+
+# part of the keys of cached features, needs to be increased if the features change
+FEATURE_CACHE_VERSION = 2
 
 
 def get_amplitude_spectrogram(
@@ -40,7 +87,10 @@ def get_amplitude_spectrogram(
   norm_audio: bool = True,
   remove_silence: bool = False,
   silence_threshold: Optional[float] = None,
-) -> npt.NDArray[np.complex128]:
+  mmap: bool = False,
+  resample_method: Literal["fft", "polyphase"] = "fft",
+  dtype: Literal["float64", "float32"] = "float64",
+) -> npt.NDArray[np.complexfloating]:
   """
   Computes the complex-valued amplitude spectrogram (STFT) of an audio signal.
   Optionally applies normalization and silence removal. While not invoked
@@ -75,6 +125,20 @@ def get_amplitude_spectrogram(
   silence_threshold : float, optional
     RMS threshold used to detect silence when `remove_silence` is True.
     Must be >= 0 if specified.
+  mmap : bool, default=False
+    If True, the WAV file is memory-mapped instead of read into memory, so that
+    its samples are only loaded while the frames are computed. If the audio is
+    resampled or silence is removed, the signal is still copied. Not supported
+    for 24-bit WAV files.
+  resample_method : {"fft", "polyphase"}, default="fft"
+    Method used to resample the audio if its sample rate differs from
+    `sample_rate`. "fft" resamples the whole signal in the frequency domain, its
+    runtime depends on the prime factors of the number of samples. "polyphase"
+    applies a polyphase filter with the up- and down-sampling factors derived from
+    the ratio of both sample rates, which is considerably faster for long signals.
+  dtype : {"float64", "float32"}, default="float64"
+    Floating point precision of the STFT. "float32" returns a complex64
+    spectrogram, which halves its memory and speeds up the FFT.
 
   Returns
   -------
@@ -91,6 +155,10 @@ def get_amplitude_spectrogram(
     If `n_fft`, `win_len`, or `hop_len` is not > 0.
   ValueError
     If `window` is not "hamming" or "hanning".
+  ValueError
+    If `resample_method` is not "fft" or "polyphase".
+  ValueError
+    If `dtype` is not "float64" or "float32".
   ValueError
     If silence removal is enabled but `silence_threshold` is not set or is < 0.
   FileNotFoundError
@@ -107,6 +175,121 @@ def get_amplitude_spectrogram(
   - If `n_fft` and `win_len` differ, the window will be truncated or padded
     accordingly, which may affect the resulting spectrogram.
   """
+  _check_amplitude_spectrogram_params(
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
+
+  sr, signal = read_wav(audio, mmap=mmap)
+
+  return _get_amplitude_spectrogram(
+    signal,
+    sr,
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    norm_audio=norm_audio,
+    remove_silence=remove_silence,
+    silence_threshold=silence_threshold,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
+
+
+def get_amplitude_spectrogram_from_signal(
+  signal: npt.NDArray,
+  signal_sample_rate: int,
+  /,
+  *,
+  sample_rate: Optional[int] = None,
+  n_fft: float = 32,
+  win_len: float = 32,
+  hop_len: float = 8,
+  window: Literal["hamming", "hanning"] = "hanning",
+  norm_audio: bool = True,
+  remove_silence: bool = False,
+  silence_threshold: Optional[float] = None,
+  resample_method: Literal["fft", "polyphase"] = "fft",
+  dtype: Literal["float64", "float32"] = "float64",
+) -> npt.NDArray[np.complexfloating]:
+  """
+  Computes the complex-valued amplitude spectrogram (STFT) of an audio signal that is
+  already in memory, e.g., generated by a TTS model. The result is identical to
+  calling `get_amplitude_spectrogram` on a WAV file containing the signal.
+
+  Parameters
+  ----------
+  signal : numpy.ndarray
+    A 1D array with the samples of a mono audio signal. Integer samples are
+    interpreted like the samples of a PCM WAV file and floating point samples
+    like those of a float WAV file.
+  signal_sample_rate : int
+    Sample rate of `signal` in Hz. Must be > 0.
+  sample_rate : int, optional
+    Target sample rate for resampling the signal. If not specified,
+    `signal_sample_rate` is used. Must be > 0.
+  **params
+    All other parameters are the same as for `get_amplitude_spectrogram`.
+
+  Returns
+  -------
+  numpy.ndarray
+    A 2D complex-valued amplitude spectrogram of shape (frames, frequency bins).
+    Returns an empty array if the signal is empty or consists only of silence.
+
+  Raises
+  ------
+  ValueError
+    If `signal` does not have 1 dimension.
+  ValueError
+    If `signal_sample_rate` is not > 0.
+  ValueError
+    If any of the other parameters is invalid (see `get_amplitude_spectrogram`).
+  """
+  _check_signal(signal, signal_sample_rate, "signal")
+  _check_amplitude_spectrogram_params(
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
+
+  return _get_amplitude_spectrogram(
+    signal,
+    signal_sample_rate,
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    norm_audio=norm_audio,
+    remove_silence=remove_silence,
+    silence_threshold=silence_threshold,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
+
+
+def _check_amplitude_spectrogram_params(
+  *,
+  sample_rate: Optional[int],
+  n_fft: float,
+  win_len: float,
+  hop_len: float,
+  window: Literal["hamming", "hanning"],
+  resample_method: Literal["fft", "polyphase"],
+  dtype: Literal["float64", "float32"],
+) -> None:
   if sample_rate is not None and not sample_rate > 0:
     raise ValueError("sample_rate must be > 0")
 
@@ -122,8 +305,37 @@ def get_amplitude_spectrogram(
   if window not in ["hamming", "hanning"]:
     raise ValueError("window must be 'hamming' or 'hanning")
 
-  sr, signal = wavfile.read(audio)
+  if resample_method not in ["fft", "polyphase"]:
+    raise ValueError("resample_method must be 'fft' or 'polyphase'")
+
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
+
+
+def _check_signal(signal: npt.NDArray, sample_rate: int, name: str) -> None:
+  if signal.ndim != 1:
+    raise ValueError(f"{name} must have 1 dimension but got {signal.ndim}")
 
+  if not sample_rate > 0:
+    raise ValueError(f"sample rate of {name} must be > 0")
+
+
+def _get_amplitude_spectrogram(
+  signal: npt.NDArray,
+  sr: int,
+  *,
+  sample_rate: Optional[int],
+  n_fft: float,
+  win_len: float,
+  hop_len: float,
+  window: Literal["hamming", "hanning"],
+  norm_audio: bool,
+  remove_silence: bool,
+  silence_threshold: Optional[float],
+  resample_method: Literal["fft", "polyphase"],
+  dtype: Literal["float64", "float32"],
+) -> npt.NDArray[np.complexfloating]:
+  # expects validated parameters except for silence_threshold
   if sample_rate is None:
     sample_rate = sr
 
@@ -132,10 +344,12 @@ def get_amplitude_spectrogram(
   if len(signal) == 0:
     logger = getLogger(__name__)
     logger.warning("audio is empty")
-    empty_spec = np.empty((0, get_n_fft_bins(n_fft_samples)), dtype=np.complex128)
+    empty_spec = np.empty(
+      (0, get_n_fft_bins(n_fft_samples)), dtype=get_complex_dtype(dtype)
+    )
     return empty_spec
 
-  signal = resample_if_necessary(signal, sr, sample_rate)
+  signal = resample_if_necessary(signal, sr, sample_rate, resample_method)
 
   n_fft_is_two_power = n_fft_samples & (n_fft_samples - 1) == 0
 
@@ -155,10 +369,8 @@ def get_amplitude_spectrogram(
       assert n_fft > win_len
       logger.warning(f"padding windows to n_fft ({n_fft}ms)")
 
-  if norm_audio:
-    signal = norm_audio_signal(signal)
-
   win_len_samples = ms_to_samples(win_len, sample_rate)
+  norm_divisor = None
 
   if remove_silence:
     if silence_threshold is None:
@@ -167,6 +379,9 @@ def get_amplitude_spectrogram(
     if not silence_threshold >= 0:
       raise ValueError("silence_threshold must be greater than or equal to 0 RMS")
 
+    if norm_audio:
+      signal = norm_audio_signal(signal)
+
     signal = remove_silence_rms(
       signal, silence_threshold, min_silence_samples=win_len_samples
     )
@@ -174,17 +389,30 @@ def get_amplitude_spectrogram(
     if len(signal) == 0:
       logger = getLogger(__name__)
       logger.warning("after removing silence, audio is empty")
-      empty_spec = np.empty((0, get_n_fft_bins(n_fft_samples)), dtype=np.complex128)
+      empty_spec = np.empty(
+        (0, get_n_fft_bins(n_fft_samples)), dtype=get_complex_dtype(dtype)
+      )
       return empty_spec
+  elif norm_audio:
+    # the frames are normalized instead of the whole signal
+    norm_divisor = get_max_abs(signal, NORM_BLOCK_SIZE)
 
   # STFT - Shape: (#Frames, Bins)
   hop_len_samples = ms_to_samples(hop_len, sample_rate)
-  X_km_A = get_X_km(signal, n_fft_samples, win_len_samples, hop_len_samples, window)
+  X_km_A = get_X_km(
+    signal,
+    n_fft_samples,
+    win_len_samples,
+    hop_len_samples,
+    window,
+    norm_divisor=norm_divisor,
+    dtype=dtype,
+  )
   return X_km_A
 
 
 def get_mel_spectrogram(
-  amp_spec: npt.NDArray[np.complex128],
+  amp_spec: npt.NDArray[np.complexfloating],
   sample_rate: int,
   n_fft: float,
   /,
@@ -194,6 +422,7 @@ def get_mel_spectrogram(
   fmax: Optional[int] = None,
   remove_silence: bool = False,
   silence_threshold: Optional[float] = None,
+  dtype: Literal["float64", "float32"] = "float64",
 ) -> npt.NDArray:
   """
   Converts an amplitude spectrogram to a Mel spectrogram using mel filterbanks.
@@ -219,6 +448,9 @@ def get_mel_spectrogram(
     based on `silence_threshold`.
   silence_threshold : float, optional
     Threshold used to detect silence when `remove_silence` is True.
+  dtype : {"float64", "float32"}, default="float64"
+    Floating point precision of the computation. `amp_spec` is converted to the
+    complex type of the same precision.
 
   Returns
   -------
@@ -246,6 +478,8 @@ def get_mel_spectrogram(
     If the number of frequency bins in `amp_spec` does not match `n_fft` in samples.
   ValueError
     If silence removal is enabled but `silence_threshold` is not set.
+  ValueError
+    If `dtype` is not "float64" or "float32".
   """
   # amp_spec is X_km
 
@@ -257,10 +491,13 @@ def get_mel_spectrogram(
   if not M > 0:
     raise ValueError("M must be > 0")
 
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
+
   if amp_spec.shape[0] == 0:
     logger = getLogger(__name__)
     logger.warning("spectrogram is empty")
-    empty_mel_spec = np.empty((0, M), dtype=np.float64)
+    empty_mel_spec = np.empty((0, M), dtype=dtype)
     return empty_mel_spec
 
   if amp_spec.shape[1] == 0:
@@ -290,6 +527,8 @@ def get_mel_spectrogram(
       f"in the spectrogram but got {n_fft_samples // 2 + 1} != {amp_spec.shape[1]}"
     )
 
+  amp_spec = amp_spec.astype(get_complex_dtype(dtype), copy=False)
+
   if remove_silence:
     if silence_threshold is None:
       raise ValueError("silence_threshold must be set")
@@ -299,7 +538,7 @@ def get_mel_spectrogram(
     if amp_spec.shape[0] == 0:
       logger = getLogger(__name__)
       logger.warning("after removing silence, spectrogram is empty")
-      empty_mel_spec = np.empty((0, M), dtype=np.float64)
+      empty_mel_spec = np.empty((0, M), dtype=dtype)
       return empty_mel_spec
 
   w_n_m = get_w_n_m(sample_rate, n_fft_samples, M, fmin, fmax)
@@ -313,6 +552,7 @@ def get_mfccs(
   *,
   remove_silence: bool = False,
   silence_threshold: Optional[float] = None,
+  dtype: Literal["float64", "float32"] = "float64",
 ) -> npt.NDArray:
   """
   Computes the Mel-Frequency Cepstral Coefficients (MFCCs) from a given
@@ -328,6 +568,8 @@ def get_mfccs(
     `silence_threshold` parameter.
   silence_threshold : float, optional
     Threshold used to detect silence when `remove_silence` is True.
+  dtype : {"float64", "float32"}, default="float64"
+    Floating point precision of the computation. `mel_spec` is converted to it.
 
   Returns
   -------
@@ -344,6 +586,8 @@ def get_mfccs(
     If `mel_spec` has no mel bands or frames.
   ValueError
     If silence removal is enabled but `silence_threshold` is not set.
+  ValueError
+    If `dtype` is not "float64" or "float32".
 
   Notes
   -----
@@ -361,12 +605,17 @@ def get_mfccs(
   if mel_spec.shape[1] == 0:
     raise ValueError("Mel spectrogram must have at least 1 mel-band")
 
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
+
   if mel_spec.shape[0] == 0:
     logger = getLogger(__name__)
     logger.warning("Mel spectrogram is empty")
-    empty_mfccs = np.empty((mel_spec.shape[1], 0), dtype=np.float64)
+    empty_mfccs = np.empty((mel_spec.shape[1], 0), dtype=dtype)
     return empty_mfccs
 
+  mel_spec = mel_spec.astype(dtype, copy=False)
+
   if remove_silence:
     if silence_threshold is None:
       raise ValueError("silence_threshold must be set")
@@ -376,13 +625,1127 @@ def get_mfccs(
     if mel_spec.shape[0] == 0:
       logger = getLogger(__name__)
       logger.warning("after removing silence, Mel spectrogram is empty")
-      empty_mfccs = np.empty((mel_spec.shape[1], 0), dtype=np.float64)
+      empty_mfccs = np.empty((mel_spec.shape[1], 0), dtype=dtype)
       return empty_mfccs
 
   MC_X_ik = get_MC_X_ik(mel_spec, mel_spec.shape[1])
   return MC_X_ik
 
 
+class MCDExtractor:
+  """
+  Extracts features and computes the Mel-Cepstral Distance (MCD) with a fixed
+  configuration. The window function, the mel filterbank and the cosine terms of the
+  MFCC computation depend only on the configuration and are therefore built once on
+  construction and reused for every call. This avoids rebuilding them when many
+  files are processed with the same parameters.
+
+  Parameters
+  ----------
+  sample_rate : int
+    Sample rate in Hz to which all audio files are resampled. Must be > 0.
+  n_fft : float, default=32
+    Length of the FFT window in milliseconds. Must be > 0.
+  win_len : float, default=32
+    Window length in milliseconds. Must be > 0.
+  hop_len : float, default=8
+    Hop length in milliseconds between consecutive windows. Must be > 0.
+  window : {"hamming", "hanning"}, default="hanning"
+    Window function applied during the STFT.
+  fmin : int, default=0
+    Minimum frequency in Hz for the Mel filterbank. Must satisfy 0 <= fmin < fmax.
+  fmax : int, optional
+    Maximum frequency in Hz for the Mel filterbank. If not set, defaults to
+    sample_rate // 2. Must satisfy 0 < fmax <= sample_rate // 2.
+  M : int, default=20
+    Number of Mel bands. Must be > 0.
+  dtype : {"float64", "float32"}, default="float64"
+    Floating point precision of the precomputed arrays and of all features. The
+    inputs of `mel` and `mfcc` are converted to it. "float32" halves the memory of
+    the features and speeds up the STFT and the matrix products, the results
+    deviate slightly from "float64".
+
+  Raises
+  ------
+  ValueError
+    If any of the parameters is invalid.
+
+  Notes
+  -----
+  - The precomputed arrays are read-only and shared between all calls.
+  - `spectrogram`, `mel` and `mfcc` return the same results as
+    `get_amplitude_spectrogram`, `get_mel_spectrogram` and `get_mfccs` and `compare`
+    returns the same result as `compare_audio_files` with the same parameters.
+  """
+
+  def __init__(
+    self,
+    sample_rate: int,
+    *,
+    n_fft: float = 32,
+    win_len: float = 32,
+    hop_len: float = 8,
+    window: Literal["hamming", "hanning"] = "hanning",
+    fmin: int = 0,
+    fmax: Optional[int] = None,
+    M: int = 20,
+    dtype: Literal["float64", "float32"] = "float64",
+  ) -> None:
+    if not sample_rate > 0:
+      raise ValueError("sample_rate must be > 0")
+
+    if not n_fft > 0:
+      raise ValueError("n_fft must be > 0")
+
+    if not win_len > 0:
+      raise ValueError("win_len must be > 0")
+
+    if not hop_len > 0:
+      raise ValueError("hop_len must be > 0")
+
+    if window not in ["hamming", "hanning"]:
+      raise ValueError("window must be 'hamming' or 'hanning'")
+
+    if fmax is not None:
+      if not 0 < fmax <= sample_rate // 2:
+        raise ValueError(
+          f"fmax must be in (0, sample_rate // 2], i.e., (0, {sample_rate // 2}]"
+        )
+    else:
+      fmax = sample_rate // 2
+
+    if not 0 <= fmin < fmax:
+      raise ValueError(f"fmin must be in [0, fmax), i.e., [0, {fmax})")
+
+    if not M > 0:
+      raise ValueError("M must be > 0")
+
+    if dtype not in ["float64", "float32"]:
+      raise ValueError("dtype must be 'float64' or 'float32'")
+
+    self.sample_rate = sample_rate
+    self.n_fft = n_fft
+    self.win_len = win_len
+    self.hop_len = hop_len
+    self.window = window
+    self.fmin = fmin
+    self.fmax = fmax
+    self.M = M
+    self.dtype = dtype
+
+    self.n_fft_samples = ms_to_samples(n_fft, sample_rate)
+    self.win_len_samples = ms_to_samples(win_len, sample_rate)
+    self.hop_len_samples = ms_to_samples(hop_len, sample_rate)
+
+    n_fft_is_two_power = self.n_fft_samples & (self.n_fft_samples - 1) == 0
+
+    if not n_fft_is_two_power:
+      logger = getLogger(__name__)
+      logger.warning(
+        f"n_fft ({n_fft}ms / {self.n_fft_samples} samples) should "
+        f"be a power of 2 in samples for faster computation"
+      )
+
+    if n_fft != win_len:
+      logger = getLogger(__name__)
+      logger.warning(f"n_fft ({n_fft}ms) should be equal to win_len ({win_len}ms)")
+      if n_fft < win_len:
+        logger.warning(f"truncating windows to n_fft ({n_fft}ms)")
+      else:
+        assert n_fft > win_len
+        logger.warning(f"padding windows to n_fft ({n_fft}ms)")
+
+    # the frames are truncated or padded to n_fft before the window is applied
+    self.win = get_window(window, self.n_fft_samples).astype(dtype)
+    # Mel-Bank - Shape: (N, #Frames)
+    self.w_n_m = get_w_n_m(sample_rate, self.n_fft_samples, M, fmin, fmax).astype(dtype)
+    self.cos_terms = get_cos_terms(M).astype(dtype)
+
+    # groups of neighbouring mel filters with the bands of FFT bins they cover
+    self.w_n_m_bands = get_w_n_m_bands(self.w_n_m)
+
+    for matrix in (self.win, self.w_n_m, self.cos_terms):
+      matrix.flags.writeable = False
+    for _, _, weights in self.w_n_m_bands:
+      weights.flags.writeable = False
+
+    self._extractor_per_native_sample_rate: Dict[int, MCDExtractor] = {}
+
+  def spectrogram(
+    self,
+    audio: Union[Path, str],
+    /,
+    *,
+    norm_audio: bool = True,
+    remove_silence: bool = False,
+    silence_threshold: Optional[float] = None,
+    mmap: bool = False,
+    resample_method: Literal["fft", "polyphase"] = "fft",
+  ) -> npt.NDArray[np.complexfloating]:
+    """
+    Computes the complex-valued amplitude spectrogram (STFT) of an audio file (see
+    `get_amplitude_spectrogram`).
+
+    Parameters
+    ----------
+    audio : Path | str
+      Path to a mono WAV file. It is resampled to the sample rate of the extractor.
+    norm_audio : bool, default=True
+      If True, normalizes the audio signal to the range [-1, 1] before processing.
+    remove_silence : bool, default=False
+      If True, removes silence from the audio signal based on `silence_threshold`.
+    silence_threshold : float, optional
+      RMS threshold used to detect silence when `remove_silence` is True.
+      Must be >= 0 if specified.
+    mmap : bool, default=False
+      If True, the WAV file is memory-mapped (see `get_amplitude_spectrogram`).
+    resample_method : {"fft", "polyphase"}, default="fft"
+      Method used to resample the audio (see `get_amplitude_spectrogram`).
+
+    Returns
+    -------
+    numpy.ndarray
+      A 2D complex-valued amplitude spectrogram of shape (frames, frequency bins).
+      Returns an empty array if the input audio is empty or consists only of silence.
+
+    Raises
+    ------
+    ValueError
+      If `resample_method` is not "fft" or "polyphase".
+    ValueError
+      If silence removal is enabled but `silence_threshold` is not set or is < 0.
+    """
+    if resample_method not in ["fft", "polyphase"]:
+      raise ValueError("resample_method must be 'fft' or 'polyphase'")
+
+    if remove_silence:
+      if silence_threshold is None:
+        raise ValueError("silence_threshold must be set")
+
+      if not silence_threshold >= 0:
+        raise ValueError("silence_threshold must be greater than or equal to 0 RMS")
+
+    sr, signal = read_wav(audio, mmap=mmap)
+
+    return self._get_spectrogram(
+      signal,
+      sr,
+      norm_audio=norm_audio,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      resample_method=resample_method,
+    )
+
+  def spectrogram_from_signal(
+    self,
+    signal: npt.NDArray,
+    sample_rate: int,
+    /,
+    *,
+    norm_audio: bool = True,
+    remove_silence: bool = False,
+    silence_threshold: Optional[float] = None,
+    resample_method: Literal["fft", "polyphase"] = "fft",
+  ) -> npt.NDArray[np.complexfloating]:
+    """
+    Computes the complex-valued amplitude spectrogram (STFT) of an audio signal that
+    is already in memory (see `get_amplitude_spectrogram_from_signal`).
+
+    Parameters
+    ----------
+    signal : numpy.ndarray
+      A 1D array with the samples of a mono audio signal. It is resampled to the
+      sample rate of the extractor.
+    sample_rate : int
+      Sample rate of `signal` in Hz. Must be > 0.
+    **params
+      All other parameters are the same as for `spectrogram`.
+
+    Returns
+    -------
+    numpy.ndarray
+      A 2D complex-valued amplitude spectrogram of shape (frames, frequency bins).
+      Returns an empty array if the signal is empty or consists only of silence.
+
+    Raises
+    ------
+    ValueError
+      If `signal` does not have 1 dimension.
+    ValueError
+      If `sample_rate` is not > 0.
+    ValueError
+      If `resample_method` is not "fft" or "polyphase".
+    ValueError
+      If silence removal is enabled but `silence_threshold` is not set or is < 0.
+    """
+    _check_signal(signal, sample_rate, "signal")
+
+    if resample_method not in ["fft", "polyphase"]:
+      raise ValueError("resample_method must be 'fft' or 'polyphase'")
+
+    if remove_silence:
+      if silence_threshold is None:
+        raise ValueError("silence_threshold must be set")
+
+      if not silence_threshold >= 0:
+        raise ValueError("silence_threshold must be greater than or equal to 0 RMS")
+
+    return self._get_spectrogram(
+      signal,
+      sample_rate,
+      norm_audio=norm_audio,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      resample_method=resample_method,
+    )
+
+  def _get_spectrogram(
+    self,
+    signal: npt.NDArray,
+    sr: int,
+    *,
+    norm_audio: bool,
+    remove_silence: bool,
+    silence_threshold: Optional[float],
+    resample_method: Literal["fft", "polyphase"],
+  ) -> npt.NDArray[np.complexfloating]:
+    # expects validated parameters
+    if len(signal) == 0:
+      logger = getLogger(__name__)
+      logger.warning("audio is empty")
+      return self._get_empty_spectrogram()
+
+    signal = resample_if_necessary(signal, sr, self.sample_rate, resample_method)
+
+    if remove_silence:
+      assert silence_threshold is not None
+      if norm_audio:
+        signal = norm_audio_signal(signal)
+
+      signal = remove_silence_rms(
+        signal, silence_threshold, min_silence_samples=self.win_len_samples
+      )
+
+      if len(signal) == 0:
+        logger = getLogger(__name__)
+        logger.warning("after removing silence, audio is empty")
+        return self._get_empty_spectrogram()
+
+      return self._get_X_km(signal)
+
+    return self._get_X_km(signal, norm_audio=norm_audio)
+
+  def mel(
+    self,
+    amp_spec: npt.NDArray[np.complexfloating],
+    /,
+    *,
+    remove_silence: bool = False,
+    silence_threshold: Optional[float] = None,
+  ) -> npt.NDArray:
+    """
+    Converts an amplitude spectrogram to a Mel spectrogram using the filterbank of
+    the extractor (see `get_mel_spectrogram`).
+
+    Parameters
+    ----------
+    amp_spec : numpy.ndarray
+      A 2D complex-valued amplitude spectrogram of shape (frames, frequency bins).
+      The number of frequency bins must match `n_fft` of the extractor.
+    remove_silence : bool, default=False
+      If True, removes silence from the amplitude spectrogram based on
+      `silence_threshold`.
+    silence_threshold : float, optional
+      Threshold used to detect silence when `remove_silence` is True.
+
+    Returns
+    -------
+    numpy.ndarray
+      A 2D Mel spectrogram of shape (frames, M). Returns an empty array if the input
+      spectrogram is empty or becomes empty after silence removal.
+
+    Raises
+    ------
+    ValueError
+      If `amp_spec` does not have 2 dimensions.
+    ValueError
+      If the number of frequency bins in `amp_spec` does not match `n_fft`.
+    ValueError
+      If silence removal is enabled but `silence_threshold` is not set.
+    """
+    if len(amp_spec.shape) != 2:
+      raise ValueError(
+        f"amplitude spectrogram must have 2 dimensions but got {len(amp_spec.shape)}"
+      )
+
+    if amp_spec.shape[0] == 0:
+      logger = getLogger(__name__)
+      logger.warning("spectrogram is empty")
+      empty_mel_spec = np.empty((0, self.M), dtype=self.dtype)
+      return empty_mel_spec
+
+    n_fft_bins = get_n_fft_bins(self.n_fft_samples)
+    if amp_spec.shape[1] != n_fft_bins:
+      raise ValueError(
+        f"n_fft (in samples) // 2 + 1 must match the number of frequency bins "
+        f"in the spectrogram but got {n_fft_bins} != {amp_spec.shape[1]}"
+      )
+
+    amp_spec = amp_spec.astype(get_complex_dtype(self.dtype), copy=False)
+
+    if remove_silence:
+      if silence_threshold is None:
+        raise ValueError("silence_threshold must be set")
+
+      amp_spec = remove_silence_X_km(amp_spec, silence_threshold)
+
+      if amp_spec.shape[0] == 0:
+        logger = getLogger(__name__)
+        logger.warning("after removing silence, spectrogram is empty")
+        empty_mel_spec = np.empty((0, self.M), dtype=self.dtype)
+        return empty_mel_spec
+
+    X_kn = get_X_kn(amp_spec, self.w_n_m, self.w_n_m_bands)
+    return X_kn
+
+  def mfcc(
+    self,
+    mel_spec: npt.NDArray,
+    /,
+    *,
+    remove_silence: bool = False,
+    silence_threshold: Optional[float] = None,
+  ) -> npt.NDArray:
+    """
+    Computes the MFCCs of a Mel spectrogram using the cosine terms of the extractor
+    (see `get_mfccs`).
+
+    Parameters
+    ----------
+    mel_spec : numpy.ndarray
+      A 2D Mel spectrogram of shape (frames, M).
+    remove_silence : bool, default=False
+      If True, removes silence from the Mel spectrogram based on `silence_threshold`.
+    silence_threshold : float, optional
+      Threshold used to detect silence when `remove_silence` is True.
+
+    Returns
+    -------
+    numpy.ndarray
+      A 2D array of MFCCs with shape (M, frames). Returns an empty array if the input
+      Mel spectrogram is empty or becomes empty after silence removal.
+
+    Raises
+    ------
+    ValueError
+      If `mel_spec` does not have 2 dimensions.
+    ValueError
+      If the number of mel bands in `mel_spec` does not match `M`.
+    ValueError
+      If silence removal is enabled but `silence_threshold` is not set.
+    """
+    if len(mel_spec.shape) != 2:
+      raise ValueError(
+        f"Mel spectrogram must have 2 dimensions but got {len(mel_spec.shape)}"
+      )
+
+    if mel_spec.shape[1] != self.M:
+      raise ValueError(
+        f"Mel spectrogram must have M ({self.M}) mel-bands but got {mel_spec.shape[1]}"
+      )
+
+    if mel_spec.shape[0] == 0:
+      logger = getLogger(__name__)
+      logger.warning("Mel spectrogram is empty")
+      empty_mfccs = np.empty((self.M, 0), dtype=self.dtype)
+      return empty_mfccs
+
+    mel_spec = mel_spec.astype(self.dtype, copy=False)
+
+    if remove_silence:
+      if silence_threshold is None:
+        raise ValueError("silence_threshold must be set")
+
+      mel_spec = remove_silence_X_kn(mel_spec, silence_threshold)
+
+      if mel_spec.shape[0] == 0:
+        logger = getLogger(__name__)
+        logger.warning("after removing silence, Mel spectrogram is empty")
+        empty_mfccs = np.empty((self.M, 0), dtype=self.dtype)
+        return empty_mfccs
+
+    MC_X_ik = get_MC_X_ik(mel_spec, self.M, self.cos_terms)
+    return MC_X_ik
+
+  def compare(
+    self,
+    audio_A: Union[Path, str],
+    audio_B: Union[Path, str],
+    /,
+    *,
+    s: int = 1,
+    D: int = 16,
+    aligning: Literal["pad", "dtw"] = "dtw",
+    align_target: Literal["spec", "mel", "mfcc"] = "mfcc",
+    remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+    silence_threshold_A: Optional[float] = None,
+    silence_threshold_B: Optional[float] = None,
+    norm_audio: bool = True,
+    dtw_radius: Optional[int] = 10,
+    dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+    mmap: bool = False,
+    resample_method: Literal["fft", "polyphase", "none"] = "fft",
+    return_details: bool = False,
+  ) -> Union[Tuple[float, float], MCDResult]:
+    """
+    Compares two audio files by computing the mean Mel-Cepstral Distance (MCD)
+    between them (see `compare_audio_files`). Both files are resampled to the sample
+    rate of the extractor.
+
+    Parameters
+    ----------
+    audio_A : Path | str
+      Path to the first mono WAV file.
+    audio_B : Path | str
+      Path to the second mono WAV file.
+    **params
+      All other parameters are the same as for `compare_audio_files`.
+
+    Returns
+    -------
+    Tuple[float, float]
+      The mean MCD and the alignment penalty. Both are nan if either audio is empty
+      or becomes empty due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of
+      the comparison.
+
+    Raises
+    ------
+    ValueError
+      If any of the parameters is invalid (see `compare_audio_files`).
+    """
+    _check_audio_comparison_params(
+      sample_rate=self.sample_rate,
+      n_fft=self.n_fft,
+      win_len=self.win_len,
+      hop_len=self.hop_len,
+      window=self.window,
+      fmin=self.fmin,
+      fmax=self.fmax,
+      M=self.M,
+      s=s,
+      D=D,
+      aligning=aligning,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold_A=silence_threshold_A,
+      silence_threshold_B=silence_threshold_B,
+      dtw_radius=dtw_radius,
+      dtw_backend=dtw_backend,
+      resample_method=resample_method,
+      dtype=self.dtype,
+    )
+
+    sr1, signalA = run_stage("read", read_wav, audio_A, mmap=mmap)
+    sr2, signalB = run_stage("read", read_wav, audio_B, mmap=mmap)
+
+    result = _compare_signals(
+      signalA,
+      sr1,
+      signalB,
+      sr2,
+      self,
+      norm_audio=norm_audio,
+      s=s,
+      D=D,
+      aligning=aligning,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold_A=silence_threshold_A,
+      silence_threshold_B=silence_threshold_B,
+      dtw_radius=dtw_radius,
+      dtw_backend=dtw_backend,
+      resample_method=resample_method,
+    )
+
+    return _get_return_value(result, return_details)
+
+  def compare_signals(
+    self,
+    signal_A: npt.NDArray,
+    sample_rate_A: int,
+    signal_B: npt.NDArray,
+    sample_rate_B: int,
+    /,
+    *,
+    s: int = 1,
+    D: int = 16,
+    aligning: Literal["pad", "dtw"] = "dtw",
+    align_target: Literal["spec", "mel", "mfcc"] = "mfcc",
+    remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+    silence_threshold_A: Optional[float] = None,
+    silence_threshold_B: Optional[float] = None,
+    norm_audio: bool = True,
+    dtw_radius: Optional[int] = 10,
+    dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+    resample_method: Literal["fft", "polyphase", "none"] = "fft",
+    return_details: bool = False,
+  ) -> Union[Tuple[float, float], MCDResult]:
+    """
+    Compares two audio signals that are already in memory by computing the mean
+    Mel-Cepstral Distance (MCD) between them (see `compare_audio_signals`). Both
+    signals are resampled to the sample rate of the extractor.
+
+    Parameters
+    ----------
+    signal_A : numpy.ndarray
+      A 1D array with the samples of the first mono audio signal.
+    sample_rate_A : int
+      Sample rate of `signal_A` in Hz. Must be > 0.
+    signal_B : numpy.ndarray
+      A 1D array with the samples of the second mono audio signal.
+    sample_rate_B : int
+      Sample rate of `signal_B` in Hz. Must be > 0.
+    **params
+      All other parameters are the same as for `compare`.
+
+    Returns
+    -------
+    Tuple[float, float]
+      The mean MCD and the alignment penalty. Both are nan if either signal is empty
+      or becomes empty due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of
+      the comparison.
+
+    Raises
+    ------
+    ValueError
+      If `signal_A` or `signal_B` does not have 1 dimension.
+    ValueError
+      If `sample_rate_A` or `sample_rate_B` is not > 0.
+    ValueError
+      If any of the other parameters is invalid (see `compare_audio_files`).
+    """
+    _check_signal(signal_A, sample_rate_A, "signal A")
+    _check_signal(signal_B, sample_rate_B, "signal B")
+    _check_audio_comparison_params(
+      sample_rate=self.sample_rate,
+      n_fft=self.n_fft,
+      win_len=self.win_len,
+      hop_len=self.hop_len,
+      window=self.window,
+      fmin=self.fmin,
+      fmax=self.fmax,
+      M=self.M,
+      s=s,
+      D=D,
+      aligning=aligning,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold_A=silence_threshold_A,
+      silence_threshold_B=silence_threshold_B,
+      dtw_radius=dtw_radius,
+      dtw_backend=dtw_backend,
+      resample_method=resample_method,
+      dtype=self.dtype,
+    )
+
+    result = _compare_signals(
+      signal_A,
+      sample_rate_A,
+      signal_B,
+      sample_rate_B,
+      self,
+      norm_audio=norm_audio,
+      s=s,
+      D=D,
+      aligning=aligning,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold_A=silence_threshold_A,
+      silence_threshold_B=silence_threshold_B,
+      dtw_radius=dtw_radius,
+      dtw_backend=dtw_backend,
+      resample_method=resample_method,
+    )
+
+    return _get_return_value(result, return_details)
+
+  def iter_spectrogram(
+    self,
+    audio: Union[Path, str],
+    /,
+    *,
+    norm_audio: bool = True,
+    remove_silence: bool = False,
+    silence_threshold: Optional[float] = None,
+    block_len: float = 10000,
+  ) -> Iterator[npt.NDArray[np.complexfloating]]:
+    """
+    Computes the amplitude spectrogram of an audio file block by block (see
+    `spectrogram`). The WAV file is memory-mapped and only one block of samples and
+    the frames computed from it are held in memory at a time. The concatenation of
+    all yielded chunks equals the result of `spectrogram`.
+
+    Parameters
+    ----------
+    audio : Path | str
+      Path to a mono WAV file. Its sample rate must match the sample rate of the
+      extractor since resampling requires the whole signal.
+    norm_audio : bool, default=True
+      If True, normalizes the audio signal to the range [-1, 1]. This requires an
+      additional pass over the file.
+    remove_silence : bool, default=False
+      If True, removes silence from the audio signal based on `silence_threshold`.
+    silence_threshold : float, optional
+      RMS threshold used to detect silence when `remove_silence` is True.
+      Must be >= 0 if specified.
+    block_len : float, default=10000
+      Number of milliseconds of audio that are read at once. Must be > 0.
+
+    Yields
+    ------
+    numpy.ndarray
+      Non-empty chunks of the amplitude spectrogram of shape (frames, frequency bins).
+
+    Raises
+    ------
+    ValueError
+      If the sample rate of `audio` does not match the sample rate of the extractor.
+    ValueError
+      If silence removal is enabled but `silence_threshold` is not set or is < 0.
+    ValueError
+      If `block_len` is not > 0.
+    """
+    if remove_silence:
+      if silence_threshold is None:
+        raise ValueError("silence_threshold must be set")
+
+      if not silence_threshold >= 0:
+        raise ValueError("silence_threshold must be greater than or equal to 0 RMS")
+
+    if not block_len > 0:
+      raise ValueError("block_len must be > 0")
+
+    signal = self._read_wav_for_streaming(audio)
+
+    return self._iter_features(
+      signal,
+      "spec",
+      norm_audio=norm_audio,
+      remove_silence="sig" if remove_silence else "no",
+      silence_threshold=silence_threshold,
+      block_len=block_len,
+    )
+
+  def iter_mel(
+    self,
+    audio: Union[Path, str],
+    /,
+    *,
+    norm_audio: bool = True,
+    remove_silence: Literal["no", "sig", "spec", "mel"] = "no",
+    silence_threshold: Optional[float] = None,
+    block_len: float = 10000,
+  ) -> Iterator[npt.NDArray]:
+    """
+    Computes the Mel spectrogram of an audio file block by block (see
+    `iter_spectrogram`). The concatenation of all yielded chunks equals the result of
+    `mel` up to floating point rounding.
+
+    Parameters
+    ----------
+    audio : Path | str
+      Path to a mono WAV file with the sample rate of the extractor.
+    norm_audio : bool, default=True
+      If True, normalizes the audio signal to the range [-1, 1].
+    remove_silence : {"no", "sig", "spec", "mel"}, default="no"
+      Stage at which silence is removed based on `silence_threshold`.
+    silence_threshold : float, optional
+      Threshold used to detect silence at the respective stage.
+    block_len : float, default=10000
+      Number of milliseconds of audio that are read at once. Must be > 0.
+
+    Yields
+    ------
+    numpy.ndarray
+      Non-empty chunks of the Mel spectrogram of shape (frames, M).
+
+    Raises
+    ------
+    ValueError
+      If the sample rate of `audio` does not match the sample rate of the extractor.
+    ValueError
+      If `remove_silence` is invalid or `silence_threshold` is not set.
+    ValueError
+      If `block_len` is not > 0.
+    """
+    if remove_silence not in ["no", "sig", "spec", "mel"]:
+      raise ValueError("remove_silence must be 'no', 'sig', 'spec' or 'mel'")
+
+    self._check_streaming_params(remove_silence, silence_threshold, block_len)
+    signal = self._read_wav_for_streaming(audio)
+
+    return self._iter_features(
+      signal,
+      "mel",
+      norm_audio=norm_audio,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      block_len=block_len,
+    )
+
+  def iter_mfcc(
+    self,
+    audio: Union[Path, str],
+    /,
+    *,
+    norm_audio: bool = True,
+    remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+    silence_threshold: Optional[float] = None,
+    block_len: float = 10000,
+  ) -> Iterator[npt.NDArray]:
+    """
+    Computes the MFCCs of an audio file block by block (see `iter_spectrogram`). The
+    concatenation of all yielded chunks equals the result of `mfcc` up to floating
+    point rounding.
+
+    Parameters
+    ----------
+    audio : Path | str
+      Path to a mono WAV file with the sample rate of the extractor.
+    norm_audio : bool, default=True
+      If True, normalizes the audio signal to the range [-1, 1].
+    remove_silence : {"no", "sig", "spec", "mel", "mfcc"}, default="no"
+      Stage at which silence is removed based on `silence_threshold`.
+    silence_threshold : float, optional
+      Threshold used to detect silence at the respective stage.
+    block_len : float, default=10000
+      Number of milliseconds of audio that are read at once. Must be > 0.
+
+    Yields
+    ------
+    numpy.ndarray
+      Non-empty chunks of the MFCCs of shape (M, frames).
+
+    Raises
+    ------
+    ValueError
+      If the sample rate of `audio` does not match the sample rate of the extractor.
+    ValueError
+      If `remove_silence` is invalid or `silence_threshold` is not set.
+    ValueError
+      If `block_len` is not > 0.
+    """
+    if remove_silence not in ["no", "sig", "spec", "mel", "mfcc"]:
+      raise ValueError("remove_silence must be 'no', 'sig', 'spec', 'mel' or 'mfcc'")
+
+    self._check_streaming_params(remove_silence, silence_threshold, block_len)
+    signal = self._read_wav_for_streaming(audio)
+
+    return self._iter_features(
+      signal,
+      "mfcc",
+      norm_audio=norm_audio,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      block_len=block_len,
+    )
+
+  def compare_streaming(
+    self,
+    audio_A: Union[Path, str],
+    audio_B: Union[Path, str],
+    /,
+    *,
+    s: int = 1,
+    D: int = 16,
+    align_target: Literal["spec", "mel", "mfcc"] = "mfcc",
+    remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+    silence_threshold_A: Optional[float] = None,
+    silence_threshold_B: Optional[float] = None,
+    norm_audio: bool = True,
+    block_len: float = 10000,
+  ) -> Tuple[float, float]:
+    """
+    Compares two audio files with zero-padding alignment without holding their
+    spectrograms or MFCCs in memory. The MFCCs of both files are computed block by
+    block (see `iter_mfcc`) and the MCD of each pair of frames is accumulated. The
+    result equals `compare` with `aligning="pad"` up to the floating point order of
+    summation.
+
+    Parameters
+    ----------
+    audio_A : Path | str
+      Path to the first mono WAV file with the sample rate of the extractor.
+    audio_B : Path | str
+      Path to the second mono WAV file with the sample rate of the extractor.
+    block_len : float, default=10000
+      Number of milliseconds of audio that are read at once. Must be > 0.
+    **params
+      All other parameters are the same as for `compare_audio_files`. Dynamic Time
+      Warping is not supported since it requires the whole sequences.
+
+    Returns
+    -------
+    Tuple[float, float]
+      The mean MCD and the alignment penalty. Both are nan if either audio is empty
+      or yields no frames, e.g., due to silence removal.
+
+    Raises
+    ------
+    ValueError
+      If the sample rate of either audio does not match the sample rate of the
+      extractor.
+    ValueError
+      If any of the parameters is invalid (see `compare_audio_files`).
+    ValueError
+      If `block_len` is not > 0.
+    """
+    _check_audio_comparison_params(
+      sample_rate=self.sample_rate,
+      n_fft=self.n_fft,
+      win_len=self.win_len,
+      hop_len=self.hop_len,
+      window=self.window,
+      fmin=self.fmin,
+      fmax=self.fmax,
+      M=self.M,
+      s=s,
+      D=D,
+      aligning="pad",
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold_A=silence_threshold_A,
+      silence_threshold_B=silence_threshold_B,
+      dtw_radius=None,
+      dtw_backend="fastdtw",
+      resample_method="fft",
+      dtype=self.dtype,
+    )
+
+    if not block_len > 0:
+      raise ValueError("block_len must be > 0")
+
+    signalA = self._read_wav_for_streaming(audio_A)
+    signalB = self._read_wav_for_streaming(audio_B)
+
+    if len(signalA) == 0:
+      logger = getLogger(__name__)
+      logger.warning("audio A is empty")
+      return np.nan, np.nan
+
+    if len(signalB) == 0:
+      logger = getLogger(__name__)
+      logger.warning("audio B is empty")
+      return np.nan, np.nan
+
+    # frame which is compared to the remaining frames of the longer sequence
+    if align_target == "spec":
+      X_km_pad = np.zeros(
+        (1, get_n_fft_bins(self.n_fft_samples)), dtype=get_complex_dtype(self.dtype)
+      )
+      X_kn_pad = get_X_kn(X_km_pad, self.w_n_m, self.w_n_m_bands)
+      MC_pad_i = get_MC_X_ik(X_kn_pad, self.M, self.cos_terms, s, D)[:, 0]
+    else:
+      # the MFCCs of a zero-padded Mel spectrogram are zero as well
+      MC_pad_i = np.zeros(D - s, dtype=self.dtype)
+
+    MCD_k_sum, n_frames_A, n_frames_B = get_MCD_k_sum_of_padded_streams(
+      self._iter_features(
+        signalA,
+        "mfcc",
+        norm_audio=norm_audio,
+        remove_silence=remove_silence,
+        silence_threshold=silence_threshold_A,
+        block_len=block_len,
+        s=s,
+        D=D,
+      ),
+      self._iter_features(
+        signalB,
+        "mfcc",
+        norm_audio=norm_audio,
+        remove_silence=remove_silence,
+        silence_threshold=silence_threshold_B,
+        block_len=block_len,
+        s=s,
+        D=D,
+      ),
+      0,
+      D - s,
+      MC_pad_i,
+    )
+
+    if n_frames_A == 0:
+      logger = getLogger(__name__)
+      logger.warning("MFCCs A are empty")
+      return np.nan, np.nan
+
+    if n_frames_B == 0:
+      logger = getLogger(__name__)
+      logger.warning("MFCCs B are empty")
+      return np.nan, np.nan
+
+    n_frames = max(n_frames_A, n_frames_B)
+    mean_mcd_over_all_k = MCD_k_sum / n_frames
+    penalty = get_penalty(n_frames_A, n_frames_B, n_frames)
+    return mean_mcd_over_all_k, penalty
+
+  def _check_streaming_params(
+    self,
+    remove_silence: str,
+    silence_threshold: Optional[float],
+    block_len: float,
+  ) -> None:
+    if remove_silence != "no" and silence_threshold is None:
+      raise ValueError("silence_threshold must be set")
+
+    if (
+      remove_silence == "sig"
+      and silence_threshold is not None
+      and not silence_threshold >= 0
+    ):
+      raise ValueError("silence_threshold must be greater than or equal to 0 RMS")
+
+    if not block_len > 0:
+      raise ValueError("block_len must be > 0")
+
+  def _read_wav_for_streaming(self, audio: Union[Path, str]) -> npt.NDArray:
+    # the samples are only read when they are accessed
+    signal: npt.NDArray
+    sr, signal = read_wav(audio, mmap=True)
+    if sr != self.sample_rate:
+      raise ValueError(
+        f"sample rate of the audio ({sr}) must match the sample rate of the "
+        f"extractor ({self.sample_rate}) for streaming"
+      )
+    return signal
+
+  def _iter_features(
+    self,
+    signal: npt.NDArray,
+    target: Literal["spec", "mel", "mfcc"],
+    *,
+    norm_audio: bool,
+    remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"],
+    silence_threshold: Optional[float],
+    block_len: float,
+    s: int = 0,
+    D: Optional[int] = None,
+  ) -> Iterator[npt.NDArray]:
+    # expects validated parameters
+    # for "mfcc" only the coefficients s..D-1 are yielded, by default all of them
+    if len(signal) == 0:
+      logger = getLogger(__name__)
+      logger.warning("audio is empty")
+      return
+
+    # the silence of the signal is detected in blocks of win_len samples, hence the
+    # blocks that are read need to consist of whole silence blocks
+    n_silence_blocks = math.ceil(
+      ms_to_samples(block_len, self.sample_rate) / self.win_len_samples
+    )
+    block_size = max(n_silence_blocks, 1) * self.win_len_samples
+
+    blocks = iter_signal_blocks(signal, block_size)
+
+    if norm_audio:
+      max_abs = get_max_abs(signal, block_size)
+      blocks = (block / max_abs for block in blocks)
+
+    if remove_silence == "sig":
+      assert silence_threshold is not None
+      blocks = (
+        remove_silence_rms(
+          block, silence_threshold, min_silence_samples=self.win_len_samples
+        )
+        for block in blocks
+      )
+
+    for X_km in iter_X_km(
+      blocks,
+      self.n_fft_samples,
+      self.win_len_samples,
+      self.hop_len_samples,
+      self.window,
+      self.win,
+      self.dtype,
+    ):
+      if remove_silence == "spec":
+        assert silence_threshold is not None
+        X_km = remove_silence_X_km(X_km, silence_threshold)
+
+      if target == "spec":
+        if X_km.shape[0] > 0:
+          yield X_km
+        continue
+
+      X_kn = get_X_kn(X_km, self.w_n_m, self.w_n_m_bands)
+
+      if remove_silence == "mel":
+        assert silence_threshold is not None
+        X_kn = remove_silence_X_kn(X_kn, silence_threshold)
+
+      if target == "mel":
+        if X_kn.shape[0] > 0:
+          yield X_kn
+        continue
+
+      assert target == "mfcc"
+      # the first coefficient is also calculated if silence is removed based on it
+      first = 0 if remove_silence == "mfcc" else s
+      MC_X_ik = get_MC_X_ik(X_kn, self.M, self.cos_terms, first, D)
+
+      if remove_silence == "mfcc":
+        assert silence_threshold is not None
+        MC_X_ik = remove_silence_MC_X_ik(MC_X_ik, silence_threshold)
+      MC_X_ik = MC_X_ik[s - first :]
+
+      if MC_X_ik.shape[1] > 0:
+        yield MC_X_ik
+
+  def _get_X_km(
+    self, signal: npt.NDArray, norm_audio: bool = False
+  ) -> npt.NDArray[np.complexfloating]:
+    # the frames are normalized instead of the whole signal to avoid a copy of it
+    norm_divisor = get_max_abs(signal, NORM_BLOCK_SIZE) if norm_audio else None
+    # STFT - Shape: (#Frames, Bins)
+    X_km = get_X_km(
+      signal,
+      self.n_fft_samples,
+      self.win_len_samples,
+      self.hop_len_samples,
+      self.window,
+      self.win,
+      norm_divisor,
+      self.dtype,
+    )
+    return X_km
+
+  def _get_extractor_for_native_sample_rate(self, sample_rate: int) -> "MCDExtractor":
+    # extractor for signals that are analyzed at their native sample rate instead of
+    # being resampled, its filterbank covers the same frequencies in Hz
+    if sample_rate not in self._extractor_per_native_sample_rate:
+      self._extractor_per_native_sample_rate[sample_rate] = MCDExtractor(
+        sample_rate,
+        n_fft=self.n_fft,
+        win_len=self.win_len,
+        hop_len=self.hop_len,
+        window=self.window,
+        fmin=self.fmin,
+        fmax=self.fmax,
+        M=self.M,
+        dtype=self.dtype,
+      )
+    return self._extractor_per_native_sample_rate[sample_rate]
+
+  def _get_empty_spectrogram(self) -> npt.NDArray[np.complexfloating]:
+    n_fft_bins = get_n_fft_bins(self.n_fft_samples)
+    empty_spec = np.empty((0, n_fft_bins), dtype=get_complex_dtype(self.dtype))
+    return empty_spec
+
+
 def compare_audio_files(
   audio_A: Union[Path, str],
   audio_B: Union[Path, str],
@@ -405,7 +1768,13 @@ def compare_audio_files(
   silence_threshold_B: Optional[float] = None,
   norm_audio: bool = True,
   dtw_radius: Optional[int] = 10,
-) -> Tuple[float, float]:
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  mmap: bool = False,
+  resample_method: Literal["fft", "polyphase", "none"] = "fft",
+  feature_cache: Optional[Union[FeatureCache, MemoryFeatureCache]] = None,
+  dtype: Literal["float64", "float32"] = "float64",
+  return_details: bool = False,
+) -> Union[Tuple[float, float], MCDResult]:
   """
   Compares two audio signals by computing the mean Mel-Cepstral Distance (MCD) between
   them. Internally computes amplitude and Mel spectrograms, extracts MFCCs, and aligns
@@ -466,13 +1835,58 @@ def compare_audio_files(
       Sakoe-Chiba radius for DTW alignment. A value of 1 is fastest but less accurate.
       None allows unrestricted warping but is slowest. A value of 10 is a good
       compromise between speed and accuracy.
+  dtw_backend : Literal["fastdtw", "multires", "sakoe-chiba"], default='fastdtw'
+      Implementation used for DTW alignment. "fastdtw" uses the `fastdtw` package.
+      "multires" is a built-in vectorized implementation of the same multiresolution
+      algorithm and yields the same warping paths, but runs considerably faster.
+      "sakoe-chiba" evaluates all cells within `dtw_radius` frames around the
+      diagonal (or the whole cost matrix if `dtw_radius` is None) in a single pass.
+  mmap : bool, default=False
+      If True, the WAV files are memory-mapped instead of read into memory, so that
+      their samples are only loaded while the frames are computed. This keeps the
+      resident memory low for large files, e.g., when many files are compared in
+      parallel. If an audio is resampled or `remove_silence` is "sig", its signal is
+      still copied. Not supported for 24-bit WAV files.
+  resample_method : Literal["fft", "polyphase", "none"], default="fft"
+      Method used to resample the signals if their sample rate differs from
+      `sample_rate`. "fft" resamples the whole signal in the frequency domain, its
+      runtime depends on the prime factors of the number of samples. "polyphase"
+      applies a polyphase filter with the up- and down-sampling factors derived from
+      the ratio of both sample rates, which is considerably faster for long signals.
+      "none" does not resample signals with a higher sample rate at all. Instead,
+      their STFT is computed at their native sample rate (with the same frame lengths
+      in milliseconds), scaled to the amplitudes of the resampled signal, and their
+      mel filterbank covers the same frequencies in Hz as for `sample_rate`. Signals
+      with a lower sample rate are still resampled with "fft". The result deviates
+      slightly from resampling, because the frame lengths are rounded to whole
+      samples at each sample rate, the mel filters are sampled at different
+      frequency bins, and frequencies above `sample_rate` / 2 are not removed by an
+      anti-aliasing filter and thus leak into the frames. Cannot be combined with
+      `align_target` "spec", because the frequency bins of both spectrograms differ.
+  feature_cache : FeatureCache | MemoryFeatureCache, optional
+      If set, the features of each audio are loaded from this cache if they were
+      already extracted with the same parameters, otherwise they are extracted and
+      stored in it. This avoids recomputing the features of an audio that is compared
+      multiple times, e.g., a reference that is compared against several systems.
+      `FeatureCache` stores the features on disk, `MemoryFeatureCache` in memory.
+  dtype : Literal["float64", "float32"], default="float64"
+      Floating point precision of the feature extraction and the comparison.
+      "float32" halves the memory of the spectrograms and speeds up the STFT and the
+      matrix products, the MCD deviates slightly from "float64". The accumulated
+      costs of DTW and the mean MCD are always computed in double precision.
+  return_details : bool, default=False
+      If True, an `MCDResult` is returned instead of the tuple. It additionally
+      contains the MCD of every aligned frame, the DTW warping path and its
+      accumulated cost as well as the durations of the stages of the comparison.
 
   Returns
   -------
-  Tuple[float, float]
+  Tuple[float, float] | MCDResult
       - Mean MCD over all selected coefficients.
       - Alignment penalty. Returns (nan, nan) if either input is empty or becomes empty
         due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of the
+      comparison.
 
   Raises
   ------
@@ -509,118 +1923,535 @@ def compare_audio_files(
       is not set.
   ValueError
       If `dtw_radius` is specified but not >= 1.
+  ValueError
+      If `dtw_backend` is not 'fastdtw', 'multires' or 'sakoe-chiba'.
+  ValueError
+      If `dtype` is not 'float64' or 'float32'.
+  ValueError
+      If `resample_method` is not 'fft', 'polyphase' or 'none'.
+  ValueError
+      If `resample_method` is 'none' and `align_target` is 'spec'.
   """
-  if remove_silence not in ["no", "sig", "spec", "mel", "mfcc"]:
-    raise ValueError("remove_silence must be 'no', 'sig', 'spec', 'mel' or 'mfcc'")
-
-  if sample_rate is not None and not sample_rate > 0:
-    raise ValueError("sample_rate must be > 0")
-
-  if not n_fft > 0:
-    raise ValueError("n_fft must be > 0")
-
-  if not win_len > 0:
-    raise ValueError("win_len must be > 0")
+  _check_audio_comparison_params(
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    fmin=fmin,
+    fmax=fmax,
+    M=M,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
 
-  if not hop_len > 0:
-    raise ValueError("hop_len must be > 0")
+  sr1, signalA = run_stage("read", read_wav, audio_A, mmap=mmap)
+  sr2, signalB = run_stage("read", read_wav, audio_B, mmap=mmap)
 
-  if window not in ["hamming", "hanning"]:
-    raise ValueError("window must be 'hamming' or 'hanning'")
+  if sample_rate is None:
+    sample_rate = min(sr1, sr2)
 
-  sr1, signalA = wavfile.read(audio_A)
-  sr2, signalB = wavfile.read(audio_B)
+  extractor = MCDExtractor(
+    sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    fmin=fmin,
+    fmax=fmax,
+    M=M,
+    dtype=dtype,
+  )
 
-  if signalA.dtype != signalB.dtype:
-    logger = getLogger(__name__)
-    logger.warning(
-      f"audio A and B have different data types ({signalA.dtype} != {signalB.dtype})"
-    )
+  result = _compare_signals(
+    signalA,
+    sr1,
+    signalB,
+    sr2,
+    extractor,
+    norm_audio=norm_audio,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    resample_method=resample_method,
+    feature_cache=feature_cache,
+    audio_A=audio_A,
+    audio_B=audio_B,
+  )
 
-  if len(signalA) == 0:
-    logger = getLogger(__name__)
-    logger.warning("audio A is empty")
-    return np.nan, np.nan
+  return _get_return_value(result, return_details)
 
-  if len(signalB) == 0:
-    logger = getLogger(__name__)
-    logger.warning("audio B is empty")
-    return np.nan, np.nan
 
-  if sample_rate is None:
-    sample_rate = min(sr1, sr2)
+def compare_audio_signals(
+  signal_A: npt.NDArray,
+  sample_rate_A: int,
+  signal_B: npt.NDArray,
+  sample_rate_B: int,
+  /,
+  *,
+  sample_rate: Optional[int] = None,
+  n_fft: float = 32,
+  win_len: float = 32,
+  hop_len: float = 8,
+  window: Literal["hamming", "hanning"] = "hanning",
+  fmin: int = 0,
+  fmax: Optional[int] = None,
+  M: int = 20,
+  s: int = 1,
+  D: int = 16,
+  aligning: Literal["pad", "dtw"] = "dtw",
+  align_target: Literal["spec", "mel", "mfcc"] = "mfcc",
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+  silence_threshold_A: Optional[float] = None,
+  silence_threshold_B: Optional[float] = None,
+  norm_audio: bool = True,
+  dtw_radius: Optional[int] = 10,
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  resample_method: Literal["fft", "polyphase", "none"] = "fft",
+  dtype: Literal["float64", "float32"] = "float64",
+  return_details: bool = False,
+) -> Union[Tuple[float, float], MCDResult]:
+  """
+  Compares two audio signals that are already in memory, e.g., generated by a TTS
+  model, by computing the mean Mel-Cepstral Distance (MCD) between them. The signals
+  pass through the same pipeline as in `compare_audio_files`, so that the result is
+  identical to comparing WAV files containing them, without writing them to disk.
 
-  signalA = resample_if_necessary(signalA, sr1, sample_rate)
-  signalB = resample_if_necessary(signalB, sr2, sample_rate)
+  Parameters
+  ----------
+  signal_A : numpy.ndarray
+      A 1D array with the samples of the first mono audio signal. Integer samples are
+      interpreted like the samples of a PCM WAV file and floating point samples like
+      those of a float WAV file.
+  sample_rate_A : int
+      Sample rate of `signal_A` in Hz. Must be > 0.
+  signal_B : numpy.ndarray
+      Same as `signal_A` for the second signal.
+  sample_rate_B : int
+      Sample rate of `signal_B` in Hz. Must be > 0.
+  **params
+      All other parameters are the same as for `compare_audio_files`. If
+      `sample_rate` is not set, the lower of both sample rates is used.
 
-  n_fft_samples = ms_to_samples(n_fft, sample_rate)
-  n_fft_is_two_power = n_fft_samples & (n_fft_samples - 1) == 0
+  Returns
+  -------
+  Tuple[float, float] | MCDResult
+      - Mean MCD over all selected coefficients.
+      - Alignment penalty. Returns (nan, nan) if either input is empty or becomes empty
+        due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of
+      the comparison.
 
-  if not n_fft_is_two_power:
-    logger = getLogger(__name__)
-    logger.warning(
-      f"n_fft ({n_fft}ms / {n_fft_samples} samples) should "
-      f"be a power of 2 in samples for faster computation"
-    )
+  Raises
+  ------
+  ValueError
+      If `signal_A` or `signal_B` does not have 1 dimension.
+  ValueError
+      If `sample_rate_A` or `sample_rate_B` is not > 0.
+  ValueError
+      If any of the other parameters is invalid (see `compare_audio_files`).
+  """
+  _check_signal(signal_A, sample_rate_A, "signal A")
+  _check_signal(signal_B, sample_rate_B, "signal B")
+  _check_audio_comparison_params(
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    fmin=fmin,
+    fmax=fmax,
+    M=M,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
 
-  if n_fft != win_len:
-    logger = getLogger(__name__)
-    logger.warning(f"n_fft ({n_fft}ms) should be equal to win_len ({win_len}ms)")
-    if n_fft < win_len:
-      logger.warning(f"truncating windows to n_fft ({n_fft}ms)")
-    else:
-      assert n_fft > win_len
-      logger.warning(f"padding windows to n_fft ({n_fft}ms)")
+  if sample_rate is None:
+    sample_rate = min(sample_rate_A, sample_rate_B)
+
+  extractor = MCDExtractor(
+    sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    fmin=fmin,
+    fmax=fmax,
+    M=M,
+    dtype=dtype,
+  )
 
-  if norm_audio:
-    signalA = norm_audio_signal(signalA)
-    signalB = norm_audio_signal(signalB)
+  result = _compare_signals(
+    signal_A,
+    sample_rate_A,
+    signal_B,
+    sample_rate_B,
+    extractor,
+    norm_audio=norm_audio,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    resample_method=resample_method,
+  )
 
-  win_len_samples = ms_to_samples(win_len, sample_rate)
+  return _get_return_value(result, return_details)
 
-  if remove_silence == "sig":
-    if silence_threshold_A is None:
-      raise ValueError("silence_threshold_A must be set")
 
-    if silence_threshold_B is None:
-      raise ValueError("silence_threshold_B must be set")
+def compare_audio_files_batch(
+  pairs: Iterable[Tuple[Union[Path, str], Union[Path, str]]],
+  /,
+  *,
+  sample_rate: Optional[int] = None,
+  n_fft: float = 32,
+  win_len: float = 32,
+  hop_len: float = 8,
+  window: Literal["hamming", "hanning"] = "hanning",
+  fmin: int = 0,
+  fmax: Optional[int] = None,
+  M: int = 20,
+  s: int = 1,
+  D: int = 16,
+  aligning: Literal["pad", "dtw"] = "dtw",
+  align_target: Literal["spec", "mel", "mfcc"] = "mfcc",
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+  silence_threshold_A: Optional[float] = None,
+  silence_threshold_B: Optional[float] = None,
+  norm_audio: bool = True,
+  dtw_radius: Optional[int] = 10,
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  mmap: bool = False,
+  resample_method: Literal["fft", "polyphase", "none"] = "fft",
+  feature_cache: Optional[Union[FeatureCache, MemoryFeatureCache]] = None,
+  dtype: Literal["float64", "float32"] = "float64",
+  n_jobs: int = 1,
+) -> npt.NDArray:
+  """
+  Compares many pairs of audio files with the same parameters. The result for each
+  pair is identical to calling `compare_audio_files` on it, but the parameters are
+  validated only once and the mel filterbank and the cosine terms of the MFCC
+  computation are built only once (per sample rate), so that the per-pair overhead
+  consists only of the signal-dependent work. Optionally, the pairs are processed
+  in parallel by multiple processes.
 
-    if not silence_threshold_A >= 0:
-      raise ValueError("silence_threshold_A must be greater than or equal to 0 RMS")
+  Parameters
+  ----------
+  pairs : Iterable[Tuple[Path | str, Path | str]]
+      Pairs of paths to mono WAV files. The first file of each pair is treated as
+      `audio_A` and the second as `audio_B`.
+  **params
+      All other parameters are the same as for `compare_audio_files`. The silence
+      thresholds apply to all files at the respective pair position.
+  n_jobs : int, default=1
+      Number of worker processes. -1 uses all available CPUs. The parameters and the
+      precomputed matrices are transferred once to each worker and the pairs are
+      distributed in chunks.
 
-    if not silence_threshold_B >= 0:
-      raise ValueError("silence_threshold_B must be greater than or equal to 0 RMS")
+  Returns
+  -------
+  numpy.ndarray
+      A structured array of shape (#pairs,) with the fields "mcd" and "penalty"
+      (both float64) in the order of `pairs`. Pairs where either input is empty or
+      becomes empty due to silence removal contain nan.
+
+  Raises
+  ------
+  ValueError
+      If any of the parameters is invalid (see `compare_audio_files`).
+  ValueError
+      If `n_jobs` is not >= 1 or -1.
+  """
+  _check_audio_comparison_params(
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    fmin=fmin,
+    fmax=fmax,
+    M=M,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
 
-    signalA = remove_silence_rms(
-      signalA, silence_threshold_A, min_silence_samples=win_len_samples
+  if not (n_jobs >= 1 or n_jobs == -1):
+    raise ValueError("n_jobs must be >= 1 or -1")
+
+  pairs = list(pairs)
+  # the precomputed matrices depend on the sample rate which may differ between pairs
+  # if sample_rate is not set, in that case one extractor is built per occurring
+  # sample rate
+  extractor_per_sample_rate: Dict[int, MCDExtractor] = {}
+  if sample_rate is not None:
+    extractor_per_sample_rate[sample_rate] = MCDExtractor(
+      sample_rate,
+      n_fft=n_fft,
+      win_len=win_len,
+      hop_len=hop_len,
+      window=window,
+      fmin=fmin,
+      fmax=fmax,
+      M=M,
+      dtype=dtype,
     )
 
-    signalB = remove_silence_rms(
-      signalB, silence_threshold_B, min_silence_samples=win_len_samples
+  settings: Dict[str, Any] = {
+    "sample_rate": sample_rate,
+    "fmin": fmin,
+    "fmax": fmax,
+    "M": M,
+    "n_fft": n_fft,
+    "win_len": win_len,
+    "hop_len": hop_len,
+    "window": window,
+    "norm_audio": norm_audio,
+    "s": s,
+    "D": D,
+    "aligning": aligning,
+    "align_target": align_target,
+    "remove_silence": remove_silence,
+    "silence_threshold_A": silence_threshold_A,
+    "silence_threshold_B": silence_threshold_B,
+    "dtw_radius": dtw_radius,
+    "dtw_backend": dtw_backend,
+    "mmap": mmap,
+    "resample_method": resample_method,
+    "feature_cache": feature_cache,
+    "dtype": dtype,
+  }
+
+  if n_jobs == -1:
+    n_jobs = os.cpu_count() or 1
+  n_workers = min(n_jobs, len(pairs))
+
+  if n_workers <= 1:
+    results = _compare_audio_file_pairs(pairs, settings, extractor_per_sample_rate)
+  else:
+    # the multiprocessing modules are only imported if they are needed
+    from concurrent.futures import ProcessPoolExecutor
+
+    # several chunks per worker to balance the load while keeping the IPC low
+    chunk_size = math.ceil(len(pairs) / (n_workers * 4))
+    chunks = [
+      pairs[chunk_start : chunk_start + chunk_size]
+      for chunk_start in range(0, len(pairs), chunk_size)
+    ]
+    results = []
+    with ProcessPoolExecutor(
+      max_workers=n_workers,
+      initializer=_init_batch_worker,
+      initargs=(settings, extractor_per_sample_rate),
+    ) as executor:
+      for chunk_results in executor.map(_compare_audio_file_pairs_in_worker, chunks):
+        results.extend(chunk_results)
+
+  return np.array(results, dtype=MCD_RESULT_DTYPE)
+
+
+def _compare_audio_file_pairs(
+  pairs: List[Tuple[Union[Path, str], Union[Path, str]]],
+  settings: Dict[str, Any],
+  extractor_per_sample_rate: Dict[int, MCDExtractor],
+) -> List[Tuple[float, float]]:
+  # expects validated settings
+  results = []
+  for audio_A, audio_B in pairs:
+    sr1, signalA = run_stage("read", read_wav, audio_A, mmap=settings["mmap"])
+    sr2, signalB = run_stage("read", read_wav, audio_B, mmap=settings["mmap"])
+
+    if settings["sample_rate"] is None:
+      sample_rate = min(sr1, sr2)
+    else:
+      sample_rate = settings["sample_rate"]
+
+    if sample_rate not in extractor_per_sample_rate:
+      extractor_per_sample_rate[sample_rate] = MCDExtractor(
+        sample_rate,
+        n_fft=settings["n_fft"],
+        win_len=settings["win_len"],
+        hop_len=settings["hop_len"],
+        window=settings["window"],
+        fmin=settings["fmin"],
+        fmax=settings["fmax"],
+        M=settings["M"],
+        dtype=settings["dtype"],
+      )
+
+    result = _compare_signals(
+      signalA,
+      sr1,
+      signalB,
+      sr2,
+      extractor_per_sample_rate[sample_rate],
+      norm_audio=settings["norm_audio"],
+      s=settings["s"],
+      D=settings["D"],
+      aligning=settings["aligning"],
+      align_target=settings["align_target"],
+      remove_silence=settings["remove_silence"],
+      silence_threshold_A=settings["silence_threshold_A"],
+      silence_threshold_B=settings["silence_threshold_B"],
+      dtw_radius=settings["dtw_radius"],
+      dtw_backend=settings["dtw_backend"],
+      resample_method=settings["resample_method"],
+      feature_cache=settings["feature_cache"],
+      audio_A=audio_A,
+      audio_B=audio_B,
     )
+    results.append((result.mcd, result.penalty))
+  return results
 
-    if len(signalA) == 0:
-      logger = getLogger(__name__)
-      logger.warning("after removing silence, audio A is empty")
-      return np.nan, np.nan
 
-    if len(signalB) == 0:
-      logger = getLogger(__name__)
-      logger.warning("after removing silence, audio B is empty")
-      return np.nan, np.nan
+# settings and extractors of a worker process, set once by its initializer
+_batch_worker_state: Dict[str, Any] = {}
 
-    remove_silence = "no"
 
-  # STFT - Shape: (#Frames, Bins)
-  hop_len_samples = ms_to_samples(hop_len, sample_rate)
-  X_km_A = get_X_km(signalA, n_fft_samples, win_len_samples, hop_len_samples, window)
-  X_km_B = get_X_km(signalB, n_fft_samples, win_len_samples, hop_len_samples, window)
+def _init_batch_worker(
+  settings: Dict[str, Any],
+  extractor_per_sample_rate: Dict[int, MCDExtractor],
+) -> None:
+  _batch_worker_state["settings"] = settings
+  _batch_worker_state["extractor_per_sample_rate"] = extractor_per_sample_rate
 
-  mean_mcd_over_all_k, res_penalty = compare_amplitude_spectrograms(
-    X_km_A,
-    X_km_B,
-    sample_rate,
-    n_fft,
+
+def _compare_audio_file_pairs_in_worker(
+  pairs: List[Tuple[Union[Path, str], Union[Path, str]]],
+) -> List[Tuple[float, float]]:
+  return _compare_audio_file_pairs(
+    pairs,
+    _batch_worker_state["settings"],
+    _batch_worker_state["extractor_per_sample_rate"],
+  )
+
+
+def pairwise_mcd(
+  items: Iterable[Union[Path, str, Tuple[npt.NDArray, int]]],
+  /,
+  *,
+  sample_rate: Optional[int] = None,
+  n_fft: float = 32,
+  win_len: float = 32,
+  hop_len: float = 8,
+  window: Literal["hamming", "hanning"] = "hanning",
+  fmin: int = 0,
+  fmax: Optional[int] = None,
+  M: int = 20,
+  s: int = 1,
+  D: int = 16,
+  aligning: Literal["pad", "dtw"] = "dtw",
+  align_target: Literal["spec", "mel", "mfcc"] = "mfcc",
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"] = "no",
+  silence_threshold: Optional[float] = None,
+  norm_audio: bool = True,
+  dtw_radius: Optional[int] = 10,
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  mmap: bool = False,
+  resample_method: Literal["fft", "polyphase", "none"] = "fft",
+  feature_cache: Optional[Union[FeatureCache, MemoryFeatureCache]] = None,
+  dtype: Literal["float64", "float32"] = "float64",
+  symmetric: bool = True,
+  n_jobs: int = 1,
+  progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[npt.NDArray, npt.NDArray]:
+  """
+  Compares all pairs of a collection of audios, e.g., to build a similarity matrix of
+  speakers or systems. The features of every audio are extracted only once and are
+  then compared with the features of all other audios, instead of extracting both
+  audios for every pair as `compare_audio_files` does. The result for a pair is
+  identical to calling `compare_audio_files` on it with the same sample rate.
+
+  Parameters
+  ----------
+  items : Iterable[Path | str | Tuple[numpy.ndarray, int]]
+      Audios to compare. Each one is either the path to a mono WAV file or a tuple of
+      a 1D array with the samples of a mono signal and its sample rate (see
+      `compare_audio_signals`).
+  sample_rate : int, optional
+      If specified, all audios are resampled to this rate before processing.
+      Otherwise, the lowest sample rate of all audios is used. Must be > 0.
+  silence_threshold : float, optional
+      Threshold used to detect silence in every audio, depending on the selected
+      `remove_silence` strategy (see `silence_threshold_A` of `compare_audio_files`).
+  **params
+      All other parameters are the same as for `compare_audio_files`. To determine
+      the sample rate, all audios are read before their features are extracted, so
+      `mmap` keeps the resident memory low for many long files.
+  symmetric : bool, default=True
+      If True, only the pairs (i, j) with i < j are compared and the results are
+      mirrored to (j, i). Otherwise, all pairs with i != j are compared, with the
+      audio i in the role of `audio_A` and the audio j in the role of `audio_B`. DTW
+      may yield slightly different warping paths if both roles are swapped.
+  n_jobs : int, default=1
+      Number of worker processes that compare the pairs. -1 uses all available CPUs.
+      The features are extracted in the calling process and transferred once to each
+      worker.
+  progress : Callable[[int, int], None], optional
+      Called with the number of compared pairs and the total number of pairs
+      whenever pairs were compared, i.e., after every pair or, if `n_jobs` > 1,
+      after every chunk of pairs.
+
+  Returns
+  -------
+  Tuple[numpy.ndarray, numpy.ndarray]
+      - Mean MCD of every pair with shape (#items, #items), where the entry (i, j)
+        is the result of comparing the audio i with the audio j.
+      - Alignment penalty of every pair with the same shape.
+      The diagonal is 0. Rows and columns of audios that are empty or become empty
+      due to silence removal contain nan.
+
+  Raises
+  ------
+  ValueError
+      If a signal does not have 1 dimension or its sample rate is not > 0.
+  ValueError
+      If any of the parameters is invalid (see `compare_audio_files`).
+  ValueError
+      If `n_jobs` is not >= 1 or -1.
+  """
+  _check_audio_comparison_params(
+    sample_rate=sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
     fmin=fmin,
     fmax=fmax,
     M=M,
@@ -629,17 +2460,201 @@ def compare_audio_files(
     aligning=aligning,
     align_target=align_target,
     remove_silence=remove_silence,
-    silence_threshold_A=silence_threshold_A,
-    silence_threshold_B=silence_threshold_B,
+    silence_threshold_A=silence_threshold,
+    silence_threshold_B=silence_threshold,
     dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    resample_method=resample_method,
+    dtype=dtype,
+  )
+
+  if not (n_jobs >= 1 or n_jobs == -1):
+    raise ValueError("n_jobs must be >= 1 or -1")
+
+  audios: List[Optional[Union[Path, str]]] = []
+  # the signals are released as soon as their features were extracted
+  signals: Deque[Tuple[int, npt.NDArray]] = deque()
+  for i, item in enumerate(items):
+    if isinstance(item, tuple):
+      signal, sr = item
+      _check_signal(signal, sr, f"signal {i}")
+      audios.append(None)
+    else:
+      sr, signal = run_stage("read", read_wav, item, mmap=mmap)
+      audios.append(item)
+    signals.append((sr, signal))
+
+  if sample_rate is None and len(signals) > 0:
+    sample_rate = min(sr for sr, _ in signals)
+
+  n_items = len(signals)
+  MCD = np.full((n_items, n_items), np.nan)
+  penalty = np.full((n_items, n_items), np.nan)
+  if n_items == 0:
+    return MCD, penalty
+
+  assert sample_rate is not None
+  extractor = MCDExtractor(
+    sample_rate,
+    n_fft=n_fft,
+    win_len=win_len,
+    hop_len=hop_len,
+    window=window,
+    fmin=fmin,
+    fmax=fmax,
+    M=M,
+    dtype=dtype,
   )
 
-  return mean_mcd_over_all_k, res_penalty
+  # features at the stage of align_target or None if the audio is or becomes empty
+  features: List[Optional[npt.NDArray]] = []
+  for i, audio in enumerate(audios):
+    sr, signal = signals.popleft()
+    if len(signal) == 0:
+      logger = getLogger(__name__)
+      logger.warning(f"audio {i} is empty")
+      features.append(None)
+      continue
+    item_features = _get_features_for_alignment(
+      signal,
+      sr,
+      extractor,
+      norm_audio=norm_audio,
+      s=s,
+      D=D,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      resample_method=resample_method,
+      feature_cache=feature_cache,
+      audio=audio,
+    )
+    n_frames = item_features.shape[1 if align_target == "mfcc" else 0]
+    if n_frames == 0:
+      logger = getLogger(__name__)
+      logger.warning(f"after removing silence, audio {i} is empty")
+      features.append(None)
+      continue
+    features.append(item_features)
+    MCD[i, i] = 0
+    penalty[i, i] = 0
+
+  pairs = [
+    (i, j)
+    for i in range(n_items)
+    for j in range(i + 1 if symmetric else 0, n_items)
+    if i != j and features[i] is not None and features[j] is not None
+  ]
+  settings: Dict[str, Any] = {
+    "s": s,
+    "D": D,
+    "aligning": aligning,
+    "align_target": align_target,
+    "dtw_radius": dtw_radius,
+    "dtw_backend": dtw_backend,
+  }
+
+  if n_jobs == -1:
+    n_jobs = os.cpu_count() or 1
+  n_workers = min(n_jobs, len(pairs))
+
+  n_done = 0
+  if n_workers <= 1:
+    for pair in pairs:
+      ((mcd, pen),) = _compare_feature_pairs([pair], features, extractor, settings)
+      MCD[pair], penalty[pair] = mcd, pen
+      n_done += 1
+      if progress is not None:
+        progress(n_done, len(pairs))
+  else:
+    # the multiprocessing modules are only imported if they are needed
+    from concurrent.futures import ProcessPoolExecutor
+
+    # several chunks per worker to balance the load while keeping the IPC low
+    chunk_size = math.ceil(len(pairs) / (n_workers * 4))
+    chunks = [
+      pairs[chunk_start : chunk_start + chunk_size]
+      for chunk_start in range(0, len(pairs), chunk_size)
+    ]
+    with ProcessPoolExecutor(
+      max_workers=n_workers,
+      initializer=_init_pairwise_worker,
+      initargs=(features, extractor, settings),
+    ) as executor:
+      for chunk, chunk_results in zip(
+        chunks, executor.map(_compare_feature_pairs_in_worker, chunks)
+      ):
+        for pair, (mcd, pen) in zip(chunk, chunk_results):
+          MCD[pair], penalty[pair] = mcd, pen
+        n_done += len(chunk)
+        if progress is not None:
+          progress(n_done, len(pairs))
+
+  if symmetric:
+    lower = np.tril_indices(n_items, -1)
+    MCD[lower] = MCD.T[lower]
+    penalty[lower] = penalty.T[lower]
+
+  return MCD, penalty
+
+
+def _compare_feature_pairs(
+  pairs: List[Tuple[int, int]],
+  features: List[Optional[npt.NDArray]],
+  extractor: MCDExtractor,
+  settings: Dict[str, Any],
+) -> List[Tuple[float, float]]:
+  # expects validated settings and non-empty features of all pairs
+  results = []
+  for i, j in pairs:
+    features_A = features[i]
+    features_B = features[j]
+    assert features_A is not None
+    assert features_B is not None
+    result = _compare_features(
+      features_A,
+      features_B,
+      extractor,
+      s=settings["s"],
+      D=settings["D"],
+      aligning=settings["aligning"],
+      align_target=settings["align_target"],
+      dtw_radius=settings["dtw_radius"],
+      dtw_backend=settings["dtw_backend"],
+      timings={},
+    )
+    results.append((result.mcd, result.penalty))
+  return results
+
+
+# features, extractor and settings of a worker process, set once by its initializer
+_pairwise_worker_state: Dict[str, Any] = {}
+
+
+def _init_pairwise_worker(
+  features: List[Optional[npt.NDArray]],
+  extractor: MCDExtractor,
+  settings: Dict[str, Any],
+) -> None:
+  _pairwise_worker_state["features"] = features
+  _pairwise_worker_state["extractor"] = extractor
+  _pairwise_worker_state["settings"] = settings
+
+
+def _compare_feature_pairs_in_worker(
+  pairs: List[Tuple[int, int]],
+) -> List[Tuple[float, float]]:
+  return _compare_feature_pairs(
+    pairs,
+    _pairwise_worker_state["features"],
+    _pairwise_worker_state["extractor"],
+    _pairwise_worker_state["settings"],
+  )
 
 
 def compare_amplitude_spectrograms(
-  amp_spec_A: npt.NDArray[np.complex128],
-  amp_spec_B: npt.NDArray[np.complex128],
+  amp_spec_A: npt.NDArray[np.complexfloating],
+  amp_spec_B: npt.NDArray[np.complexfloating],
   sample_rate: int,
   n_fft: float,
   /,
@@ -655,7 +2670,10 @@ def compare_amplitude_spectrograms(
   silence_threshold_A: Optional[float] = None,
   silence_threshold_B: Optional[float] = None,
   dtw_radius: Optional[int] = 10,
-) -> Tuple[float, float]:
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  dtype: Literal["float64", "float32"] = "float64",
+  return_details: bool = False,
+) -> Union[Tuple[float, float], MCDResult]:
   """
   Compares two amplitude spectrograms by computing the mean Mel-Cepstral Distance (MCD)
   and an alignment penalty. The function supports silence removal and alignment at
@@ -701,13 +2719,29 @@ def compare_amplitude_spectrograms(
   dtw_radius : int, optional, default=10
       Sakoe-Chiba radius for DTW alignment. A value of 1 is fastest but less accurate.
       None allows unrestricted warping but is slowest. Must be >= 1 if specified.
+  dtw_backend : {'fastdtw', 'multires', 'sakoe-chiba'}, optional, default='fastdtw'
+      Implementation used for DTW alignment. "fastdtw" uses the `fastdtw` package.
+      "multires" is a built-in vectorized implementation of the same multiresolution
+      algorithm and yields the same warping paths, but runs considerably faster.
+      "sakoe-chiba" evaluates all cells within `dtw_radius` frames around the
+      diagonal (or the whole cost matrix if `dtw_radius` is None) in a single pass.
+  dtype : {'float64', 'float32'}, optional, default='float64'
+      Floating point precision of the computation. The inputs are converted to it.
+      "float32" halves the memory of the intermediate arrays and speeds up the
+      matrix products, the MCD deviates slightly from "float64".
+  return_details : bool, optional, default=False
+      If True, an `MCDResult` is returned instead of the tuple. It additionally
+      contains the MCD of every aligned frame, the DTW warping path and its
+      accumulated cost as well as the durations of the stages of the comparison.
 
   Returns
   -------
-  Tuple[float, float]
+  Tuple[float, float] | MCDResult
       - Mean MCD over all selected coefficients.
       - Alignment penalty. Returns (nan, nan) if either input is empty or becomes empty
         due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of the
+      comparison.
 
   Raises
   ------
@@ -733,6 +2767,10 @@ def compare_amplitude_spectrograms(
       If `remove_silence` is not 'no', 'spec', 'mel', or 'mfcc'.
   ValueError
       If `dtw_radius` is specified but not >= 1.
+  ValueError
+      If `dtw_backend` is not 'fastdtw', 'multires' or 'sakoe-chiba'.
+  ValueError
+      If `dtype` is not 'float64' or 'float32'.
   ValueError
       If silence removal is enabled but `silence_threshold_A` or `silence_threshold_B`
       is not set.
@@ -750,12 +2788,12 @@ def compare_amplitude_spectrograms(
   if amp_spec_A.shape[0] == 0:
     logger = getLogger(__name__)
     logger.warning("spectrogram A is empty")
-    return np.nan, np.nan
+    return _get_return_value(get_nan_result({}), return_details)
 
   if amp_spec_B.shape[0] == 0:
     logger = getLogger(__name__)
     logger.warning("spectrogram B is empty")
-    return np.nan, np.nan
+    return _get_return_value(get_nan_result({}), return_details)
 
   if not amp_spec_A.shape[1] == amp_spec_B.shape[1]:
     raise ValueError(
@@ -781,9 +2819,15 @@ def compare_amplitude_spectrograms(
   if aligning not in ["pad", "dtw"]:
     raise ValueError("aligning must be 'pad' or 'dtw'")
 
+  if dtw_backend not in ["fastdtw", "multires", "sakoe-chiba"]:
+    raise ValueError("dtw_backend must be 'fastdtw', 'multires' or 'sakoe-chiba'")
+
   if remove_silence not in ["no", "spec", "mel", "mfcc"]:
     raise ValueError("remove_silence must be 'no', 'spec', 'mel' or 'mfcc'")
 
+  if align_target not in ["spec", "mel", "mfcc"]:
+    raise ValueError("align_target must be 'spec', 'mel' or 'mfcc'")
+
   if align_target == "spec":
     if remove_silence == "mel":
       raise ValueError(
@@ -795,6 +2839,11 @@ def compare_amplitude_spectrograms(
         "cannot remove silence from MFCCs after both spectrograms were aligned"
       )
 
+  if align_target == "mel" and remove_silence == "mfcc":
+    raise ValueError(
+      "cannot remove silence from MFCCs after both Mel spectrograms were aligned"
+    )
+
   if fmax is not None:
     if not 0 < fmax <= sample_rate // 2:
       raise ValueError(
@@ -809,49 +2858,35 @@ def compare_amplitude_spectrograms(
   if not M > 0:
     raise ValueError("M must be > 0")
 
-  if remove_silence == "spec":
+  if D > M:
+    raise ValueError(f"D must be <= number of mel-bands ({M})")
+
+  if not 0 <= s < D:
+    raise ValueError("s must be in [0, D)")
+
+  if remove_silence != "no":
     if silence_threshold_A is None:
       raise ValueError("silence_threshold_A must be set")
     if silence_threshold_B is None:
       raise ValueError("silence_threshold_B must be set")
 
-    amp_spec_A = remove_silence_X_km(amp_spec_A, silence_threshold_A)
-    amp_spec_B = remove_silence_X_km(amp_spec_B, silence_threshold_B)
-
-    if amp_spec_A.shape[0] == 0:
-      logger = getLogger(__name__)
-      logger.warning("after removing silence, spectrogram A is empty")
-      return np.nan, np.nan
-
-    if amp_spec_B.shape[0] == 0:
-      logger = getLogger(__name__)
-      logger.warning("after removing silence, spectrogram B is empty")
-      return np.nan, np.nan
+  if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
+    raise ValueError("dtw_radius must be None or greater than or equal to 1")
 
-    remove_silence = "no"
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
 
-  penalty: float
-  aligned_here: bool = False
-  if align_target == "spec":
-    if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
-      raise ValueError("dtw_radius must be None or greater than or equal to 1")
-    amp_spec_A, amp_spec_B, penalty = align_X_km(
-      amp_spec_A, amp_spec_B, aligning, dtw_radius
-    )
-    aligned_here = True
-    align_target = "mel"
-    aligning = "pad"
+  amp_spec_A = amp_spec_A.astype(get_complex_dtype(dtype), copy=False)
+  amp_spec_B = amp_spec_B.astype(get_complex_dtype(dtype), copy=False)
 
   # Mel-Bank - Shape: (N, #Frames)
   w_n_m = get_w_n_m(sample_rate, n_fft_samples, M, fmin, fmax)
 
-  # Mel-Spectrogram - Shape: (#Frames, #N)
-  X_kn_A = get_X_kn(amp_spec_A, w_n_m)
-  X_kn_B = get_X_kn(amp_spec_B, w_n_m)
-
-  mean_mcd_over_all_k, res_penalty = compare_mel_spectrograms(
-    X_kn_A,
-    X_kn_B,
+  result = _compare_amplitude_spectrograms(
+    amp_spec_A,
+    amp_spec_B,
+    w_n_m,
+    get_cos_terms(M),
     s=s,
     D=D,
     aligning=aligning,
@@ -860,16 +2895,11 @@ def compare_amplitude_spectrograms(
     silence_threshold_A=silence_threshold_A,
     silence_threshold_B=silence_threshold_B,
     dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings={},
   )
 
-  if aligned_here:
-    assert res_penalty == 0
-  else:
-    assert "penalty" not in locals()
-    assert res_penalty is not None
-    penalty = res_penalty
-
-  return mean_mcd_over_all_k, penalty
+  return _get_return_value(result, return_details)
 
 
 def compare_mel_spectrograms(
@@ -885,7 +2915,10 @@ def compare_mel_spectrograms(
   silence_threshold_A: Optional[float] = None,
   silence_threshold_B: Optional[float] = None,
   dtw_radius: Optional[int] = 10,
-) -> Tuple[float, float]:
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  dtype: Literal["float64", "float32"] = "float64",
+  return_details: bool = False,
+) -> Union[Tuple[float, float], MCDResult]:
   """
   Compares two Mel spectrograms by computing the mean Mel-Cepstral Distance (MCD)
   and an alignment penalty. Supports silence removal and alignment at different
@@ -920,14 +2953,29 @@ def compare_mel_spectrograms(
   dtw_radius : int, optional, default=10
       Sakoe-Chiba radius for DTW alignment. A value of 1 is fastest but less accurate.
       None allows unrestricted warping but is slowest. Must be >= 1 if specified.
+  dtw_backend : {'fastdtw', 'multires', 'sakoe-chiba'}, optional, default='fastdtw'
+      Implementation used for DTW alignment. "fastdtw" uses the `fastdtw` package.
+      "multires" is a built-in vectorized implementation of the same multiresolution
+      algorithm and yields the same warping paths, but runs considerably faster.
+      "sakoe-chiba" evaluates all cells within `dtw_radius` frames around the
+      diagonal (or the whole cost matrix if `dtw_radius` is None) in a single pass.
+  dtype : {'float64', 'float32'}, optional, default='float64'
+      Floating point precision of the computation. The inputs are converted to it.
+      "float32" halves the memory of the intermediate arrays and speeds up the
+      matrix products, the MCD deviates slightly from "float64".
+  return_details : bool, optional, default=False
+      If True, an `MCDResult` is returned instead of the tuple. It additionally
+      contains the MCD of every aligned frame, the DTW warping path and its
+      accumulated cost as well as the durations of the stages of the comparison.
 
   Returns
   -------
-  Tuple[float, float]
+  Tuple[float, float] | MCDResult
       - Mean MCD over all selected coefficients.
-      - Alignment penalty.
-      Returns (nan, nan) if either input is empty or becomes empty
+      - Alignment penalty. Returns (nan, nan) if either input is empty or becomes empty
         due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of the
+      comparison.
 
   Raises
   ------
@@ -950,6 +2998,10 @@ def compare_mel_spectrograms(
       is not set.
   ValueError
       If `dtw_radius` is specified but not >= 1.
+  ValueError
+      If `dtw_backend` is not 'fastdtw', 'multires' or 'sakoe-chiba'.
+  ValueError
+      If `dtype` is not 'float64' or 'float32'.
 
   Notes
   -----
@@ -972,12 +3024,12 @@ def compare_mel_spectrograms(
   if len(mel_spec_A) == 0:
     logger = getLogger(__name__)
     logger.warning("Mel spectrogram A is empty")
-    return np.nan, np.nan
+    return _get_return_value(get_nan_result({}), return_details)
 
   if len(mel_spec_B) == 0:
     logger = getLogger(__name__)
     logger.warning("Mel spectrogram B is empty")
-    return np.nan, np.nan
+    return _get_return_value(get_nan_result({}), return_details)
 
   if not mel_spec_A.shape[1] == mel_spec_B.shape[1]:
     raise ValueError("both Mel spectrograms must have the same number of mel-bands")
@@ -989,6 +3041,9 @@ def compare_mel_spectrograms(
   if aligning not in ["pad", "dtw"]:
     raise ValueError("aligning must be 'pad' or 'dtw'")
 
+  if dtw_backend not in ["fastdtw", "multires", "sakoe-chiba"]:
+    raise ValueError("dtw_backend must be 'fastdtw', 'multires' or 'sakoe-chiba'")
+
   if remove_silence not in ["no", "mel", "mfcc"]:
     raise ValueError("remove_silence must be 'no', 'mel' or 'mfcc'")
 
@@ -1003,65 +3058,41 @@ def compare_mel_spectrograms(
   if D > M:
     raise ValueError(f"D must be <= number of mel-bands ({M})")
 
-  if remove_silence == "mel":
-    if silence_threshold_A is None:
+  if not 0 <= s < D:
+    raise ValueError("s must be in [0, D)")
+
+  if remove_silence != "no":
+    if silence_threshold_A is None:
       raise ValueError("silence_threshold_A must be set")
     if silence_threshold_B is None:
       raise ValueError("silence_threshold_B must be set")
 
-    mel_spec_A = remove_silence_X_kn(mel_spec_A, silence_threshold_A)
-    mel_spec_B = remove_silence_X_kn(mel_spec_B, silence_threshold_B)
-
-    if mel_spec_A.shape[0] == 0:
-      logger = getLogger(__name__)
-      logger.warning("after removing silence, Mel spectrogram A is empty")
-      return np.nan, np.nan
-
-    if mel_spec_B.shape[0] == 0:
-      logger = getLogger(__name__)
-      logger.warning("after removing silence, Mel spectrogram B is empty")
-      return np.nan, np.nan
-
-    remove_silence = "no"
-
-  penalty: float
-  aligned_here: bool = False
-  if align_target == "mel":
-    if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
-      raise ValueError("dtw_radius must be None or greater than or equal to 1")
-    mel_spec_A, mel_spec_B, penalty = align_X_kn(
-      mel_spec_A, mel_spec_B, aligning, dtw_radius
-    )
-    aligned_here = True
-    align_target = "mfcc"
-    aligning = "pad"
+  if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
+    raise ValueError("dtw_radius must be None or greater than or equal to 1")
 
-  # Shape: (N, #Frames)
-  MC_X_ik = get_MC_X_ik(mel_spec_A, M)
-  MC_Y_ik = get_MC_X_ik(mel_spec_B, M)
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
 
-  remove_silence_mfcc = remove_silence == "mfcc"
+  mel_spec_A = mel_spec_A.astype(dtype, copy=False)
+  mel_spec_B = mel_spec_B.astype(dtype, copy=False)
 
-  mean_mcd_over_all_k, res_penalty = compare_mfccs(
-    MC_X_ik,
-    MC_Y_ik,
+  result = _compare_mel_spectrograms(
+    mel_spec_A,
+    mel_spec_B,
+    get_cos_terms(M),
     s=s,
     D=D,
     aligning=aligning,
-    remove_silence=remove_silence_mfcc,
+    align_target=align_target,
+    remove_silence=remove_silence,
     silence_threshold_A=silence_threshold_A,
     silence_threshold_B=silence_threshold_B,
     dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings={},
   )
 
-  if aligned_here:
-    assert res_penalty == 0
-  else:
-    assert "penalty" not in locals()
-    assert res_penalty is not None
-    penalty = res_penalty
-
-  return mean_mcd_over_all_k, penalty
+  return _get_return_value(result, return_details)
 
 
 def compare_mfccs(
@@ -1076,7 +3107,10 @@ def compare_mfccs(
   silence_threshold_A: Optional[float] = None,
   silence_threshold_B: Optional[float] = None,
   dtw_radius: Optional[int] = 10,
-) -> Tuple[float, float]:
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"] = "fastdtw",
+  dtype: Literal["float64", "float32"] = "float64",
+  return_details: bool = False,
+) -> Union[Tuple[float, float], MCDResult]:
   """
   Compares two sets of MFCCs by computing the mean Mel-Cepstral Distance (MCD)
   and an alignment penalty. Supports silence removal and alignment using
@@ -1106,13 +3140,29 @@ def compare_mfccs(
   dtw_radius : int, optional, default=10
       Sakoe-Chiba radius for DTW alignment. A value of 1 is fastest but less accurate.
       None allows unrestricted warping but is slowest. Must be >= 1 if specified.
+  dtw_backend : {'fastdtw', 'multires', 'sakoe-chiba'}, optional, default='fastdtw'
+      Implementation used for DTW alignment. "fastdtw" uses the `fastdtw` package.
+      "multires" is a built-in vectorized implementation of the same multiresolution
+      algorithm and yields the same warping paths, but runs considerably faster.
+      "sakoe-chiba" evaluates all cells within `dtw_radius` frames around the
+      diagonal (or the whole cost matrix if `dtw_radius` is None) in a single pass.
+  dtype : {'float64', 'float32'}, optional, default='float64'
+      Floating point precision of the computation. The inputs are converted to it.
+      "float32" halves the memory of the intermediate arrays and speeds up the
+      matrix products, the MCD deviates slightly from "float64".
+  return_details : bool, optional, default=False
+      If True, an `MCDResult` is returned instead of the tuple. It additionally
+      contains the MCD of every aligned frame, the DTW warping path and its
+      accumulated cost as well as the durations of the stages of the comparison.
 
   Returns
   -------
-  Tuple[float, float]
+  Tuple[float, float] | MCDResult
       - Mean MCD over all selected coefficients.
       - Alignment penalty. Returns (nan, nan) if either input is empty or becomes empty
         due to silence removal.
+      If `return_details` is True, an `MCDResult` containing both and the details of the
+      comparison.
 
   Raises
   ------
@@ -1131,6 +3181,10 @@ def compare_mfccs(
       is not set.
   ValueError
       If `dtw_radius` is specified but not >= 1.
+  ValueError
+      If `dtw_backend` is not 'fastdtw', 'multires' or 'sakoe-chiba'.
+  ValueError
+      If `dtype` is not 'float64' or 'float32'.
 
   Notes
   -----
@@ -1148,12 +3202,12 @@ def compare_mfccs(
   if mfccs_A.shape[1] == 0:
     logger = getLogger(__name__)
     logger.warning("MFCCs A are empty")
-    return np.nan, np.nan
+    return _get_return_value(get_nan_result({}), return_details)
 
   if mfccs_B.shape[1] == 0:
     logger = getLogger(__name__)
     logger.warning("MFCCs B are empty")
-    return np.nan, np.nan
+    return _get_return_value(get_nan_result({}), return_details)
 
   if not mfccs_A.shape[0] == mfccs_B.shape[0]:
     raise ValueError("both MFCCs must have the same number of coefficients")
@@ -1174,31 +3228,781 @@ def compare_mfccs(
   if aligning not in ["pad", "dtw"]:
     raise ValueError("aligning must be 'pad' or 'dtw'")
 
+  if dtw_backend not in ["fastdtw", "multires", "sakoe-chiba"]:
+    raise ValueError("dtw_backend must be 'fastdtw', 'multires' or 'sakoe-chiba'")
+
   if remove_silence:
     if silence_threshold_A is None:
       raise ValueError("silence_threshold_A must be set")
     if silence_threshold_B is None:
       raise ValueError("silence_threshold_B must be set")
 
-    mfccs_A = remove_silence_MC_X_ik(mfccs_A, silence_threshold_A)
-    mfccs_B = remove_silence_MC_X_ik(mfccs_B, silence_threshold_B)
+  if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
+    raise ValueError("dtw_radius must be None or greater than or equal to 1")
+
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
+
+  mfccs_A = mfccs_A.astype(dtype, copy=False)
+  mfccs_B = mfccs_B.astype(dtype, copy=False)
+
+  result = _compare_mfccs(
+    mfccs_A,
+    mfccs_B,
+    s=s,
+    D=D,
+    aligning=aligning,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings={},
+  )
+
+  return _get_return_value(result, return_details)
+
+
+def _get_return_value(
+  result: MCDResult, return_details: bool
+) -> Union[Tuple[float, float], MCDResult]:
+  if return_details:
+    return result
+  return result.mcd, result.penalty
+
+
+def _check_audio_comparison_params(
+  *,
+  sample_rate: Optional[int],
+  n_fft: float,
+  win_len: float,
+  hop_len: float,
+  window: Literal["hamming", "hanning"],
+  fmin: int,
+  fmax: Optional[int],
+  M: int,
+  s: int,
+  D: int,
+  aligning: Literal["pad", "dtw"],
+  align_target: Literal["spec", "mel", "mfcc"],
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"],
+  silence_threshold_A: Optional[float],
+  silence_threshold_B: Optional[float],
+  dtw_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"],
+  resample_method: Literal["fft", "polyphase", "none"],
+  dtype: Literal["float64", "float32"],
+) -> None:
+  # checks all parameters that do not depend on the audio files
+  if remove_silence not in ["no", "sig", "spec", "mel", "mfcc"]:
+    raise ValueError("remove_silence must be 'no', 'sig', 'spec', 'mel' or 'mfcc'")
+
+  if sample_rate is not None and not sample_rate > 0:
+    raise ValueError("sample_rate must be > 0")
+
+  if not n_fft > 0:
+    raise ValueError("n_fft must be > 0")
+
+  if not win_len > 0:
+    raise ValueError("win_len must be > 0")
+
+  if not hop_len > 0:
+    raise ValueError("hop_len must be > 0")
+
+  if window not in ["hamming", "hanning"]:
+    raise ValueError("window must be 'hamming' or 'hanning'")
+
+  if aligning not in ["pad", "dtw"]:
+    raise ValueError("aligning must be 'pad' or 'dtw'")
+
+  if dtw_backend not in ["fastdtw", "multires", "sakoe-chiba"]:
+    raise ValueError("dtw_backend must be 'fastdtw', 'multires' or 'sakoe-chiba'")
+
+  if resample_method not in ["fft", "polyphase", "none"]:
+    raise ValueError("resample_method must be 'fft', 'polyphase' or 'none'")
+
+  if dtype not in ["float64", "float32"]:
+    raise ValueError("dtype must be 'float64' or 'float32'")
+
+  if align_target not in ["spec", "mel", "mfcc"]:
+    raise ValueError("align_target must be 'spec', 'mel' or 'mfcc'")
+
+  if align_target == "spec" and resample_method == "none":
+    raise ValueError(
+      "cannot align amplitude spectrograms of signals that are not resampled"
+    )
+
+  if align_target == "spec":
+    if remove_silence == "mel":
+      raise ValueError(
+        "cannot remove silence from Mel spectrogram "
+        "after both spectrograms were aligned"
+      )
+    if remove_silence == "mfcc":
+      raise ValueError(
+        "cannot remove silence from MFCCs after both spectrograms were aligned"
+      )
+
+  if align_target == "mel" and remove_silence == "mfcc":
+    raise ValueError(
+      "cannot remove silence from MFCCs after both Mel spectrograms were aligned"
+    )
+
+  if fmax is not None and not fmax > 0:
+    raise ValueError("fmax must be > 0")
+
+  if not fmin >= 0:
+    raise ValueError("fmin must be >= 0")
+
+  if fmax is not None and not fmin < fmax:
+    raise ValueError(f"fmin must be in [0, fmax), i.e., [0, {fmax})")
+
+  if not M > 0:
+    raise ValueError("M must be > 0")
+
+  if D > M:
+    raise ValueError(f"D must be <= number of mel-bands ({M})")
+
+  if not 0 <= s < D:
+    raise ValueError("s must be in [0, D)")
+
+  if remove_silence != "no":
+    if silence_threshold_A is None:
+      raise ValueError("silence_threshold_A must be set")
+    if silence_threshold_B is None:
+      raise ValueError("silence_threshold_B must be set")
+
+  if remove_silence == "sig":
+    assert silence_threshold_A is not None
+    assert silence_threshold_B is not None
+
+    if not silence_threshold_A >= 0:
+      raise ValueError("silence_threshold_A must be greater than or equal to 0 RMS")
+
+    if not silence_threshold_B >= 0:
+      raise ValueError("silence_threshold_B must be greater than or equal to 0 RMS")
+
+  if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
+    raise ValueError("dtw_radius must be None or greater than or equal to 1")
+
+
+def _compare_signals(
+  signalA: npt.NDArray,
+  sr1: int,
+  signalB: npt.NDArray,
+  sr2: int,
+  extractor: MCDExtractor,
+  *,
+  norm_audio: bool,
+  s: int,
+  D: int,
+  aligning: Literal["pad", "dtw"],
+  align_target: Literal["spec", "mel", "mfcc"],
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"],
+  silence_threshold_A: Optional[float],
+  silence_threshold_B: Optional[float],
+  dtw_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"],
+  resample_method: Literal["fft", "polyphase", "none"],
+  feature_cache: Optional[Union[FeatureCache, MemoryFeatureCache]] = None,
+  audio_A: Optional[Union[Path, str]] = None,
+  audio_B: Optional[Union[Path, str]] = None,
+) -> MCDResult:
+  # expects validated parameters
+  # if feature_cache and the paths of the audios are set, the features are cached
+  timings: Dict[str, float] = {}
+  if signalA.dtype != signalB.dtype:
+    logger = getLogger(__name__)
+    logger.warning(
+      f"audio A and B have different data types ({signalA.dtype} != {signalB.dtype})"
+    )
+
+  if len(signalA) == 0:
+    logger = getLogger(__name__)
+    logger.warning("audio A is empty")
+    return get_nan_result(timings)
+
+  if len(signalB) == 0:
+    logger = getLogger(__name__)
+    logger.warning("audio B is empty")
+    return get_nan_result(timings)
+
+  start = time.perf_counter()
+  features_A = _get_features_for_alignment(
+    signalA,
+    sr1,
+    extractor,
+    norm_audio=norm_audio,
+    s=s,
+    D=D,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold=silence_threshold_A,
+    resample_method=resample_method,
+    feature_cache=feature_cache,
+    audio=audio_A,
+  )
+  if _is_empty_after_silence_removal(features_A, "A", align_target, remove_silence):
+    add_duration(timings, "features", start)
+    return get_nan_result(timings)
+
+  features_B = _get_features_for_alignment(
+    signalB,
+    sr2,
+    extractor,
+    norm_audio=norm_audio,
+    s=s,
+    D=D,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold=silence_threshold_B,
+    resample_method=resample_method,
+    feature_cache=feature_cache,
+    audio=audio_B,
+  )
+  add_duration(timings, "features", start)
+  if _is_empty_after_silence_removal(features_B, "B", align_target, remove_silence):
+    return get_nan_result(timings)
+
+  return _compare_features(
+    features_A,
+    features_B,
+    extractor,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings=timings,
+  )
+
+
+def _compare_features(
+  features_A: npt.NDArray,
+  features_B: npt.NDArray,
+  extractor: MCDExtractor,
+  *,
+  s: int,
+  D: int,
+  aligning: Literal["pad", "dtw"],
+  align_target: Literal["spec", "mel", "mfcc"],
+  dtw_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"],
+  timings: Dict[str, float],
+) -> MCDResult:
+  # expects validated parameters and non-empty features of _get_features_for_alignment
+  # silence was already removed from the features of both audios
+  if align_target == "spec":
+    return _compare_amplitude_spectrograms(
+      features_A,
+      features_B,
+      extractor.w_n_m,
+      extractor.cos_terms,
+      s=s,
+      D=D,
+      aligning=aligning,
+      align_target=align_target,
+      remove_silence="no",
+      silence_threshold_A=None,
+      silence_threshold_B=None,
+      dtw_radius=dtw_radius,
+      dtw_backend=dtw_backend,
+      timings=timings,
+    )
+
+  if align_target == "mel":
+    return _compare_mel_spectrograms(
+      features_A,
+      features_B,
+      extractor.cos_terms,
+      s=s,
+      D=D,
+      aligning=aligning,
+      align_target=align_target,
+      remove_silence="no",
+      silence_threshold_A=None,
+      silence_threshold_B=None,
+      dtw_radius=dtw_radius,
+      dtw_backend=dtw_backend,
+      timings=timings,
+    )
+
+  # the MFCCs only contain the coefficients s..D-1
+  return _compare_mfccs(
+    features_A,
+    features_B,
+    s=0,
+    D=D - s,
+    aligning=aligning,
+    remove_silence=False,
+    silence_threshold_A=None,
+    silence_threshold_B=None,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings=timings,
+  )
+
+
+def _get_features_for_alignment(
+  signal: npt.NDArray,
+  sr: int,
+  extractor: MCDExtractor,
+  *,
+  norm_audio: bool,
+  s: int,
+  D: int,
+  align_target: Literal["spec", "mel", "mfcc"],
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"],
+  silence_threshold: Optional[float],
+  resample_method: Literal["fft", "polyphase", "none"],
+  feature_cache: Optional[Union[FeatureCache, MemoryFeatureCache]],
+  audio: Optional[Union[Path, str]],
+) -> npt.NDArray:
+  # expects validated parameters
+  # returns the features at the stage of align_target from which silence was removed,
+  # for "mfcc" only the coefficients s..D-1
+  if feature_cache is None or audio is None:
+    return _extract_features_for_alignment(
+      signal,
+      sr,
+      extractor,
+      norm_audio=norm_audio,
+      s=s,
+      D=D,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      resample_method=resample_method,
+    )
+
+  params = {
+    "version": FEATURE_CACHE_VERSION,
+    "sample_rate": extractor.sample_rate,
+    "n_fft": extractor.n_fft_samples,
+    "win_len": extractor.win_len_samples,
+    "hop_len": extractor.hop_len_samples,
+    "window": extractor.window,
+    "fmin": extractor.fmin,
+    "fmax": extractor.fmax,
+    "M": extractor.M,
+    "norm_audio": norm_audio,
+    "s": s if align_target == "mfcc" else None,
+    "D": D if align_target == "mfcc" else None,
+    "align_target": align_target,
+    "remove_silence": remove_silence,
+    "silence_threshold": silence_threshold if remove_silence != "no" else None,
+    "resample_method": resample_method,
+    "dtype": extractor.dtype,
+  }
+  key = feature_cache.get_key(audio, params)
+  features = feature_cache.load(key)
+  if features is None:
+    features = _extract_features_for_alignment(
+      signal,
+      sr,
+      extractor,
+      norm_audio=norm_audio,
+      s=s,
+      D=D,
+      align_target=align_target,
+      remove_silence=remove_silence,
+      silence_threshold=silence_threshold,
+      resample_method=resample_method,
+    )
+    feature_cache.save(key, features)
+  return features
+
+
+def _extract_features_for_alignment(
+  signal: npt.NDArray,
+  sr: int,
+  extractor: MCDExtractor,
+  *,
+  norm_audio: bool,
+  s: int,
+  D: int,
+  align_target: Literal["spec", "mel", "mfcc"],
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"],
+  silence_threshold: Optional[float],
+  resample_method: Literal["fft", "polyphase", "none"],
+) -> npt.NDArray:
+  # expects validated parameters
+  analysis_extractor = extractor
+  if resample_method == "none":
+    if sr > extractor.sample_rate:
+      analysis_extractor = extractor._get_extractor_for_native_sample_rate(sr)
+    else:
+      signal = run_stage(
+        "resampling", resample_if_necessary, signal, sr, extractor.sample_rate, "fft"
+      )
+  else:
+    signal = run_stage(
+      "resampling",
+      resample_if_necessary,
+      signal,
+      sr,
+      extractor.sample_rate,
+      resample_method,
+    )
+
+  if remove_silence == "sig":
+    assert silence_threshold is not None
+    if norm_audio:
+      signal = norm_audio_signal(signal)
+      norm_audio = False
+    signal = run_stage(
+      "silence_removal",
+      remove_silence_rms,
+      signal,
+      silence_threshold,
+      min_silence_samples=analysis_extractor.win_len_samples,
+    )
+
+  X_km = run_stage("stft", analysis_extractor._get_X_km, signal, norm_audio)
+  if analysis_extractor is not extractor:
+    # the DFT of a frame scales with its number of samples
+    X_km *= extractor.sample_rate / sr
+  if remove_silence == "spec":
+    assert silence_threshold is not None
+    X_km = run_stage("silence_removal", remove_silence_X_km, X_km, silence_threshold)
+  if align_target == "spec":
+    return X_km
+
+  X_kn = run_stage(
+    "filterbank",
+    get_X_kn,
+    X_km,
+    analysis_extractor.w_n_m,
+    analysis_extractor.w_n_m_bands,
+  )
+  if remove_silence == "mel":
+    assert silence_threshold is not None
+    X_kn = run_stage("silence_removal", remove_silence_X_kn, X_kn, silence_threshold)
+  if align_target == "mel":
+    return X_kn
+
+  # only the coefficients s..D-1 are returned, the first one is also calculated if
+  # silence is removed based on it
+  first = 0 if remove_silence == "mfcc" else s
+  MC_X_ik = run_stage(
+    "dct", get_MC_X_ik, X_kn, extractor.M, extractor.cos_terms, first, D
+  )
+  if remove_silence == "mfcc":
+    assert silence_threshold is not None
+    MC_X_ik = run_stage(
+      "silence_removal", remove_silence_MC_X_ik, MC_X_ik, silence_threshold
+    )
+  return MC_X_ik[s - first :]
+
+
+def _is_empty_after_silence_removal(
+  features: npt.NDArray,
+  name: Literal["A", "B"],
+  align_target: Literal["spec", "mel", "mfcc"],
+  remove_silence: Literal["no", "sig", "spec", "mel", "mfcc"],
+) -> bool:
+  n_frames = features.shape[1] if align_target == "mfcc" else features.shape[0]
+  if remove_silence == "no" or n_frames > 0:
+    return False
+
+  logger = getLogger(__name__)
+  if remove_silence == "sig":
+    logger.warning(f"after removing silence, audio {name} is empty")
+  elif remove_silence == "spec":
+    logger.warning(f"after removing silence, spectrogram {name} is empty")
+  elif remove_silence == "mel":
+    logger.warning(f"after removing silence, Mel spectrogram {name} is empty")
+  else:
+    logger.warning(f"after removing silence, MFCCs {name} are empty")
+  return True
+
+
+def _compare_amplitude_spectrograms(
+  amp_spec_A: npt.NDArray[np.complexfloating],
+  amp_spec_B: npt.NDArray[np.complexfloating],
+  w_n_m: npt.NDArray,
+  cos_terms: npt.NDArray,
+  *,
+  s: int,
+  D: int,
+  aligning: Literal["pad", "dtw"],
+  align_target: Literal["spec", "mel", "mfcc"],
+  remove_silence: Literal["no", "spec", "mel", "mfcc"],
+  silence_threshold_A: Optional[float],
+  silence_threshold_B: Optional[float],
+  dtw_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"],
+  timings: Dict[str, float],
+) -> MCDResult:
+  # expects validated parameters
+  # the durations of the stages are added to timings
+  start = time.perf_counter()
+  if remove_silence == "spec":
+    assert silence_threshold_A is not None
+    assert silence_threshold_B is not None
+
+    amp_spec_A = run_stage(
+      "silence_removal", remove_silence_X_km, amp_spec_A, silence_threshold_A
+    )
+    amp_spec_B = run_stage(
+      "silence_removal", remove_silence_X_km, amp_spec_B, silence_threshold_B
+    )
+    start = add_duration(timings, "features", start)
+
+    if amp_spec_A.shape[0] == 0:
+      logger = getLogger(__name__)
+      logger.warning("after removing silence, spectrogram A is empty")
+      return get_nan_result(timings)
+
+    if amp_spec_B.shape[0] == 0:
+      logger = getLogger(__name__)
+      logger.warning("after removing silence, spectrogram B is empty")
+      return get_nan_result(timings)
+
+    remove_silence = "no"
+
+  penalty: float
+  aligned_here: bool = False
+  dtw_path: Optional[npt.NDArray] = None
+  dtw_cost: Optional[float] = None
+  if align_target == "spec":
+    if aligning == "dtw":
+      # the spectrograms are not stretched, the MFCCs are compared along the path
+      dtw_cost, dtw_path, _ = run_stage(
+        "dtw",
+        get_dtw_path_with_costs_X_km,
+        amp_spec_A,
+        amp_spec_B,
+        dtw_radius,
+        dtw_backend,
+      )
+      align_target = "mfcc"
+    else:
+      amp_spec_A, amp_spec_B, penalty = run_stage(
+        "padding", align_X_km, amp_spec_A, amp_spec_B, aligning, dtw_radius, dtw_backend
+      )
+      aligned_here = True
+      align_target = "mel"
+    aligning = "pad"
+    start = add_duration(timings, "alignment", start)
+
+  # Mel-Spectrogram - Shape: (#Frames, #N)
+  X_kn_A = run_stage("filterbank", get_X_kn, amp_spec_A, w_n_m)
+  X_kn_B = run_stage("filterbank", get_X_kn, amp_spec_B, w_n_m)
+  add_duration(timings, "features", start)
+
+  assert remove_silence != "spec"
+  assert align_target != "spec"
+  result = _compare_mel_spectrograms(
+    X_kn_A,
+    X_kn_B,
+    cos_terms,
+    s=s,
+    D=D,
+    aligning=aligning,
+    align_target=align_target,
+    remove_silence=remove_silence,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings=timings,
+    dtw_path=dtw_path,
+    dtw_cost=dtw_cost,
+  )
+
+  if aligned_here:
+    assert result.penalty == 0
+    result = replace(result, penalty=penalty)
+  else:
+    assert "penalty" not in locals()
+    assert result.penalty is not None
+
+  return result
+
+
+def _compare_mel_spectrograms(
+  mel_spec_A: npt.NDArray,
+  mel_spec_B: npt.NDArray,
+  cos_terms: npt.NDArray,
+  *,
+  s: int,
+  D: int,
+  aligning: Literal["pad", "dtw"],
+  align_target: Literal["mel", "mfcc"],
+  remove_silence: Literal["no", "mel", "mfcc"],
+  silence_threshold_A: Optional[float],
+  silence_threshold_B: Optional[float],
+  dtw_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"],
+  timings: Dict[str, float],
+  dtw_path: Optional[npt.NDArray] = None,
+  dtw_cost: Optional[float] = None,
+) -> MCDResult:
+  # expects validated parameters
+  # if dtw_path is set, the frames are compared along it
+  # the durations of the stages are added to timings
+  M = mel_spec_A.shape[1]
+
+  start = time.perf_counter()
+  if remove_silence == "mel":
+    assert silence_threshold_A is not None
+    assert silence_threshold_B is not None
+
+    mel_spec_A = run_stage(
+      "silence_removal", remove_silence_X_kn, mel_spec_A, silence_threshold_A
+    )
+    mel_spec_B = run_stage(
+      "silence_removal", remove_silence_X_kn, mel_spec_B, silence_threshold_B
+    )
+    start = add_duration(timings, "features", start)
+
+    if mel_spec_A.shape[0] == 0:
+      logger = getLogger(__name__)
+      logger.warning("after removing silence, Mel spectrogram A is empty")
+      return get_nan_result(timings)
+
+    if mel_spec_B.shape[0] == 0:
+      logger = getLogger(__name__)
+      logger.warning("after removing silence, Mel spectrogram B is empty")
+      return get_nan_result(timings)
+
+    remove_silence = "no"
+
+  penalty: float
+  aligned_here: bool = False
+  if align_target == "mel":
+    if aligning == "dtw":
+      # the Mel spectrograms are not stretched, the MFCCs are compared along the path
+      dtw_cost, dtw_path, _ = run_stage(
+        "dtw",
+        get_dtw_path_with_costs,
+        mel_spec_A.T,
+        mel_spec_B.T,
+        dtw_radius,
+        dtw_backend,
+      )
+    else:
+      mel_spec_A, mel_spec_B, penalty = run_stage(
+        "padding", align_X_kn, mel_spec_A, mel_spec_B, aligning, dtw_radius, dtw_backend
+      )
+      aligned_here = True
+    align_target = "mfcc"
+    aligning = "pad"
+    start = add_duration(timings, "alignment", start)
+
+  remove_silence_mfcc = remove_silence == "mfcc"
+
+  # only the coefficients s..D-1 are calculated and the first one if silence is
+  # removed based on it - Shape: (D - first, #Frames)
+  first = 0 if remove_silence_mfcc else s
+  MC_X_ik = run_stage("dct", get_MC_X_ik, mel_spec_A, M, cos_terms, first, D)
+  MC_Y_ik = run_stage("dct", get_MC_X_ik, mel_spec_B, M, cos_terms, first, D)
+  add_duration(timings, "features", start)
+
+  result = _compare_mfccs(
+    MC_X_ik,
+    MC_Y_ik,
+    s=s - first,
+    D=D - first,
+    aligning=aligning,
+    remove_silence=remove_silence_mfcc,
+    silence_threshold_A=silence_threshold_A,
+    silence_threshold_B=silence_threshold_B,
+    dtw_radius=dtw_radius,
+    dtw_backend=dtw_backend,
+    timings=timings,
+    dtw_path=dtw_path,
+    dtw_cost=dtw_cost,
+  )
+
+  if aligned_here:
+    assert result.penalty == 0
+    result = replace(result, penalty=penalty)
+  else:
+    assert "penalty" not in locals()
+    assert result.penalty is not None
+
+  return result
+
+
+def _compare_mfccs(
+  mfccs_A: npt.NDArray,
+  mfccs_B: npt.NDArray,
+  *,
+  s: int,
+  D: int,
+  aligning: Literal["pad", "dtw"],
+  remove_silence: bool,
+  silence_threshold_A: Optional[float],
+  silence_threshold_B: Optional[float],
+  dtw_radius: Optional[int],
+  dtw_backend: Literal["fastdtw", "multires", "sakoe-chiba"],
+  timings: Dict[str, float],
+  dtw_path: Optional[npt.NDArray] = None,
+  dtw_cost: Optional[float] = None,
+) -> MCDResult:
+  # expects validated parameters
+  # if dtw_path is set, the frames are compared along it and dtw_cost is its cost
+  # the durations of the stages are added to timings
+  start = time.perf_counter()
+  if remove_silence:
+    assert silence_threshold_A is not None
+    assert silence_threshold_B is not None
+
+    mfccs_A = run_stage(
+      "silence_removal", remove_silence_MC_X_ik, mfccs_A, silence_threshold_A
+    )
+    mfccs_B = run_stage(
+      "silence_removal", remove_silence_MC_X_ik, mfccs_B, silence_threshold_B
+    )
+    start = add_duration(timings, "features", start)
 
     if mfccs_A.shape[1] == 0:
       logger = getLogger(__name__)
       logger.warning("after removing silence, MFCCs A are empty")
-      return np.nan, np.nan
+      return get_nan_result(timings)
 
     if mfccs_B.shape[1] == 0:
       logger = getLogger(__name__)
       logger.warning("after removing silence, MFCCs B are empty")
-      return np.nan, np.nan
-
-  if aligning == "dtw" and dtw_radius is not None and not dtw_radius >= 1:
-    raise ValueError("dtw_radius must be None or greater than or equal to 1")
-
-  mfccs_A, mfccs_B, penalty = align_MC_s_D(mfccs_A, mfccs_B, s, D, aligning, dtw_radius)
+      return get_nan_result(timings)
+
+  # only the coefficients s..D-1 are aligned and compared
+  mfccs_A = mfccs_A[s:D]
+  mfccs_B = mfccs_B[s:D]
+  MCD_k: Optional[npt.NDArray] = None
+  if dtw_path is None and aligning == "dtw":
+    # the local costs of DTW are the Euclidean distances of the frames, i.e., their
+    # MCD, which is reused if the backend returns them
+    dtw_cost, dtw_path, MCD_k = run_stage(
+      "dtw", get_dtw_path_with_costs, mfccs_A, mfccs_B, dtw_radius, dtw_backend
+    )
+    start = add_duration(timings, "alignment", start)
 
-  MCD_k = get_MCD_k(mfccs_A, mfccs_B, s, D)
+  if dtw_path is not None:
+    # the MFCCs are compared along the warping path instead of stretching them
+    if MCD_k is None:
+      MCD_k = run_stage(
+        "distance", get_MCD_k_along_path, mfccs_A, mfccs_B, dtw_path, 0, D - s
+      )
+    penalty = get_penalty(mfccs_A.shape[1], mfccs_B.shape[1], len(dtw_path))
+  else:
+    mfccs_A, mfccs_B, penalty = run_stage(
+      "padding",
+      align_MC_s_D,
+      mfccs_A,
+      mfccs_B,
+      0,
+      D - s,
+      aligning,
+      dtw_radius,
+      dtw_backend,
+    )
+    start = add_duration(timings, "alignment", start)
+    MCD_k = run_stage("distance", get_MCD_k, mfccs_A, mfccs_B, 0, D - s)
   mean_mcd_over_all_k = get_average_MCD(MCD_k)
+  add_duration(timings, "distance", start)
 
-  return mean_mcd_over_all_k, penalty
+  return MCDResult(mean_mcd_over_all_k, penalty, MCD_k, dtw_path, dtw_cost, timings)
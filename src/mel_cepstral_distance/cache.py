@@ -0,0 +1,292 @@
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+# number of bytes of a file that are hashed at once
+FILE_HASH_BLOCK_SIZE = 2**20
+
+
+def get_file_hash(path: Union[Path, str]) -> str:
+  """Calculates the MD5 hash of the content of a file"""
+  file_hash = hashlib.md5()
+  with open(path, "rb") as f:
+    for block in iter(lambda: f.read(FILE_HASH_BLOCK_SIZE), b""):
+      file_hash.update(block)
+  return file_hash.hexdigest()
+
+
+class FeatureCache:
+  """
+  Directory-based cache for features extracted from audio files.
+
+  Every entry is stored as a `.npy` file whose name is the key of the entry. The key is
+  derived from the content and the modification time of the audio file and from the
+  parameters that were used to extract the features, so that changing any of them
+  results in a new entry. Multiple processes can share the same directory.
+
+  Parameters
+  ----------
+  directory : Path | str
+      Directory in which the entries are stored. It is created if it does not exist.
+  max_size : int, optional
+      Maximum total size of all entries in bytes. If exceeded, the least recently used
+      entries are removed. Must be > 0. If None, the size is not limited.
+
+  Raises
+  ------
+  ValueError
+      If `max_size` is specified but not > 0.
+  """
+
+  def __init__(
+    self, directory: Union[Path, str], max_size: Optional[int] = None
+  ) -> None:
+    if max_size is not None and not max_size > 0:
+      raise ValueError("max_size must be None or > 0")
+
+    self.directory = Path(directory)
+    self.max_size = max_size
+    self.directory.mkdir(parents=True, exist_ok=True)
+
+  def get_key(self, audio: Union[Path, str], params: Dict[str, Any]) -> str:
+    """
+    Creates the key of the features of an audio file.
+
+    Parameters
+    ----------
+    audio : Path | str
+        Path to the audio file.
+    params : Dict[str, Any]
+        Parameters that were used to extract the features. Their representations are
+        part of the key.
+
+    Returns
+    -------
+    str
+        Key of the features.
+    """
+    mtime = os.stat(audio).st_mtime_ns
+    vals = [get_file_hash(audio), str(mtime)]
+    vals.extend(f"{name}={params[name]!r}" for name in sorted(params))
+    return hashlib.md5("_".join(vals).encode()).hexdigest()
+
+  def load(self, key: str) -> Optional[npt.NDArray]:
+    """
+    Loads the features of an entry and marks the entry as recently used.
+
+    Parameters
+    ----------
+    key : str
+        Key of the entry.
+
+    Returns
+    -------
+    npt.NDArray, optional
+        Stored features or None if no entry exists for `key`.
+    """
+    path = self._get_path(key)
+    try:
+      features: npt.NDArray = np.load(path)
+      os.utime(path)
+    except FileNotFoundError:
+      # the entry does not exist or was removed by another process
+      return None
+    return features
+
+  def save(self, key: str, features: npt.NDArray) -> None:
+    """
+    Stores features and removes the least recently used entries if the maximum size is
+    exceeded. Features that are larger than the maximum size are not stored.
+
+    Parameters
+    ----------
+    key : str
+        Key of the entry.
+    features : npt.NDArray
+        Features to store.
+    """
+    if self.max_size is not None and features.nbytes > self.max_size:
+      return
+
+    path = self._get_path(key)
+    # write to a temporary file first so that other processes never load partial files
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+      np.save(f, features)
+    os.replace(tmp_path, path)
+
+    if self.max_size is not None:
+      self._remove_least_recently_used(self.max_size)
+
+  def get_size(self) -> int:
+    """
+    Calculates the total size of all entries.
+
+    Returns
+    -------
+    int
+        Total size of all entries in bytes.
+    """
+    return sum(size for _, _, size in self._get_entries())
+
+  def clear(self) -> None:
+    """Removes all entries."""
+    for path, _, _ in self._get_entries():
+      path.unlink(missing_ok=True)
+
+  def _get_path(self, key: str) -> Path:
+    return self.directory / f"{key}.npy"
+
+  def _get_entries(self) -> List[Tuple[Path, int, int]]:
+    # returns the path, the time of the last use and the size of all entries
+    entries = []
+    for path in self.directory.glob("*.npy"):
+      try:
+        stat = path.stat()
+      except FileNotFoundError:
+        continue
+      entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return entries
+
+  def _remove_least_recently_used(self, max_size: int) -> None:
+    entries = sorted(self._get_entries(), key=lambda entry: entry[1])
+    total_size = sum(size for _, _, size in entries)
+    for path, _, size in entries:
+      if total_size <= max_size:
+        break
+      path.unlink(missing_ok=True)
+      total_size -= size
+
+
+class MemoryFeatureCache:
+  """
+  In-memory cache for features extracted from audio files.
+
+  In contrast to `FeatureCache`, the keys are derived from the path, the size and the
+  modification time of the audio file instead of its content, so that the file does
+  not need to be read to look up its features. The cache is local to the process,
+  i.e., every worker process of `compare_audio_files_batch` uses its own copy.
+
+  Parameters
+  ----------
+  max_size : int
+      Maximum total size of all stored features in bytes. If exceeded, the least
+      recently used entries are removed. Must be > 0.
+
+  Attributes
+  ----------
+  hits : int
+      Number of loads that returned stored features.
+  misses : int
+      Number of loads for which no features were stored.
+  evictions : int
+      Number of entries that were removed because `max_size` was exceeded.
+
+  Raises
+  ------
+  ValueError
+      If `max_size` is not > 0.
+  """
+
+  def __init__(self, max_size: int) -> None:
+    if not max_size > 0:
+      raise ValueError("max_size must be > 0")
+
+    self.max_size = max_size
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._entries: OrderedDict[str, npt.NDArray] = OrderedDict()
+    self._size = 0
+
+  def get_key(self, audio: Union[Path, str], params: Dict[str, Any]) -> str:
+    """
+    Creates the key of the features of an audio file.
+
+    Parameters
+    ----------
+    audio : Path | str
+        Path to the audio file.
+    params : Dict[str, Any]
+        Parameters that were used to extract the features. Their representations are
+        part of the key.
+
+    Returns
+    -------
+    str
+        Key of the features.
+    """
+    stat = os.stat(audio)
+    vals = [str(Path(audio).resolve()), str(stat.st_size), str(stat.st_mtime_ns)]
+    vals.extend(f"{name}={params[name]!r}" for name in sorted(params))
+    return hashlib.md5("_".join(vals).encode()).hexdigest()
+
+  def load(self, key: str) -> Optional[npt.NDArray]:
+    """
+    Returns the features of an entry and marks the entry as recently used.
+
+    Parameters
+    ----------
+    key : str
+        Key of the entry.
+
+    Returns
+    -------
+    npt.NDArray, optional
+        Stored features (read-only) or None if no entry exists for `key`.
+    """
+    features = self._entries.get(key)
+    if features is None:
+      self.misses += 1
+      return None
+    self.hits += 1
+    self._entries.move_to_end(key)
+    return features
+
+  def save(self, key: str, features: npt.NDArray) -> None:
+    """
+    Stores features and removes the least recently used entries if the maximum size is
+    exceeded. Features that are larger than the maximum size are not stored.
+
+    Parameters
+    ----------
+    key : str
+        Key of the entry.
+    features : npt.NDArray
+        Features to store. They are stored without copying them and are set to
+        read-only.
+    """
+    if features.nbytes > self.max_size:
+      return
+
+    if key in self._entries:
+      self._size -= self._entries.pop(key).nbytes
+    features.setflags(write=False)
+    self._entries[key] = features
+    self._size += features.nbytes
+
+    while self._size > self.max_size:
+      _, removed = self._entries.popitem(last=False)
+      self._size -= removed.nbytes
+      self.evictions += 1
+
+  def get_size(self) -> int:
+    """
+    Calculates the total size of all entries.
+
+    Returns
+    -------
+    int
+        Total size of all stored features in bytes.
+    """
+    return self._size
+
+  def clear(self) -> None:
+    """Removes all entries. The counters are not reset."""
+    self._entries.clear()
+    self._size = 0
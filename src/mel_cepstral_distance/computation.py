@@ -1,16 +1,50 @@
-from typing import Literal, Tuple
+import math
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
 
 from mel_cepstral_distance.helper import (
-  amp_to_mag,
   energy_to_bel,
+  get_complex_dtype,
   get_hz_points,
   get_n_fft_bins,
-  mag_to_energy,
 )
 
+# maximum number of frames that are windowed and transformed at once
+STFT_CHUNK_SIZE = 2**12
+
+# maximum number of frames whose energy is computed at once in get_X_kn
+ENERGY_CHUNK_SIZE = 2**10
+
+# maximum number of steps of a warping path whose frames are compared at once
+PATH_CHUNK_SIZE = 2**12
+
+# maximum number of Mel filter banks that are memoized by get_w_n_m
+W_N_M_CACHE_SIZE = 32
+
+# maximum number of cosine terms that are memoized by get_cos_terms
+COS_TERMS_CACHE_SIZE = 32
+
+# minimum number of Mel cepstrum coefficients for which get_MC_X_ik uses a DCT-II
+# instead of multiplying with the cosine terms if dct_backend is "auto"
+DCT_FFT_MIN_ROWS = 384
+
+# number of groups of neighbouring mel filters that are multiplied separately with the
+# band of FFT bins they cover
+W_N_M_N_BANDS = 8
+
+# the banded filterbank is only used for at least this number of frames and if it needs
+# at most this fraction of the multiplications of the dense filterbank, otherwise the
+# overhead of the separate products outweighs the saved multiplications
+BANDED_MIN_FRAMES = 64
+BANDED_MAX_WORK_RATIO = 0.5
+
+# groups of Mel filters: (filters, FFT bins, weights with shape (#bins, #filters))
+W_N_M_Bands = List[Tuple[slice, slice, npt.NDArray]]
+
 
 def adjust_win_len_to_n_fft(
   windowed_frames: npt.NDArray, n_fft: int
@@ -28,41 +62,84 @@ def adjust_win_len_to_n_fft(
   return windowed_frames, win_len
 
 
+def get_window(window: Literal["hamming", "hanning"], win_len: int) -> npt.NDArray:
+  """Calculates the window function applied to each frame"""
+  assert window in ["hamming", "hanning"]
+  if window == "hamming":
+    win = np.hamming(win_len)
+  else:
+    assert window == "hanning"
+    win = np.hanning(win_len)
+  return win
+
+
 def get_X_km(
   S: npt.NDArray,
   n_fft: int,
   win_len: int,
   hop_length: float,
   window: Literal["hamming", "hanning"],
-) -> npt.NDArray[np.complex128]:
+  win: Optional[npt.NDArray] = None,
+  norm_divisor: Optional[npt.ArrayLike] = None,
+  dtype: Literal["float64", "float32"] = "float64",
+) -> npt.NDArray[np.complexfloating]:
   """Short-Time Fourier Transform (STFT)
+  The frames are strided views into S, i.e., they are not copied before the window is
+  applied. Frames longer than n_fft are truncated and shorter ones are zero-padded by
+  the FFT. If norm_divisor is set, the frames are divided by it before the window is
+  applied, which equals dividing S beforehand without creating a copy of it. The frames
+  are windowed and transformed with the precision of dtype.
   returns amplitude spectrogram with shape (#frames, n_fft // 2 + 1)
   """
   assert window in ["hamming", "hanning"]
+  assert dtype in ["float64", "float32"]
+  hop_length = int(hop_length)
+  assert hop_length > 0
   K = len(S)
-  windowed_frames = np.array(
-    [S[k : k + win_len] for k in np.arange(0, K - win_len, hop_length, int)]
-  )
+  # frames start at 0, hop_length, ... as long as they start before K - win_len
+  n_frames = max(0, math.ceil((K - win_len) / hop_length))
 
-  windowed_frames, adjusted_win_len = adjust_win_len_to_n_fft(windowed_frames, n_fft)
+  if win is None:
+    win = get_window(window, n_fft)
+  assert win.shape == (n_fft,)
 
-  if window == "hamming":
-    win = np.hamming(adjusted_win_len)
+  complex_dtype = get_complex_dtype(dtype)
+  if n_frames == 0:
+    return np.empty((0, get_n_fft_bins(n_fft)), dtype=complex_dtype)
+
+  # only the first n_fft samples of a frame are used
+  frame_len = min(win_len, n_fft)
+  frames = sliding_window_view(S, frame_len)[::hop_length][:n_frames]
+  win = win[:frame_len].astype(dtype, copy=False)
+  # numpy < 2 computes the FFT of single precision input in double precision
+  if dtype == "float64":
+    rfft = np.fft.rfft
   else:
-    assert window == "hanning"
-    win = np.hanning(adjusted_win_len)
+    # scipy.fft is imported on first use because importing it takes long
+    import scipy.fft
+
+    rfft = scipy.fft.rfft
 
-  # STFT
-  X_km = np.fft.rfft(windowed_frames * win, n=n_fft)
+  # STFT, the windowed frames are only materialized for one chunk at a time
+  X_km = np.empty((n_frames, get_n_fft_bins(n_fft)), dtype=complex_dtype)
+  for chunk_start in range(0, n_frames, STFT_CHUNK_SIZE):
+    chunk = slice(chunk_start, chunk_start + STFT_CHUNK_SIZE)
+    chunk_frames = frames[chunk]
+    if norm_divisor is not None and dtype == "float32":
+      chunk_frames = np.divide(chunk_frames, norm_divisor, dtype=dtype)
+    elif norm_divisor is not None:
+      chunk_frames = chunk_frames / norm_divisor
+    X_km[chunk] = rfft(np.multiply(chunk_frames, win, dtype=dtype), n=n_fft)
 
-  assert X_km.shape == (windowed_frames.shape[0], get_n_fft_bins(n_fft))
   return X_km
 
 
 def get_w_n_m(
   sample_rate: int, n_fft: int, M: int, fmin: float, fmax: float
 ) -> npt.NDArray:
-  """Calculates a Mel filter bank"""
+  """Calculates a Mel filter bank
+  The filter banks are memoized, i.e., the returned array is read-only and shared.
+  """
   # M: number of mel bands
   assert sample_rate > 0
   assert M > 0
@@ -71,40 +148,192 @@ def get_w_n_m(
   assert fmin < fmax
   assert fmin >= 0
 
+  return _get_w_n_m(sample_rate, n_fft, M, fmin, fmax)
+
+
+@lru_cache(maxsize=W_N_M_CACHE_SIZE)
+def _get_w_n_m(
+  sample_rate: int, n_fft: int, M: int, fmin: float, fmax: float
+) -> npt.NDArray:
   hz_points = get_hz_points(fmin, fmax, M)
   bins = np.floor((n_fft + 1) * hz_points / sample_rate).astype(int)
-  w_n_m = np.zeros((M, get_n_fft_bins(n_fft)))
+  left, center, right = bins[:-2], bins[1:-1], bins[2:]
 
-  for n in range(1, M + 1):
-    left = bins[n - 1]
-    center = bins[n]
-    right = bins[n + 1]
+  # filter and bin of all weights between the left and the right bin of every filter
+  n_weights = right - left
+  n = np.repeat(np.arange(M), n_weights)
+  offsets = np.arange(n_weights.sum()) - np.repeat(
+    np.cumsum(n_weights) - n_weights, n_weights
+  )
+  k = np.repeat(left, n_weights) + offsets
+  left, center, right = left[n], center[n], right[n]
 
-    w_n_m[n - 1, left:center] = (np.arange(left, center) - left) / (center - left)
-    w_n_m[n - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+  # only the slope the bin belongs to is used, the other one may divide by zero
+  with np.errstate(divide="ignore", invalid="ignore"):
+    weights = np.where(
+      k < center, (k - left) / (center - left), (right - k) / (right - center)
+    )
+  w_n_m = np.zeros((M, get_n_fft_bins(n_fft)))
+  w_n_m[n, k] = weights
 
+  w_n_m.flags.writeable = False
   return w_n_m
 
 
-def get_X_kn(X_km: npt.NDArray[np.complex128], w_n_m: npt.NDArray) -> npt.NDArray:
+def get_w_n_m_bands(w_n_m: npt.NDArray, n_bands: int = W_N_M_N_BANDS) -> W_N_M_Bands:
+  """Splits the Mel filter bank into groups of neighbouring filters
+  Every group contains the weights of the FFT bins between the first and the last
+  nonzero weight of its filters, i.e., most zeros of the filter bank are left out.
+  returns list of (slice of the filters, slice of the FFT bins, weights (bins, filters))
+  """
+  assert n_bands > 0
+  M, n_bins = w_n_m.shape
+  nonzero = w_n_m != 0
+  has_weights = nonzero.any(axis=1)
+  starts = np.where(has_weights, nonzero.argmax(axis=1), n_bins)
+  stops = np.where(has_weights, n_bins - nonzero[:, ::-1].argmax(axis=1), 0)
+
+  bands: W_N_M_Bands = []
+  bounds = np.linspace(0, M, min(n_bands, M) + 1).astype(int)
+  for first, last in zip(bounds[:-1], bounds[1:]):
+    start = int(starts[first:last].min())
+    stop = max(int(stops[first:last].max()), start)
+    weights = np.ascontiguousarray(w_n_m[first:last, start:stop].T)
+    bands.append((slice(first, last), slice(start, stop), weights))
+  return bands
+
+
+def use_w_n_m_bands(
+  w_n_m: npt.NDArray, w_n_m_bands: W_N_M_Bands, n_frames: int
+) -> bool:
+  """Decides whether the banded filter bank is faster than the dense one"""
+  banded_work = sum(weights.size for _, _, weights in w_n_m_bands)
+  return (
+    n_frames >= BANDED_MIN_FRAMES and banded_work <= BANDED_MAX_WORK_RATIO * w_n_m.size
+  )
+
+
+def apply_w_n_m_bands(
+  X_km_energy: npt.NDArray, w_n_m_bands: W_N_M_Bands, out: npt.NDArray
+) -> npt.NDArray:
+  """Multiplies the energy spectrogram with the banded Mel filter bank
+  returns out with shape (#frames, N)
+  """
+  for filters, bins, weights in w_n_m_bands:
+    np.matmul(X_km_energy[:, bins], weights, out=out[:, filters])
+  return out
+
+
+def get_X_kn(
+  X_km: npt.NDArray[np.complexfloating],
+  w_n_m: npt.NDArray,
+  w_n_m_bands: Optional[W_N_M_Bands] = None,
+) -> npt.NDArray:
   """Calculates the energy Mel spectrogram (Bel) of the linear amplitude spectrogram
+  The energy is computed in place for one chunk of frames at a time and multiplied
+  with the filterbank right away, i.e., no array of the size of X_km is created. A
+  single precision spectrogram results in a single precision Mel spectrogram.
+  For many frames, only the bands of FFT bins covered by the filters are multiplied.
   returns Mel spectrogram with shape (#frames, N)
   """
   assert X_km.shape[1] == w_n_m.shape[1], (
     f"Expected {w_n_m.shape[1]} columns, but got {X_km.shape[1]}"
   )
 
-  X_km_mag = amp_to_mag(X_km)
-  X_km_energy = mag_to_energy(X_km_mag)
-  X_kn_energy = X_km_energy @ w_n_m.T
+  energy_dtype: np.dtype
+  if X_km.dtype in [np.complex64, np.float32]:
+    energy_dtype = np.dtype(np.float32)
+    w_n_m = w_n_m.astype(np.float32, copy=False)
+  else:
+    energy_dtype = np.dtype(np.float64)
+
+  if w_n_m_bands is None:
+    w_n_m_bands = get_w_n_m_bands(w_n_m)
+  use_bands = use_w_n_m_bands(w_n_m, w_n_m_bands, min(X_km.shape[0], ENERGY_CHUNK_SIZE))
+  if use_bands and energy_dtype == np.float32:
+    w_n_m_bands = [
+      (filters, bins, weights.astype(np.float32, copy=False))
+      for filters, bins, weights in w_n_m_bands
+    ]
+
+  n_frames = X_km.shape[0]
+  X_kn_energy = np.empty(
+    (n_frames, w_n_m.shape[0]), dtype=np.result_type(energy_dtype, w_n_m)
+  )
+  energy_buffer = np.empty(
+    (min(n_frames, ENERGY_CHUNK_SIZE), X_km.shape[1]), dtype=energy_dtype
+  )
+  for chunk_start in range(0, n_frames, ENERGY_CHUNK_SIZE):
+    chunk = slice(chunk_start, chunk_start + ENERGY_CHUNK_SIZE)
+    X_km_chunk = X_km[chunk]
+    chunk_energy = energy_buffer[: len(X_km_chunk)]
+    np.abs(X_km_chunk, out=chunk_energy)
+    np.square(chunk_energy, out=chunk_energy)
+    if use_bands:
+      apply_w_n_m_bands(chunk_energy, w_n_m_bands, out=X_kn_energy[chunk])
+    else:
+      np.matmul(chunk_energy, w_n_m.T, out=X_kn_energy[chunk])
   X_kn_energy_bel = energy_to_bel(X_kn_energy)
 
   return X_kn_energy_bel
 
 
-def get_MC_X_ik(X_kn: npt.NDArray, M: int) -> npt.NDArray:
+def get_X_kn_from_energy(X_km_energy: npt.NDArray, w_n_m: npt.NDArray) -> npt.NDArray:
+  """Calculates the energy Mel spectrogram (Bel) of a precomputed energy spectrogram
+  X_km_energy is the power spectrogram |X_km|**2, the result equals get_X_kn(X_km).
+  returns Mel spectrogram with shape (#frames, N)
+  """
+  assert X_km_energy.shape[1] == w_n_m.shape[1], (
+    f"Expected {w_n_m.shape[1]} columns, but got {X_km_energy.shape[1]}"
+  )
+
+  if X_km_energy.dtype == np.float32:
+    w_n_m = w_n_m.astype(np.float32, copy=False)
+  w_n_m_bands = get_w_n_m_bands(w_n_m)
+  if use_w_n_m_bands(w_n_m, w_n_m_bands, X_km_energy.shape[0]):
+    X_kn_energy = np.empty(
+      (X_km_energy.shape[0], w_n_m.shape[0]), dtype=np.result_type(X_km_energy, w_n_m)
+    )
+    apply_w_n_m_bands(X_km_energy, w_n_m_bands, out=X_kn_energy)
+  else:
+    X_kn_energy = X_km_energy @ w_n_m.T
+  X_kn_energy_bel = energy_to_bel(X_kn_energy)
+
+  return X_kn_energy_bel
+
+
+def get_cos_terms(M: int) -> npt.NDArray:
+  """Calculates the cosine terms of the Mel cepstrum transformation
+  The cosine terms are memoized per M, i.e., the returned array is read-only and shared.
+  returns matrix with shape (M, M)
+  """
+  assert isinstance(M, int) and M > 0, "M must be a positive integer"
+  return _get_cos_terms(M)
+
+
+@lru_cache(maxsize=COS_TERMS_CACHE_SIZE)
+def _get_cos_terms(M: int) -> npt.NDArray:
+  n = np.arange(1, M + 1)
+  i = n.reshape(-1, 1)  # Reshape for broadcasting
+  cos_terms: npt.NDArray = np.cos(i * (n - 0.5) * np.pi / M)
+  cos_terms.flags.writeable = False
+  return cos_terms
+
+
+def get_MC_X_ik(
+  X_kn: npt.NDArray,
+  M: int,
+  cos_terms: Optional[npt.NDArray] = None,
+  s: int = 0,
+  D: Optional[int] = None,
+  dct_backend: Literal["auto", "matmul", "fft"] = "auto",
+) -> npt.NDArray:
   """Calculates the Mel cepstrum coefficients of the Mel spectrogram
-  returns Mel cepstrum with shape (M, #frames)
+  Only the coefficients s..D-1 are calculated, by default all M coefficients. They are
+  calculated with the cosine terms ("matmul") or with a DCT-II ("fft"), which is faster
+  for many coefficients; "auto" selects the DCT for at least DCT_FFT_MIN_ROWS.
+  A single precision Mel spectrogram results in single precision coefficients.
+  returns Mel cepstrum with shape (D - s, #frames)
   """
   # K: total frame count
   # M: number of cepstral coefficients
@@ -113,16 +342,47 @@ def get_MC_X_ik(X_kn: npt.NDArray, M: int) -> npt.NDArray:
   assert X_kn.shape[1] >= M, (
     "M must be less than or equal to the number of mel bands (columns) in X_kn"
   )
+  if D is None:
+    D = M
+  assert 0 <= s < D <= M
+  assert dct_backend in ["auto", "matmul", "fft"]
 
-  n = np.arange(1, M + 1)
-  i = n.reshape(-1, 1)  # Reshape for broadcasting
-  cos_terms = np.cos(i * (n - 0.5) * np.pi / M)  # Precompute cosine terms
+  if dct_backend == "auto":
+    dct_backend = "fft" if D - s >= DCT_FFT_MIN_ROWS else "matmul"
+
+  if dct_backend == "fft":
+    return get_MC_X_ik_using_dct(X_kn, M, s, D)
 
-  MC_X_ik: npt.NDArray = cos_terms @ X_kn[:, :M].T
+  if cos_terms is None:
+    cos_terms = get_cos_terms(M)
+  assert cos_terms.shape == (M, M)
+  if X_kn.dtype == np.float32:
+    cos_terms = cos_terms.astype(np.float32, copy=False)
+
+  MC_X_ik: npt.NDArray = cos_terms[s:D] @ X_kn[:, :M].T
 
   return MC_X_ik
 
 
+def get_MC_X_ik_using_dct(X_kn: npt.NDArray, M: int, s: int, D: int) -> npt.NDArray:
+  """Calculates the Mel cepstrum coefficients s..D-1 with a DCT-II
+  returns Mel cepstrum with shape (D - s, #frames)
+  """
+  # the DCT-II returns y_k = 2 * sum_n x_n * cos(pi * k * (2n + 1) / (2M)) for k < M,
+  # i.e., coefficient i (starting at 0) is y_(i+1) / 2 and the last coefficient is zero
+  import scipy.fft
+
+  X_kn_dct = scipy.fft.dct(X_kn[:, :M], type=2, axis=1)
+  n_rows = max(min(D, M - 1) - s, 0)
+  # the coefficients are calculated per frame and returned as a transposed view to avoid
+  # copying them into coefficient-major order
+  MC_X_ik_T = np.empty((X_kn.shape[0], D - s), dtype=X_kn_dct.dtype)
+  np.multiply(X_kn_dct[:, s + 1 : s + 1 + n_rows], 0.5, out=MC_X_ik_T[:, :n_rows])
+  MC_X_ik_T[:, n_rows:] = 0
+  MC_X_ik: npt.NDArray = MC_X_ik_T.T
+  return MC_X_ik
+
+
 def get_MCD_k(
   MC_X_ik: npt.NDArray, MC_Y_ik: npt.NDArray, s: int, D: int
 ) -> npt.NDArray:
@@ -134,9 +394,32 @@ def get_MCD_k(
   return MCD_k
 
 
+def get_MCD_k_along_path(
+  MC_X_ik: npt.NDArray, MC_Y_ik: npt.NDArray, path: npt.NDArray, s: int, D: int
+) -> npt.NDArray:
+  """Calculates the Mel Cepstral Distance (MCD) for each step of a warping path
+  The frames are compared in chunks of steps, i.e., the MFCCs are not stretched along
+  the whole path. The result equals get_MCD_k of the stretched MFCCs.
+  returns MCD_k with shape (#steps,)
+  """
+  assert MC_X_ik.shape[0] == MC_Y_ik.shape[0]
+  M = MC_X_ik.shape[0]
+  assert 0 <= s < D <= M
+  assert path.ndim == 2 and path.shape[1] == 2
+
+  MCD_k = np.empty(len(path), dtype=np.result_type(MC_X_ik, MC_Y_ik, np.float32))
+  for chunk_start in range(0, len(path), PATH_CHUNK_SIZE):
+    steps = path[chunk_start : chunk_start + PATH_CHUNK_SIZE]
+    MCD_k[chunk_start : chunk_start + len(steps)] = np.linalg.norm(
+      MC_X_ik[s:D, steps[:, 0]] - MC_Y_ik[s:D, steps[:, 1]], axis=0
+    )
+  return MCD_k
+
+
 def get_average_MCD(MCD_k: npt.NDArray) -> float:
   """Calculates the average Mel Cepstral Distance (MCD) over all frames"""
   assert len(MCD_k.shape) == 1, f"Expected 1D array, but got {MCD_k.shape}"
   assert np.all(MCD_k >= 0), f"Negative values in MCD_k: {MCD_k}"
-  mean_mcd_over_all_k: float = np.mean(MCD_k)
+  # accumulates in double precision also for single precision MCD_k
+  mean_mcd_over_all_k: float = np.mean(MCD_k, dtype=np.float64)
   return mean_mcd_over_all_k
@@ -0,0 +1,223 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+# maximum number of (frame, frame) cells for which the local costs are computed at once
+COST_CHUNK_SIZE = 2**16
+
+
+def get_euclidean_costs(
+  seq_1: npt.NDArray, seq_2: npt.NDArray, rows: npt.NDArray, cols: npt.NDArray
+) -> npt.NDArray:
+  """Calculates the Euclidean distance between the frames seq_1[rows] and seq_2[cols]
+  seq_1 and seq_2 have shape (#frames, #features)
+  """
+  assert len(rows) == len(cols)
+  costs = np.empty(len(rows), dtype=np.float64)
+  for chunk_start in range(0, len(rows), COST_CHUNK_SIZE):
+    chunk = slice(chunk_start, chunk_start + COST_CHUNK_SIZE)
+    diff = seq_1[rows[chunk]] - seq_2[cols[chunk]]
+    costs[chunk] = np.sqrt(np.sum(diff**2, axis=1))
+  return costs
+
+
+def dtw_in_window(
+  seq_1: npt.NDArray,
+  seq_2: npt.NDArray,
+  starts: npt.NDArray,
+  stops: npt.NDArray,
+) -> Tuple[float, npt.NDArray, npt.NDArray]:
+  """Dynamic Time Warping restricted to a window
+  Row i of the cost matrix is only evaluated for the columns starts[i]:stops[i]. Both
+  bounds must be non-decreasing and consecutive rows must be connected. The local costs
+  of all cells are computed in bulk and the accumulated costs are filled anti-diagonal
+  by anti-diagonal. Ties are resolved in the order (i-1, j), (i, j-1), (i-1, j-1).
+  returns the accumulated cost, the warping path with shape (#steps, 2) and the local
+  costs along the path with shape (#steps,)
+  """
+  len_1 = len(seq_1)
+  len_2 = len(seq_2)
+  assert len(starts) == len(stops) == len_1
+  assert starts[0] == 0 and stops[-1] == len_2
+  assert np.all(starts < stops)
+
+  lengths = stops - starts
+  offsets = np.zeros(len_1 + 1, dtype=np.int64)
+  np.cumsum(lengths, out=offsets[1:])
+  n_cells = int(offsets[-1])
+
+  rows = np.repeat(np.arange(len_1), lengths)
+  cols = np.arange(n_cells) - np.repeat(offsets[:-1] - starts, lengths)
+  costs = get_euclidean_costs(seq_1, seq_2, rows, cols)
+
+  # last element is a sentinel for cells outside of the window
+  acc = np.full(n_cells + 1, np.inf)
+  steps = np.zeros(n_cells, dtype=np.int8)
+  acc[0] = costs[0]
+
+  row_idx = np.arange(len_1)
+  # row i contains a cell of anti-diagonal d if i + starts[i] <= d < i + stops[i]
+  diag_first_row = np.searchsorted(row_idx + stops, np.arange(len_1 + len_2), "right")
+  diag_last_row = np.searchsorted(row_idx + starts, np.arange(len_1 + len_2), "right")
+
+  def get_cell_index(i: npt.NDArray, j: npt.NDArray) -> npt.NDArray:
+    i_clipped = np.maximum(i, 0)
+    inside = (i >= 0) & (j >= starts[i_clipped]) & (j < stops[i_clipped])
+    return np.where(inside, offsets[i_clipped] + j - starts[i_clipped], n_cells)
+
+  for d in range(1, len_1 + len_2 - 1):
+    i = np.arange(diag_first_row[d], diag_last_row[d])
+    j = d - i
+    cells = offsets[i] + j - starts[i]
+    candidates = np.stack(
+      (
+        acc[get_cell_index(i - 1, j)],
+        acc[get_cell_index(i, j - 1)],
+        acc[get_cell_index(i - 1, j - 1)],
+      )
+    )
+    candidates += costs[cells]
+    best = np.argmin(candidates, axis=0)
+    acc[cells] = candidates[best, np.arange(len(cells))]
+    steps[cells] = best
+
+  path = []
+  row, col = len_1 - 1, len_2 - 1
+  while True:
+    path.append((row, col))
+    if row == 0 and col == 0:
+      break
+    step = steps[offsets[row] + col - starts[row]]
+    if step == 0:
+      row -= 1
+    elif step == 1:
+      col -= 1
+    else:
+      row -= 1
+      col -= 1
+  path.reverse()
+  path_np = np.array(path, dtype=np.int64)
+
+  distance = float(acc[n_cells - 1])
+  path_costs = costs[offsets[path_np[:, 0]] + path_np[:, 1] - starts[path_np[:, 0]]]
+  return distance, path_np, path_costs
+
+
+def get_full_window(len_1: int, len_2: int) -> Tuple[npt.NDArray, npt.NDArray]:
+  starts = np.zeros(len_1, dtype=np.int64)
+  stops = np.full(len_1, len_2, dtype=np.int64)
+  return starts, stops
+
+
+def get_sakoe_chiba_window(
+  len_1: int, len_2: int, radius: int
+) -> Tuple[npt.NDArray, npt.NDArray]:
+  """Calculates a band of `radius` frames around the (scaled) diagonal"""
+  assert radius >= 0
+  slope = (len_2 - 1) / max(len_1 - 1, 1)
+  centers = np.arange(len_1) * slope
+  starts = np.clip(np.ceil(centers - radius), 0, len_2 - 1).astype(np.int64)
+  stops = np.clip(np.floor(centers + radius) + 1, 1, len_2).astype(np.int64)
+  # ensure that consecutive rows are connected if the band is steeper than the radius
+  stops[:-1] = np.maximum(stops[:-1], starts[1:])
+  starts[0] = 0
+  stops[-1] = len_2
+  return starts, stops
+
+
+def reduce_by_half(seq: npt.NDArray) -> npt.NDArray:
+  """Averages each two consecutive frames, a trailing odd frame is dropped"""
+  end = len(seq) - len(seq) % 2
+  reduced: npt.NDArray = (seq[0:end:2] + seq[1:end:2]) / 2
+  return reduced
+
+
+def expand_window(
+  path: npt.NDArray, len_1: int, len_2: int, radius: int
+) -> Tuple[npt.NDArray, npt.NDArray]:
+  """Projects a path of the half resolution onto the full resolution and widens it by
+  `radius` cells in each direction (same window as the one used by fastdtw)
+  """
+  n_rows_low = int(path[-1, 0]) + 1
+  first_cols_low = np.full(n_rows_low, len_2, dtype=np.int64)
+  last_cols_low = np.zeros(n_rows_low, dtype=np.int64)
+  np.minimum.at(first_cols_low, path[:, 0], path[:, 1])
+  np.maximum.at(last_cols_low, path[:, 0], path[:, 1])
+
+  rows_low = np.arange(len_1) // 2
+  # the path is monotonic, hence the extreme columns within the neighbouring rows
+  # are located in the first and last of these rows
+  first_neighbour = np.clip(rows_low - radius, 0, n_rows_low - 1)
+  last_neighbour = np.clip(rows_low + radius, 0, n_rows_low - 1)
+  starts = np.maximum(2 * (first_cols_low[first_neighbour] - radius), 0)
+  stops = np.minimum(2 * (last_cols_low[last_neighbour] + radius) + 2, len_2)
+  return starts, stops
+
+
+def dtw_multires(
+  seq_1: npt.NDArray, seq_2: npt.NDArray, radius: int
+) -> Tuple[float, npt.NDArray]:
+  """FastDTW (Salvador & Chan, 2007)
+  The path found at half resolution is projected to the full resolution and refined
+  within a window of `radius` cells. Results match fastdtw.fastdtw with the Euclidean
+  distance.
+  seq_1 and seq_2 have shape (#frames, #features)
+  """
+  distance, path, _ = dtw_multires_with_path_costs(seq_1, seq_2, radius)
+  return distance, path
+
+
+def dtw_multires_with_path_costs(
+  seq_1: npt.NDArray, seq_2: npt.NDArray, radius: int
+) -> Tuple[float, npt.NDArray, npt.NDArray]:
+  """Same as dtw_multires but also returns the Euclidean distances of the frames along
+  the path with shape (#steps,)
+  """
+  assert radius >= 1
+  # single precision sequences are kept, the accumulated costs are double precision
+  dtype = np.result_type(seq_1, seq_2, np.float32)
+  seq_1 = np.asarray(seq_1, dtype=dtype)
+  seq_2 = np.asarray(seq_2, dtype=dtype)
+  return _dtw_multires(seq_1, seq_2, radius)
+
+
+def _dtw_multires(
+  seq_1: npt.NDArray, seq_2: npt.NDArray, radius: int
+) -> Tuple[float, npt.NDArray, npt.NDArray]:
+  min_len = radius + 2
+  if len(seq_1) < min_len or len(seq_2) < min_len:
+    starts, stops = get_full_window(len(seq_1), len(seq_2))
+    return dtw_in_window(seq_1, seq_2, starts, stops)
+  _, path_low, _ = _dtw_multires(reduce_by_half(seq_1), reduce_by_half(seq_2), radius)
+  starts, stops = expand_window(path_low, len(seq_1), len(seq_2), radius)
+  return dtw_in_window(seq_1, seq_2, starts, stops)
+
+
+def dtw_sakoe_chiba(
+  seq_1: npt.NDArray, seq_2: npt.NDArray, radius: Optional[int]
+) -> Tuple[float, npt.NDArray]:
+  """DTW restricted to a Sakoe-Chiba band of `radius` frames around the diagonal
+  If radius is None, the full cost matrix is evaluated.
+  seq_1 and seq_2 have shape (#frames, #features)
+  """
+  distance, path, _ = dtw_sakoe_chiba_with_path_costs(seq_1, seq_2, radius)
+  return distance, path
+
+
+def dtw_sakoe_chiba_with_path_costs(
+  seq_1: npt.NDArray, seq_2: npt.NDArray, radius: Optional[int]
+) -> Tuple[float, npt.NDArray, npt.NDArray]:
+  """Same as dtw_sakoe_chiba but also returns the Euclidean distances of the frames
+  along the path with shape (#steps,)
+  """
+  assert radius is None or radius >= 0
+  # single precision sequences are kept, the accumulated costs are double precision
+  dtype = np.result_type(seq_1, seq_2, np.float32)
+  seq_1 = np.asarray(seq_1, dtype=dtype)
+  seq_2 = np.asarray(seq_2, dtype=dtype)
+  if radius is None:
+    starts, stops = get_full_window(len(seq_1), len(seq_2))
+  else:
+    starts, stops = get_sakoe_chiba_window(len(seq_1), len(seq_2), radius)
+  return dtw_in_window(seq_1, seq_2, starts, stops)
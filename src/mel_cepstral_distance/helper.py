@@ -1,23 +1,59 @@
-from typing import Union
+import math
+from pathlib import Path
+from typing import Literal, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import resample
 
+# scipy.io and scipy.signal are imported on first use because importing them takes
+# most of the time of importing this package
 
-def amp_to_mag(X_km: npt.NDArray[np.complex128]) -> npt.NDArray:
-  return np.abs(X_km)
+
+def amp_to_mag(X_km: npt.NDArray[np.complexfloating]) -> npt.NDArray:
+  X_km_mag: npt.NDArray = np.abs(X_km)
+  return X_km_mag
 
 
 def mag_to_energy(X_km: npt.NDArray) -> npt.NDArray:
   return X_km**2
 
 
-def resample_if_necessary(audio: npt.NDArray, sr: int, target_sr: int) -> npt.NDArray:
+def read_wav(audio: Union[Path, str], mmap: bool = False) -> Tuple[int, npt.NDArray]:
+  """Reads a WAV file with scipy.io.wavfile
+  returns sample rate and signal
+  """
+  from scipy.io import wavfile
+
+  sr: int
+  signal: npt.NDArray
+  sr, signal = wavfile.read(audio, mmap=mmap)
+  return sr, signal
+
+
+def resample_if_necessary(
+  audio: npt.NDArray,
+  sr: int,
+  target_sr: int,
+  method: Literal["fft", "polyphase"] = "fft",
+) -> npt.NDArray:
   if sr == target_sr:
     return audio
+  from scipy.signal import resample, resample_poly
+
   target_num_samples = int(len(audio) * target_sr / sr)
-  resampled_audio: npt.NDArray = resample(
+  resampled_audio: npt.NDArray
+  if method == "polyphase":
+    # smallest integer factors with up / down == target_sr / sr
+    ratio_divisor = math.gcd(sr, target_sr)
+    up = target_sr // ratio_divisor
+    down = sr // ratio_divisor
+    resampled_audio = resample_poly(audio, up, down, axis=0)
+    # resample_poly returns ceil(len(audio) * up / down) samples, the last one is
+    # dropped if necessary to get the same number of samples as with "fft"
+    return resampled_audio[:target_num_samples]
+
+  assert method == "fft"
+  resampled_audio = resample(
     audio, target_num_samples, axis=0, window=None, domain="time"
   )
 
@@ -36,6 +72,11 @@ def get_n_fft_bins(n_fft: int) -> int:
   return n_fft // 2 + 1
 
 
+def get_complex_dtype(dtype: npt.DTypeLike) -> np.dtype:
+  """Returns the complex dtype with the same precision as the floating point dtype"""
+  return np.result_type(dtype, np.complex64)
+
+
 def norm_audio_signal(audio: npt.NDArray) -> npt.NDArray:
   audio = audio / np.max(np.abs(audio))
   return audio
@@ -45,7 +86,7 @@ def get_hz_points(fmin: float, fmax: float, M: int) -> npt.NDArray:
   mel_low = hz_to_mel(fmin)
   mel_high = hz_to_mel(fmax)
   mel_points = np.linspace(mel_low, mel_high, M + 2)
-  hz_points = np.array([mel_to_hz(mel_point) for mel_point in mel_points])
+  hz_points: npt.NDArray = np.asarray(mel_to_hz(mel_points))
   return hz_points
 
 
@@ -62,5 +103,9 @@ def mel_to_hz(mel: Union[float, npt.NDArray]) -> Union[float, npt.NDArray]:
 def energy_to_bel(energy: npt.NDArray) -> npt.NDArray:
   """Converts energy to bels
   """
-  result: npt.NDArray = np.log10(energy + np.finfo(float).eps)
+  eps: np.floating = np.finfo(float).eps
+  if energy.dtype == np.float32:
+    # keeps single precision energies in single precision
+    eps = np.float32(eps)
+  result: npt.NDArray = np.log10(energy + eps)
   return result
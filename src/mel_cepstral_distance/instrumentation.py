@@ -0,0 +1,186 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+H = TypeVar("H", bound=Callable[["StageEvent"], None])
+
+# hooks that are called after every stage, the stages are only measured if there is one
+_hooks: List[Callable[["StageEvent"], None]] = []
+
+
+@dataclass(frozen=True)
+class StageEvent:
+  """
+  Measurement of one stage of a comparison that is passed to the hooks registered
+  with `add_stage_hook` or `instrument`.
+
+  Attributes
+  ----------
+  stage : str
+      Name of the stage: "read" (reading a WAV file), "resampling",
+      "silence_removal", "stft", "filterbank" (Mel spectrogram), "dct" (MFCCs), "dtw"
+      (DTW warping path), "padding" (alignment with zero-padding) or "distance" (MCD
+      of the aligned frames).
+  duration : float
+      Duration of the stage in seconds.
+  input_shapes : Tuple[Tuple[int, ...], ...]
+      Shapes of the arrays the stage was called with.
+  nbytes : int
+      Number of bytes of the arrays the stage returned.
+  """
+
+  stage: str
+  duration: float
+  input_shapes: Tuple[Tuple[int, ...], ...]
+  nbytes: int
+
+
+def add_stage_hook(hook: Callable[[StageEvent], None]) -> None:
+  """
+  Registers a function that is called with a `StageEvent` after every stage of the
+  `compare_*` functions, `pairwise_mcd` and `MCDExtractor.compare`. As long as no
+  hook is registered, the stages are not measured.
+
+  Hooks are called in the calling process only, i.e., not for the comparisons of
+  worker processes if `n_jobs` is > 1.
+
+  Parameters
+  ----------
+  hook : Callable[[StageEvent], None]
+      Function to call.
+  """
+  _hooks.append(hook)
+
+
+def remove_stage_hook(hook: Callable[[StageEvent], None]) -> None:
+  """
+  Unregisters a function that was registered with `add_stage_hook`.
+
+  Parameters
+  ----------
+  hook : Callable[[StageEvent], None]
+      Function to unregister.
+
+  Raises
+  ------
+  ValueError
+      If `hook` is not registered.
+  """
+  if hook not in _hooks:
+    raise ValueError("hook is not registered")
+  _hooks.remove(hook)
+
+
+@contextmanager
+def instrument(hook: H) -> Iterator[H]:
+  """
+  Context manager that registers a hook with `add_stage_hook` while it is entered,
+  e.g., `with instrument(StageTimingCollector()) as collector: ...`.
+
+  Parameters
+  ----------
+  hook : Callable[[StageEvent], None]
+      Function to call after every stage.
+
+  Yields
+  ------
+  Callable[[StageEvent], None]
+      `hook`.
+  """
+  add_stage_hook(hook)
+  try:
+    yield hook
+  finally:
+    remove_stage_hook(hook)
+
+
+def run_stage(
+  stage: str, method: Callable[..., T], /, *args: object, **kwargs: object
+) -> T:
+  """Calls method with args and kwargs and passes its measurement to the hooks"""
+  if not _hooks:
+    return method(*args, **kwargs)
+
+  start = time.perf_counter()
+  result = method(*args, **kwargs)
+  duration = time.perf_counter() - start
+  input_shapes = tuple(arg.shape for arg in args if isinstance(arg, np.ndarray))
+  outputs = result if isinstance(result, tuple) else (result,)
+  nbytes = sum(output.nbytes for output in outputs if isinstance(output, np.ndarray))
+  event = StageEvent(stage, duration, input_shapes, nbytes)
+  for hook in tuple(_hooks):
+    hook(event)
+  return result
+
+
+class StageTimingCollector:
+  """
+  Hook that collects the durations of the stages of many comparisons, e.g., of a
+  batch, to find the stages that take the most time.
+
+  Attributes
+  ----------
+  durations : Dict[str, List[float]]
+      Durations in seconds of every stage in the order in which they were measured.
+  nbytes : Dict[str, List[int]]
+      Number of bytes of the arrays returned by every stage.
+  """
+
+  def __init__(self) -> None:
+    self.durations: Dict[str, List[float]] = {}
+    self.nbytes: Dict[str, List[int]] = {}
+
+  def __call__(self, event: StageEvent) -> None:
+    self.durations.setdefault(event.stage, []).append(event.duration)
+    self.nbytes.setdefault(event.stage, []).append(event.nbytes)
+
+  def reset(self) -> None:
+    """Removes all collected measurements."""
+    self.durations.clear()
+    self.nbytes.clear()
+
+  def summary(
+    self, percentiles: Sequence[float] = (50, 90, 99)
+  ) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregates the collected measurements per stage.
+
+    Parameters
+    ----------
+    percentiles : Sequence[float], optional
+        Percentiles of the durations to calculate. Must be between 0 and 100.
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        Statistics of every stage: "count" (number of measurements), "total", "mean",
+        "max" and the percentiles, e.g., "p50", of the durations in seconds and
+        "max_nbytes" (largest number of bytes returned). The stages are sorted by
+        their total duration in descending order.
+
+    Raises
+    ------
+    ValueError
+        If any percentile is not between 0 and 100.
+    """
+    if not all(0 <= percentile <= 100 for percentile in percentiles):
+      raise ValueError("percentiles must be between 0 and 100")
+
+    summary: Dict[str, Dict[str, float]] = {}
+    for stage, stage_durations in self.durations.items():
+      durations = np.array(stage_durations)
+      stats = {
+        "count": len(durations),
+        "total": float(durations.sum()),
+        "mean": float(durations.mean()),
+        "max": float(durations.max()),
+      }
+      for percentile in percentiles:
+        stats[f"p{percentile:g}"] = float(np.percentile(durations, percentile))
+      stats["max_nbytes"] = max(self.nbytes[stage])
+      summary[stage] = stats
+    return dict(sorted(summary.items(), key=lambda item: -item[1]["total"]))
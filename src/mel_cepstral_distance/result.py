@@ -0,0 +1,59 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True, eq=False)
+class MCDResult:
+  """
+  Detailed result of comparing two audios, spectrograms or MFCCs. It is returned by
+  the `compare_*` functions if `return_details` is True.
+
+  Attributes
+  ----------
+  mcd : float
+      Mean MCD over all selected coefficients. nan if either input is empty or becomes
+      empty due to silence removal.
+  penalty : float
+      Alignment penalty. nan if `mcd` is nan.
+  MCD_k : numpy.ndarray
+      MCD of every aligned frame with shape (frames,). For DTW, the frames are the
+      steps of `path`, for zero-padding the frames of the padded MFCCs. `mcd` is their
+      mean. Empty if `mcd` is nan.
+  path : numpy.ndarray, optional
+      DTW warping path with shape (steps, 2). Every step contains the indices of the
+      compared frames of A and B after silence removal. None if the inputs were
+      aligned with zero-padding.
+  dtw_cost : float, optional
+      Accumulated cost of `path`, i.e., the sum of the Euclidean distances of the
+      frames along it at the stage of `align_target`. None if the inputs were aligned
+      with zero-padding.
+  timings : Dict[str, float]
+      Durations in seconds of the stages that were run: "features" (feature
+      extraction and silence removal), "alignment" (DTW or zero-padding) and
+      "distance" (MCD of the aligned frames).
+  """
+
+  mcd: float
+  penalty: float
+  MCD_k: npt.NDArray
+  path: Optional[npt.NDArray]
+  dtw_cost: Optional[float]
+  timings: Dict[str, float]
+
+
+def get_nan_result(timings: Dict[str, float]) -> MCDResult:
+  """Creates the result of a comparison whose inputs are or became empty"""
+  return MCDResult(np.nan, np.nan, np.empty(0), None, None, timings)
+
+
+def add_duration(timings: Dict[str, float], stage: str, start: float) -> float:
+  """Adds the time passed since `start` to the duration of a stage
+  returns the current time, which is the start of the next stage
+  """
+  now = time.perf_counter()
+  timings[stage] = timings.get(stage, 0.0) + now - start
+  return now
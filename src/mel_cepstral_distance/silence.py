@@ -4,44 +4,67 @@ import numpy.typing as npt
 from mel_cepstral_distance.helper import amp_to_mag
 
 
-def remove_silence_rms(
-  audio_signal: npt.NDArray, threshold_rms: float, min_silence_samples: int
-) -> npt.NDArray:
-  assert threshold_rms >= 0
-  if threshold_rms == 0:
-    return audio_signal
-  non_silent_audio = []
-
-  start = 0
+def get_loudness_vals_rms(
+  audio_signal: npt.NDArray, min_silence_samples: int
+) -> npt.NDArray[np.float32]:
+  """Calculates the RMS of consecutive blocks of min_silence_samples samples
+  The last block contains the remaining samples and can therefore be shorter.
+  returns RMS values with shape (ceil(#samples / min_silence_samples),)
+  """
+  assert min_silence_samples > 0
   # to be able to calculate power of two convert to float
   # otherwise it will be nan for large numbers
   audio_signal = audio_signal.astype(np.float32)
+  n_full_blocks = len(audio_signal) // min_silence_samples
+  full_blocks_end = n_full_blocks * min_silence_samples
 
-  while start < len(audio_signal):
-    end = min(start + min_silence_samples, len(audio_signal))
-    segment = audio_signal[start:end]
-    # segment als float
+  blocks = audio_signal[:full_blocks_end].reshape(n_full_blocks, min_silence_samples)
+  mean_squares = np.mean(blocks**2, axis=1)
+  if full_blocks_end < len(audio_signal):
+    tail = audio_signal[full_blocks_end:]
+    mean_squares = np.append(mean_squares, np.mean(tail**2))
 
-    rms_value = np.sqrt(np.mean(segment**2))
-    assert rms_value >= 0
+  rms_values: npt.NDArray[np.float32] = np.sqrt(mean_squares)
+  return rms_values
 
-    if rms_value >= threshold_rms:
-      non_silent_audio.append(segment)
 
-    start = end
+def detect_non_silence_rms(
+  audio_signal: npt.NDArray, threshold_rms: float, min_silence_samples: int
+) -> npt.NDArray[np.bool_]:
+  """Detects the samples of all blocks of min_silence_samples samples whose RMS is
+  greater than or equal to threshold_rms
+  returns mask with shape (#samples,)
+  """
+  assert threshold_rms >= 0
+  if threshold_rms == 0:
+    return np.ones(len(audio_signal), dtype=bool)
+  rms_values = get_loudness_vals_rms(audio_signal, min_silence_samples)
+  assert np.all(rms_values >= 0)
+  non_silent_blocks = rms_values >= threshold_rms
+  non_silent_samples = np.repeat(non_silent_blocks, min_silence_samples)
+  return non_silent_samples[: len(audio_signal)]
+
 
-  if non_silent_audio:
-    return np.concatenate(non_silent_audio)
-  return np.array([], dtype=np.float32)
+def remove_silence_rms(
+  audio_signal: npt.NDArray, threshold_rms: float, min_silence_samples: int
+) -> npt.NDArray:
+  assert threshold_rms >= 0
+  if threshold_rms == 0:
+    return audio_signal
+  non_silent_samples = detect_non_silence_rms(
+    audio_signal, threshold_rms, min_silence_samples
+  )
+  non_silent_audio: npt.NDArray = audio_signal.astype(np.float32)[non_silent_samples]
+  return non_silent_audio
 
 
-def get_loudness_vals_X_km(X_km: npt.NDArray[np.complex128]) -> npt.NDArray:
+def get_loudness_vals_X_km(X_km: npt.NDArray[np.complexfloating]) -> npt.NDArray:
   mel_energy: npt.NDArray = np.mean(amp_to_mag(X_km), axis=1)
   return mel_energy
 
 
 def detect_non_silence_in_X_km(
-  X_km: npt.NDArray[np.complex128], silence_threshold: float
+  X_km: npt.NDArray[np.complexfloating], silence_threshold: float
 ) -> npt.NDArray:
   mel_energy = get_loudness_vals_X_km(X_km)
   non_silent_frame_indices = np.where(mel_energy >= silence_threshold)[0]
@@ -49,8 +72,8 @@ def detect_non_silence_in_X_km(
 
 
 def remove_silence_X_km(
-  X_km: npt.NDArray[np.complex128], silence_threshold: float
-) -> npt.NDArray[np.complex128]:
+  X_km: npt.NDArray[np.complexfloating], silence_threshold: float
+) -> npt.NDArray[np.complexfloating]:
   frames = detect_non_silence_in_X_km(X_km, silence_threshold)
   X_km = X_km[frames, :]
   return X_km
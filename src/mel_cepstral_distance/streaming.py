@@ -0,0 +1,123 @@
+import math
+from typing import Iterable, Iterator, Literal, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from mel_cepstral_distance.computation import get_MCD_k, get_X_km
+
+
+def iter_signal_blocks(signal: npt.NDArray, block_size: int) -> Iterator[npt.NDArray]:
+  """Yields consecutive blocks of block_size samples, the last block can be shorter
+  Each block is copied, i.e., only one block of a memory-mapped signal is loaded at a
+  time.
+  """
+  assert block_size > 0
+  for start in range(0, len(signal), block_size):
+    yield np.array(signal[start : start + block_size])
+
+
+def get_max_abs(signal: npt.NDArray, block_size: int) -> np.generic:
+  """Calculates np.max(np.abs(signal)) block by block"""
+  assert len(signal) > 0
+  max_abs: np.generic = max(
+    np.max(np.abs(block)) for block in iter_signal_blocks(signal, block_size)
+  )
+  return max_abs
+
+
+def iter_X_km(
+  blocks: Iterable[npt.NDArray],
+  n_fft: int,
+  win_len: int,
+  hop_length: int,
+  window: Literal["hamming", "hanning"],
+  win: npt.NDArray,
+  dtype: Literal["float64", "float32"] = "float64",
+) -> Iterator[npt.NDArray[np.complexfloating]]:
+  """Streaming Short-Time Fourier Transform (STFT)
+  Yields the frames of get_X_km applied to the concatenation of all blocks. A frame is
+  computed as soon as the sample following it has been read, the samples of the frames
+  that are not complete yet are carried over to the next block.
+  yields amplitude spectrograms with shape (#frames, n_fft // 2 + 1)
+  """
+  assert hop_length > 0
+  carry: npt.NDArray = np.empty(0)
+  # index of the first sample of carry and of the next frame in the whole signal
+  carry_start = 0
+  next_frame_start = 0
+  for block in blocks:
+    buffer = block if len(carry) == 0 else np.concatenate((carry, block))
+    offset = next_frame_start - carry_start
+    # frames start before len(buffer) - win_len
+    n_frames = max(0, math.ceil((len(buffer) - offset - win_len) / hop_length))
+    if n_frames > 0:
+      yield get_X_km(
+        buffer[offset:], n_fft, win_len, hop_length, window, win, dtype=dtype
+      )
+      next_frame_start += n_frames * hop_length
+    # if the hop is longer than the window, the next frame can start after the buffer
+    keep_from = min(next_frame_start - carry_start, len(buffer))
+    carry = buffer[keep_from:]
+    carry_start += keep_from
+
+
+def get_MCD_k_sum_of_padded_streams(
+  MC_X_ik_chunks: Iterable[npt.NDArray],
+  MC_Y_ik_chunks: Iterable[npt.NDArray],
+  s: int,
+  D: int,
+  MC_pad_i: npt.NDArray,
+) -> Tuple[float, int, int]:
+  """Sums the Mel Cepstral Distance (MCD) of the frames of two MFCC streams
+  The frames are aligned by their position, the shorter stream is padded with the
+  frame MC_pad_i. At most one chunk per stream is held in memory.
+  returns the sum of MCD_k and the number of frames of both streams
+  """
+  assert MC_pad_i.ndim == 1
+  M = len(MC_pad_i)
+  chunks_X = iter(MC_X_ik_chunks)
+  chunks_Y = iter(MC_Y_ik_chunks)
+  pending_X: npt.NDArray = np.empty((M, 0))
+  pending_Y: npt.NDArray = np.empty((M, 0))
+  exhausted_X = False
+  exhausted_Y = False
+  n_frames_X = 0
+  n_frames_Y = 0
+  MCD_k_sum = 0.0
+
+  while True:
+    while pending_X.shape[1] == 0 and not exhausted_X:
+      chunk = next(chunks_X, None)
+      if chunk is None:
+        exhausted_X = True
+      else:
+        assert chunk.shape[0] == M
+        pending_X = chunk
+        n_frames_X += chunk.shape[1]
+
+    while pending_Y.shape[1] == 0 and not exhausted_Y:
+      chunk = next(chunks_Y, None)
+      if chunk is None:
+        exhausted_Y = True
+      else:
+        assert chunk.shape[0] == M
+        pending_Y = chunk
+        n_frames_Y += chunk.shape[1]
+
+    if exhausted_X and pending_X.shape[1] == 0:
+      pending_X = np.repeat(MC_pad_i[:, np.newaxis], pending_Y.shape[1], axis=1)
+    if exhausted_Y and pending_Y.shape[1] == 0:
+      pending_Y = np.repeat(MC_pad_i[:, np.newaxis], pending_X.shape[1], axis=1)
+
+    n_frames = min(pending_X.shape[1], pending_Y.shape[1])
+    if n_frames == 0:
+      assert exhausted_X and exhausted_Y
+      break
+
+    MCD_k = get_MCD_k(pending_X[:, :n_frames], pending_Y[:, :n_frames], s, D)
+    MCD_k_sum += float(np.sum(MCD_k))
+    pending_X = pending_X[:, n_frames:]
+    pending_Y = pending_Y[:, n_frames:]
+
+  return MCD_k_sum, n_frames_X, n_frames_Y
@@ -1,6 +1,6 @@
 import numpy as np
 
-from mel_cepstral_distance.alignment import align_2d_sequences_using_dtw
+from mel_cepstral_distance.alignment import align_2d_sequences_using_dtw, get_dtw_path
 
 
 def test_2d_identical_sequences() -> None:
@@ -81,3 +81,25 @@ def test_2d_reverse_order() -> None:
   assert np.array_equal(aligned_seq_2, expected_aligned_seq_2), (
     "Aligned sequence 2 does not match expected output"
   )
+
+
+def test_2d_native_backends_return_same_as_fastdtw() -> None:
+  seq_1 = np.array([[1, 2, 3, 4, 5], [5, 4, 3, 2, 1]])
+  seq_2 = np.array([[1, 2, 2.5, 3, 4, 5], [5, 4, 3, 2.5, 2, 1]])
+  _, _, expected_paths = align_2d_sequences_using_dtw(seq_1, seq_2, custom_radius=1)
+  for backend in ["multires", "sakoe-chiba"]:
+    aligned_seq_1, aligned_seq_2, paths = align_2d_sequences_using_dtw(
+      seq_1, seq_2, custom_radius=1, backend=backend
+    )
+    assert np.array_equal(paths, expected_paths)
+    assert np.array_equal(aligned_seq_1, seq_1[:, paths[:, 0]])
+    assert np.array_equal(aligned_seq_2, seq_2[:, paths[:, 1]])
+
+
+def test_get_dtw_path_returns_same_path_without_stretching() -> None:
+  rng = np.random.default_rng(1)
+  seq_1 = rng.standard_normal((3, 20))
+  seq_2 = rng.standard_normal((3, 27))
+  for backend in ["fastdtw", "multires", "sakoe-chiba"]:
+    _, _, expected = align_2d_sequences_using_dtw(seq_1, seq_2, 5, backend)
+    np.testing.assert_array_equal(get_dtw_path(seq_1, seq_2, 5, backend), expected)
@@ -669,6 +669,25 @@ def test_s_bigger_than_D_raises_error() -> None:
     )
 
 
+def test_float32_returns_close_result_to_float64() -> None:
+  for params in [{}, {"align_target": "spec"}, {"aligning": "pad"}]:
+    expected_mcd, expected_pen = compare_amplitude_spectrograms(
+      get_X_km_A(), get_X_km_B(), SR, N_FFT, **params
+    )
+    mcd, pen = compare_amplitude_spectrograms(
+      get_X_km_A(), get_X_km_B(), SR, N_FFT, dtype="float32", **params
+    )
+    assert np.isclose(mcd, expected_mcd, rtol=1e-5)
+    assert pen == expected_pen
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    compare_amplitude_spectrograms(
+      get_X_km_A(), get_X_km_B(), SR, N_FFT, dtype="float16"
+    )
+
+
 def create_other_outputs() -> None:
   targets = []
 
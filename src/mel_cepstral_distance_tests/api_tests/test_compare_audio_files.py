@@ -9,7 +9,9 @@ import pytest
 from scipy.io import wavfile
 
 from mel_cepstral_distance.api import compare_audio_files
+from mel_cepstral_distance.cache import FeatureCache, MemoryFeatureCache
 from mel_cepstral_distance.helper import resample_if_necessary, samples_to_ms
+from mel_cepstral_distance.result import MCDResult
 
 TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
 
@@ -503,6 +505,124 @@ def test_same_file_returns_zero() -> None:
   assert pen == 0
 
 
+def test_mmap_returns_same_as_reading_into_memory() -> None:
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"remove_silence": "sig", "silence_threshold_A": 0.01, "silence_threshold_B": 0.01},
+    {"norm_audio": False, "sample_rate": 16000},
+  ]:
+    result = compare_audio_files(AUDIO_A, AUDIO_B, mmap=True, **params)
+    expected = compare_audio_files(AUDIO_A, AUDIO_B, mmap=False, **params)
+    assert result == expected
+
+
+def test_feature_cache_returns_same_as_without_cache(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path)
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"align_target": "mel", "remove_silence": "spec"},
+    {"remove_silence": "sig", "sample_rate": 16000},
+    {"remove_silence": "mfcc", "dtw_backend": "multires"},
+  ]:
+    if params.get("remove_silence", "no") != "no":
+      params["silence_threshold_A"] = 0.01 if params["remove_silence"] == "sig" else 0
+      params["silence_threshold_B"] = params["silence_threshold_A"]
+
+    expected = compare_audio_files(AUDIO_A, AUDIO_B, **params)
+    # the first call extracts and saves the features, the second one loads them
+    for _ in range(2):
+      result = compare_audio_files(AUDIO_A, AUDIO_B, feature_cache=cache, **params)
+      assert result == expected
+
+  assert len(list(tmp_path.glob("*.npy"))) == 10
+
+
+def test_feature_cache_is_used_per_audio(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path)
+  compare_audio_files(AUDIO_A, AUDIO_B, feature_cache=cache)
+  compare_audio_files(AUDIO_A, AUDIO_A, feature_cache=cache)
+  compare_audio_files(AUDIO_B, AUDIO_A, aligning="pad", feature_cache=cache)
+
+  assert len(list(tmp_path.glob("*.npy"))) == 2
+
+
+def test_feature_cache_stores_only_mfccs_s_to_D() -> None:
+  cache_all = MemoryFeatureCache(max_size=2**24)
+  cache_s_D = MemoryFeatureCache(max_size=2**24)
+  compare_audio_files(AUDIO_A, AUDIO_B, M=20, s=0, D=20, feature_cache=cache_all)
+  compare_audio_files(AUDIO_A, AUDIO_B, M=20, s=1, D=13, feature_cache=cache_s_D)
+
+  assert cache_s_D.get_size() * 20 == cache_all.get_size() * 12
+
+
+def test_memory_feature_cache_extracts_features_once_per_audio() -> None:
+  cache = MemoryFeatureCache(max_size=2**24)
+  expected = compare_audio_files(AUDIO_A, AUDIO_B)
+  for _ in range(3):
+    assert compare_audio_files(AUDIO_A, AUDIO_B, feature_cache=cache) == expected
+
+  assert cache.misses == 2
+  assert cache.hits == 4
+  assert cache.evictions == 0
+
+
+def test_feature_cache_with_too_hard_silence_removal_returns_nan_nan(
+  tmp_path: Path,
+) -> None:
+  cache = FeatureCache(tmp_path)
+  for _ in range(2):
+    mcd, pen = compare_audio_files(
+      AUDIO_A,
+      AUDIO_B,
+      remove_silence="mel",
+      silence_threshold_A=100,
+      silence_threshold_B=0,
+      feature_cache=cache,
+    )
+    assert np.isnan(mcd)
+    assert np.isnan(pen)
+
+
+def test_return_details_returns_same_mcd_and_penalty() -> None:
+  for align_target in ["spec", "mel", "mfcc"]:
+    for aligning in ["pad", "dtw"]:
+      expected_mcd, expected_pen = compare_audio_files(
+        AUDIO_A, AUDIO_B, align_target=align_target, aligning=aligning
+      )
+      result = compare_audio_files(
+        AUDIO_A,
+        AUDIO_B,
+        align_target=align_target,
+        aligning=aligning,
+        return_details=True,
+      )
+      assert isinstance(result, MCDResult)
+      assert result.mcd == expected_mcd
+      assert result.penalty == expected_pen
+      assert (result.path is None) == (aligning == "pad")
+      assert (result.dtw_cost is None) == (aligning == "pad")
+      np.testing.assert_almost_equal(np.mean(result.MCD_k), result.mcd)
+      assert set(result.timings) == {"features", "alignment", "distance"}
+
+
+def test_return_details_with_too_hard_silence_removal_returns_nan_nan() -> None:
+  result = compare_audio_files(
+    AUDIO_A,
+    AUDIO_B,
+    align_target="mel",
+    remove_silence="mel",
+    silence_threshold_A=100,
+    silence_threshold_B=0,
+    return_details=True,
+  )
+  assert isinstance(result, MCDResult)
+  assert np.isnan(result.mcd)
+  assert np.isnan(result.penalty)
+  assert set(result.timings) == {"features"}
+
+
 def test_invalid_silence_removal_raises_error() -> None:
   with pytest.raises(ValueError):
     compare_audio_files(AUDIO_A, AUDIO_B, remove_silence="none")
@@ -518,6 +638,81 @@ def test_invalid_align_target_raises_error() -> None:
     compare_audio_files(AUDIO_A, AUDIO_B, align_target="none")
 
 
+def test_polyphase_resampling_returns_similar_result_as_fft() -> None:
+  mcd_fft, pen_fft = compare_audio_files(AUDIO_A, AUDIO_B, sample_rate=16000)
+  mcd_poly, pen_poly = compare_audio_files(
+    AUDIO_A, AUDIO_B, sample_rate=16000, resample_method="polyphase"
+  )
+
+  assert mcd_poly != mcd_fft
+  assert np.isclose(mcd_poly, mcd_fft, rtol=0.05)
+  assert np.isclose(pen_poly, pen_fft, atol=0.02)
+
+
+def test_without_resampling_returns_same_as_fft_for_same_sample_rates() -> None:
+  for params in [{}, {"align_target": "mel", "remove_silence": "spec"}]:
+    if params:
+      params["silence_threshold_A"] = params["silence_threshold_B"] = 0.01
+    result = compare_audio_files(AUDIO_A, AUDIO_B, resample_method="none", **params)
+    expected = compare_audio_files(AUDIO_A, AUDIO_B, **params)
+    assert result == expected
+
+
+def test_without_resampling_returns_similar_result_as_fft(tmp_path: Path) -> None:
+  sr, audio = wavfile.read(AUDIO_B)
+  audio_B_upsampled = tmp_path / "B.wav"
+  wavfile.write(audio_B_upsampled, 2 * sr, np.repeat(audio, 2))
+
+  for params in [{"s": 0}, {"align_target": "mel"}, {"sample_rate": 16000}]:
+    mcd_fft, pen_fft = compare_audio_files(AUDIO_A, audio_B_upsampled, **params)
+    mcd_none, pen_none = compare_audio_files(
+      AUDIO_A, audio_B_upsampled, resample_method="none", **params
+    )
+    assert np.isclose(mcd_none, mcd_fft, rtol=0.03)
+    assert np.isclose(pen_none, pen_fft, atol=0.01)
+
+
+def test_invalid_resample_method_raises_error() -> None:
+  with pytest.raises(
+    ValueError, match="resample_method must be 'fft', 'polyphase' or 'none'"
+  ):
+    compare_audio_files(AUDIO_A, AUDIO_B, resample_method="linear")
+
+
+def test_spec_alignment_without_resampling_raises_error() -> None:
+  with pytest.raises(ValueError, match="signals that are not resampled"):
+    compare_audio_files(AUDIO_A, AUDIO_B, align_target="spec", resample_method="none")
+
+
+def test_float32_returns_close_result_to_float64() -> None:
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"align_target": "mel", "dtw_backend": "multires"},
+    {"resample_method": "none", "sample_rate": 16000},
+  ]:
+    expected_mcd, expected_pen = compare_audio_files(AUDIO_A, AUDIO_B, **params)
+    mcd, pen = compare_audio_files(AUDIO_A, AUDIO_B, dtype="float32", **params)
+    assert np.isclose(mcd, expected_mcd, rtol=1e-5)
+    assert pen == expected_pen
+
+
+def test_float32_features_are_cached_separately() -> None:
+  cache = MemoryFeatureCache(max_size=2**24)
+  expected = compare_audio_files(AUDIO_A, AUDIO_A, dtype="float32")
+  compare_audio_files(AUDIO_A, AUDIO_A, feature_cache=cache)
+  result = compare_audio_files(AUDIO_A, AUDIO_A, dtype="float32", feature_cache=cache)
+
+  assert result == expected
+  assert cache.misses == 2
+  assert cache.hits == 2
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    compare_audio_files(AUDIO_A, AUDIO_B, dtype="float16")
+
+
 def test_invalid_sample_rate_raises_error() -> None:
   with pytest.raises(ValueError):
     compare_audio_files(AUDIO_A, AUDIO_B, sample_rate=0)
@@ -565,6 +760,11 @@ def test_invalid_radius_raises_error() -> None:
     compare_audio_files(AUDIO_A, AUDIO_B, aligning="dtw", dtw_radius=0)
 
 
+def test_invalid_dtw_backend_raises_error() -> None:
+  with pytest.raises(ValueError):
+    compare_audio_files(AUDIO_A, AUDIO_B, dtw_backend="numba")
+
+
 def test_no_silence_threshold_raises_error() -> None:
   # A None
   with pytest.raises(ValueError):
@@ -1472,6 +1672,37 @@ def test_sil_outputs() -> None:
     np.testing.assert_almost_equal(pen, expected_pen)
 
 
+def test_float32_sil_outputs_are_close() -> None:
+  outputs = pickle.loads((TEST_DIR / "test_compare_audio_files_sil.pkl").read_bytes())
+  for (
+    remove_silence,
+    sil_a,
+    sil_b,
+    aligning,
+    target,
+    dtw_radius,
+    expected_mcd,
+    expected_pen,
+  ) in outputs:
+    mcd, pen = compare_audio_files(
+      AUDIO_A,
+      AUDIO_B,
+      sample_rate=22050,
+      n_fft=samples_to_ms(512, 22050),
+      win_len=samples_to_ms(512, 22050),
+      hop_len=samples_to_ms(512 // 4, 22050),
+      align_target=target,
+      aligning=aligning,
+      remove_silence=remove_silence,
+      silence_threshold_A=sil_a,
+      silence_threshold_B=sil_b,
+      dtw_radius=dtw_radius,
+      dtype="float32",
+    )
+    np.testing.assert_allclose(mcd, expected_mcd, rtol=1e-5)
+    np.testing.assert_almost_equal(pen, expected_pen)
+
+
 if __name__ == "__main__":
   create_other_outputs()
   create_sil_outputs()
@@ -0,0 +1,123 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from mel_cepstral_distance.api import compare_audio_files, compare_audio_files_batch
+from mel_cepstral_distance.cache import MemoryFeatureCache
+
+TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
+
+AUDIO_A = TEST_DIR / "A.wav"
+AUDIO_B = TEST_DIR / "B.wav"
+
+
+def test_returns_same_as_compare_audio_files() -> None:
+  pairs = [(AUDIO_A, AUDIO_B), (AUDIO_B, AUDIO_A), (AUDIO_A, AUDIO_A)]
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"align_target": "mel", "remove_silence": "mel", "M": 30},
+    {"remove_silence": "sig", "sample_rate": 16000, "dtw_radius": None},
+  ]:
+    if params.get("remove_silence", "no") != "no":
+      params["silence_threshold_A"] = 0.01 if params["remove_silence"] == "sig" else -7
+      params["silence_threshold_B"] = params["silence_threshold_A"]
+
+    result = compare_audio_files_batch(pairs, **params)
+
+    assert result.shape == (len(pairs),)
+    assert result.dtype.names == ("mcd", "penalty")
+    for (audio_A, audio_B), (mcd, pen) in zip(pairs, result):
+      expected_mcd, expected_pen = compare_audio_files(audio_A, audio_B, **params)
+      assert mcd == expected_mcd
+      assert pen == expected_pen
+
+
+def test_different_sample_rates_use_min_sample_rate_per_pair() -> None:
+  with TemporaryDirectory(prefix="test_compare_audio_files_batch") as tmp_dir:
+    sr, audio = wavfile.read(AUDIO_B)
+    audio_B_8k = Path(tmp_dir) / "B_8k.wav"
+    wavfile.write(audio_B_8k, 8000, audio[:: sr // 8000])
+
+    pairs = [(AUDIO_A, audio_B_8k), (AUDIO_A, AUDIO_B)]
+    result = compare_audio_files_batch(pairs)
+
+    for (audio_A, audio_B), (mcd, pen) in zip(pairs, result):
+      expected_mcd, expected_pen = compare_audio_files(audio_A, audio_B)
+      assert mcd == expected_mcd
+      assert pen == expected_pen
+
+
+def test_empty_pairs_return_empty_array() -> None:
+  result = compare_audio_files_batch([])
+  assert result.shape == (0,)
+  assert result.dtype.names == ("mcd", "penalty")
+
+
+def test_removing_silence_too_hard_returns_nan_nan() -> None:
+  result = compare_audio_files_batch(
+    [(AUDIO_A, AUDIO_B)],
+    remove_silence="sig",
+    silence_threshold_A=1000,
+    silence_threshold_B=1000,
+  )
+  assert np.isnan(result["mcd"][0])
+  assert np.isnan(result["penalty"][0])
+
+
+def test_invalid_params_raise_error_before_reading_files() -> None:
+  missing_file = TEST_DIR / "missing.wav"
+  with pytest.raises(ValueError):
+    compare_audio_files_batch([(missing_file, missing_file)], D=21, M=20)
+
+  with pytest.raises(ValueError):
+    compare_audio_files_batch([(missing_file, missing_file)], remove_silence="mel")
+
+
+def test_invalid_fmax_raises_error() -> None:
+  with pytest.raises(ValueError):
+    compare_audio_files_batch([(AUDIO_A, AUDIO_B)], sample_rate=16000, fmax=8001)
+
+
+def test_parallel_returns_same_as_serial_in_same_order() -> None:
+  pairs = [(AUDIO_A, AUDIO_B), (AUDIO_B, AUDIO_A), (AUDIO_A, AUDIO_A)] * 3
+  expected = compare_audio_files_batch(pairs, dtw_radius=2)
+  result = compare_audio_files_batch(pairs, dtw_radius=2, n_jobs=2)
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_mmap_returns_same_as_reading_into_memory() -> None:
+  pairs = [(AUDIO_A, AUDIO_B), (AUDIO_B, AUDIO_A)]
+  expected = compare_audio_files_batch(pairs, dtw_radius=2)
+  result = compare_audio_files_batch(pairs, dtw_radius=2, mmap=True)
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_memory_feature_cache_returns_same_as_without_cache() -> None:
+  pairs = [(AUDIO_A, AUDIO_B), (AUDIO_A, AUDIO_A), (AUDIO_B, AUDIO_A)]
+  cache = MemoryFeatureCache(max_size=2**24)
+  expected = compare_audio_files_batch(pairs)
+  result = compare_audio_files_batch(pairs, feature_cache=cache)
+
+  np.testing.assert_array_equal(result, expected)
+  assert cache.misses == 2
+  assert cache.hits == 4
+
+
+def test_float32_returns_same_as_compare_audio_files() -> None:
+  pairs = [(AUDIO_A, AUDIO_B), (AUDIO_B, AUDIO_A)]
+  result = compare_audio_files_batch(pairs, dtype="float32")
+
+  for (audio_A, audio_B), (mcd, pen) in zip(pairs, result):
+    assert (mcd, pen) == compare_audio_files(audio_A, audio_B, dtype="float32")
+
+
+def test_invalid_n_jobs_raises_error() -> None:
+  with pytest.raises(ValueError):
+    compare_audio_files_batch([(AUDIO_A, AUDIO_B)], n_jobs=0)
+
+  with pytest.raises(ValueError):
+    compare_audio_files_batch([(AUDIO_A, AUDIO_B)], n_jobs=-2)
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from mel_cepstral_distance.api import compare_audio_files, compare_audio_signals
+from mel_cepstral_distance.result import MCDResult
+
+TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
+
+AUDIO_A = TEST_DIR / "A.wav"
+AUDIO_B = TEST_DIR / "B.wav"
+
+
+def test_returns_same_as_compare_audio_files() -> None:
+  sr_A, signal_A = wavfile.read(AUDIO_A)
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"align_target": "mel", "remove_silence": "mel"},
+    {"remove_silence": "sig", "sample_rate": 16000, "resample_method": "polyphase"},
+    {"sample_rate": 16000, "resample_method": "none", "dtype": "float32"},
+  ]:
+    if params.get("remove_silence", "no") != "no":
+      params["silence_threshold_A"] = 0.01 if params["remove_silence"] == "sig" else -7
+      params["silence_threshold_B"] = params["silence_threshold_A"]
+
+    result = compare_audio_signals(signal_A, sr_A, signal_B, sr_B, **params)
+    expected = compare_audio_files(AUDIO_A, AUDIO_B, **params)
+    assert result == expected
+
+
+def test_float_signals_in_memory() -> None:
+  sr = 16000
+  rng = np.random.default_rng(1234)
+  t = np.arange(sr) / sr
+  signal_A = (np.sin(2 * np.pi * 220 * t) + 0.01 * rng.standard_normal(sr)).astype(
+    np.float32
+  )
+  signal_B = np.sin(2 * np.pi * 230 * t[: sr // 2]).astype(np.float32)
+
+  same_mcd, same_pen = compare_audio_signals(signal_A, sr, signal_A, sr)
+  mcd, pen = compare_audio_signals(signal_A, sr, signal_B, sr)
+
+  assert same_mcd == 0
+  assert same_pen == 0
+  assert mcd > 0
+  assert 0 < pen < 1
+
+
+def test_return_details_returns_same_mcd_and_penalty() -> None:
+  sr_A, signal_A = wavfile.read(AUDIO_A)
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  mcd, pen = compare_audio_signals(signal_A, sr_A, signal_B, sr_B)
+  result = compare_audio_signals(signal_A, sr_A, signal_B, sr_B, return_details=True)
+  assert isinstance(result, MCDResult)
+  assert result.mcd == mcd
+  assert result.penalty == pen
+
+
+def test_empty_signal_returns_nan_nan() -> None:
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  mcd, pen = compare_audio_signals(np.empty(0, dtype=np.int16), sr_B, signal_B, sr_B)
+  assert np.isnan(mcd)
+  assert np.isnan(pen)
+
+
+def test_multichannel_signal_raises_error() -> None:
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  with pytest.raises(ValueError, match="signal A must have 1 dimension but got 2"):
+    compare_audio_signals(np.stack((signal_B, signal_B), axis=1), sr_B, signal_B, sr_B)
+
+
+def test_invalid_signal_sample_rate_raises_error() -> None:
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  with pytest.raises(ValueError, match="sample rate of signal B must be > 0"):
+    compare_audio_signals(signal_B, sr_B, signal_B, 0)
+
+
+def test_invalid_params_raise_error() -> None:
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  with pytest.raises(ValueError):
+    compare_audio_signals(signal_B, sr_B, signal_B, sr_B, s=16, D=16)
@@ -7,8 +7,8 @@ import numpy.typing as npt
 import pytest
 from scipy.io import wavfile
 
-from mel_cepstral_distance.api import compare_mel_spectrograms
-from mel_cepstral_distance.computation import get_w_n_m, get_X_km, get_X_kn
+from mel_cepstral_distance.api import compare_mel_spectrograms, compare_mfccs
+from mel_cepstral_distance.computation import get_MC_X_ik, get_w_n_m, get_X_km, get_X_kn
 from mel_cepstral_distance.helper import norm_audio_signal
 
 TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
@@ -348,6 +348,44 @@ def test_s_bigger_than_D_raises_error() -> None:
     compare_mel_spectrograms(get_X_kn_A(), get_X_kn_B(), s=13, D=12)
 
 
+def test_returns_same_as_compare_mfccs_of_all_coefficients() -> None:
+  MC_X_ik = get_MC_X_ik(get_X_kn_A(), M)
+  MC_Y_ik = get_MC_X_ik(get_X_kn_B(), M)
+  for params in [
+    {"s": 1, "D": 13},
+    {"s": 0, "D": 80, "aligning": "pad"},
+    {"s": 2, "D": 20, "remove_silence": True},
+  ]:
+    if params.get("remove_silence", False):
+      params["silence_threshold_A"] = 0
+      params["silence_threshold_B"] = 0
+    expected_mcd, expected_pen = compare_mfccs(MC_X_ik, MC_Y_ik, **params)
+    if params.pop("remove_silence", False):
+      params["remove_silence"] = "mfcc"
+
+    mcd, pen = compare_mel_spectrograms(get_X_kn_A(), get_X_kn_B(), **params)
+
+    assert np.isclose(mcd, expected_mcd)
+    assert pen == expected_pen
+
+
+def test_float32_returns_close_result_to_float64() -> None:
+  for params in [{}, {"align_target": "mel"}, {"aligning": "pad"}]:
+    expected_mcd, expected_pen = compare_mel_spectrograms(
+      get_X_kn_A(), get_X_kn_B(), **params
+    )
+    mcd, pen = compare_mel_spectrograms(
+      get_X_kn_A(), get_X_kn_B(), dtype="float32", **params
+    )
+    assert np.isclose(mcd, expected_mcd, rtol=1e-5)
+    assert pen == expected_pen
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    compare_mel_spectrograms(get_X_kn_A(), get_X_kn_B(), dtype="float16")
+
+
 def create_other_outputs() -> None:
   targets = []
 
@@ -10,6 +10,7 @@ from scipy.io import wavfile
 from mel_cepstral_distance.api import compare_mfccs
 from mel_cepstral_distance.computation import get_MC_X_ik, get_w_n_m, get_X_km, get_X_kn
 from mel_cepstral_distance.helper import norm_audio_signal
+from mel_cepstral_distance.result import MCDResult
 
 TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
 
@@ -213,6 +214,92 @@ def test_invalid_radius_raises_error() -> None:
     compare_mfccs(get_MC_X_ik_A(), get_MC_Y_ik_B(), aligning="dtw", dtw_radius=0)
 
 
+def test_invalid_dtw_backend_raises_error() -> None:
+  with pytest.raises(ValueError):
+    compare_mfccs(get_MC_X_ik_A(), get_MC_Y_ik_B(), dtw_backend="numba")
+
+
+def test_multires_backend_returns_same_as_fastdtw() -> None:
+  for dtw_radius in [1, 10, None]:
+    expected = compare_mfccs(
+      get_MC_X_ik_A(), get_MC_Y_ik_B(), dtw_radius=dtw_radius, dtw_backend="fastdtw"
+    )
+    result = compare_mfccs(
+      get_MC_X_ik_A(), get_MC_Y_ik_B(), dtw_radius=dtw_radius, dtw_backend="multires"
+    )
+    np.testing.assert_allclose(result, expected)
+
+
+def test_float32_returns_close_result_to_float64() -> None:
+  for params in [{}, {"aligning": "pad"}, {"dtw_backend": "multires"}]:
+    expected_mcd, expected_pen = compare_mfccs(
+      get_MC_X_ik_A(), get_MC_Y_ik_B(), **params
+    )
+    mcd, pen = compare_mfccs(
+      get_MC_X_ik_A(), get_MC_Y_ik_B(), dtype="float32", **params
+    )
+    assert np.isclose(mcd, expected_mcd, rtol=1e-5)
+    assert pen == expected_pen
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    compare_mfccs(get_MC_X_ik_A(), get_MC_Y_ik_B(), dtype="float16")
+
+
+def test_return_details_returns_same_mcd_and_penalty() -> None:
+  for params in [{}, {"aligning": "pad"}, {"dtw_backend": "multires"}]:
+    expected_mcd, expected_pen = compare_mfccs(
+      get_MC_X_ik_A(), get_MC_Y_ik_B(), **params
+    )
+    result = compare_mfccs(
+      get_MC_X_ik_A(), get_MC_Y_ik_B(), return_details=True, **params
+    )
+    assert isinstance(result, MCDResult)
+    assert result.mcd == expected_mcd
+    assert result.penalty == expected_pen
+    np.testing.assert_almost_equal(np.mean(result.MCD_k), result.mcd)
+
+
+def test_return_details_of_dtw_contains_path_and_cost() -> None:
+  MC_X_ik = get_MC_X_ik_A()
+  MC_Y_ik = get_MC_Y_ik_B()
+  for dtw_backend in ["fastdtw", "multires", "sakoe-chiba"]:
+    result = compare_mfccs(
+      MC_X_ik, MC_Y_ik, s=1, D=16, dtw_backend=dtw_backend, return_details=True
+    )
+    assert isinstance(result, MCDResult)
+    assert result.path is not None
+    assert result.dtw_cost is not None
+    assert result.MCD_k.shape == (len(result.path),)
+    expected_MCD_k = np.linalg.norm(
+      MC_X_ik[1:16, result.path[:, 0]] - MC_Y_ik[1:16, result.path[:, 1]], axis=0
+    )
+    np.testing.assert_allclose(result.MCD_k, expected_MCD_k, rtol=1e-12)
+    # DTW on the MFCCs accumulates the MCD of the frames along the path
+    np.testing.assert_allclose(result.dtw_cost, np.sum(result.MCD_k), rtol=1e-12)
+    assert set(result.timings) == {"alignment", "distance"}
+
+
+def test_return_details_of_pad_contains_no_path() -> None:
+  MC_X_ik = get_MC_X_ik_A()
+  MC_Y_ik = get_MC_Y_ik_B()
+  result = compare_mfccs(MC_X_ik, MC_Y_ik, aligning="pad", return_details=True)
+  assert isinstance(result, MCDResult)
+  assert result.path is None
+  assert result.dtw_cost is None
+  assert result.MCD_k.shape == (max(MC_X_ik.shape[1], MC_Y_ik.shape[1]),)
+
+
+def test_return_details_of_empty_returns_nan_nan() -> None:
+  result = compare_mfccs(np.empty((M, 0)), get_MC_Y_ik_B(), return_details=True)
+  assert isinstance(result, MCDResult)
+  assert np.isnan(result.mcd)
+  assert np.isnan(result.penalty)
+  assert result.MCD_k.shape == (0,)
+  assert result.path is None
+
+
 def create_other_outputs() -> None:
   targets = []
 
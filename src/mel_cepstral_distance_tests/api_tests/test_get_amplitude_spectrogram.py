@@ -9,7 +9,10 @@ import numpy as np
 import pytest
 from scipy.io import wavfile
 
-from mel_cepstral_distance.api import get_amplitude_spectrogram
+from mel_cepstral_distance.api import (
+  get_amplitude_spectrogram,
+  get_amplitude_spectrogram_from_signal,
+)
 from mel_cepstral_distance.helper import samples_to_ms
 
 TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
@@ -173,6 +176,27 @@ def test_invalid_sample_rate_raises_error() -> None:
     get_amplitude_spectrogram(AUDIO_A, sample_rate=0)
 
 
+def test_invalid_resample_method_raises_error() -> None:
+  with pytest.raises(ValueError):
+    get_amplitude_spectrogram(AUDIO_A, resample_method="linear")
+
+
+def test_float32_returns_single_precision_close_to_float64() -> None:
+  for params in [{}, {"remove_silence": True, "silence_threshold": 0.01}]:
+    expected = get_amplitude_spectrogram(AUDIO_A, **params)
+    result = get_amplitude_spectrogram(AUDIO_A, dtype="float32", **params)
+
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(
+      result, expected, rtol=0, atol=1e-5 * np.max(np.abs(expected))
+    )
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    get_amplitude_spectrogram(AUDIO_A, dtype="float16")
+
+
 def test_invalid_n_fft_raises_error() -> None:
   with pytest.raises(ValueError):
     get_amplitude_spectrogram(AUDIO_A, n_fft=0)
@@ -240,11 +264,53 @@ def test_empty_signal_returns_empty() -> None:
       os.remove(audio_a_tmp_path)
 
 
+def test_mmap_returns_same_as_reading_into_memory() -> None:
+  for norm_audio, remove_silence in [(True, False), (False, False), (True, True)]:
+    spec = get_amplitude_spectrogram(
+      AUDIO_A,
+      norm_audio=norm_audio,
+      remove_silence=remove_silence,
+      silence_threshold=0.01 if remove_silence else None,
+      mmap=True,
+    )
+    expected = get_amplitude_spectrogram(
+      AUDIO_A,
+      norm_audio=norm_audio,
+      remove_silence=remove_silence,
+      silence_threshold=0.01 if remove_silence else None,
+    )
+    np.testing.assert_array_equal(spec, expected)
+
+
 def test_invalid_sig_sil_thres_raises_error() -> None:
   with pytest.raises(ValueError):
     get_amplitude_spectrogram(AUDIO_A, remove_silence=True, silence_threshold=-1)
 
 
+def test_from_signal_returns_same_as_from_file() -> None:
+  sr, signal = wavfile.read(AUDIO_A)
+  for params in [
+    {},
+    {"sample_rate": 16000, "norm_audio": False},
+    {"remove_silence": True, "silence_threshold": 0.01, "dtype": "float32"},
+  ]:
+    spec = get_amplitude_spectrogram_from_signal(signal, sr, **params)
+    expected = get_amplitude_spectrogram(AUDIO_A, **params)
+    np.testing.assert_array_equal(spec, expected)
+
+
+def test_from_signal_with_multiple_channels_raises_error() -> None:
+  sr, signal = wavfile.read(AUDIO_A)
+  with pytest.raises(ValueError, match="signal must have 1 dimension but got 2"):
+    get_amplitude_spectrogram_from_signal(np.stack((signal, signal), axis=1), sr)
+
+
+def test_from_signal_with_invalid_sample_rate_raises_error() -> None:
+  _, signal = wavfile.read(AUDIO_A)
+  with pytest.raises(ValueError, match="sample rate of signal must be > 0"):
+    get_amplitude_spectrogram_from_signal(signal, 0)
+
+
 def create_outputs() -> None:
   size512 = samples_to_ms(512, 22050)
   size128 = samples_to_ms(128, 22050)
@@ -146,6 +146,28 @@ def test_empty_spec_returns_empty() -> None:
   assert res.shape == (0, 20)
 
 
+def test_float32_returns_single_precision_close_to_float64() -> None:
+  for params in [{}, {"remove_silence": True, "silence_threshold": 0.1}]:
+    expected = get_mel_spectrogram(get_X_km(), SR, N_FFT, **params)
+    result = get_mel_spectrogram(get_X_km(), SR, N_FFT, dtype="float32", **params)
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-4)
+
+
+def test_float32_empty_spec_returns_single_precision() -> None:
+  empty_spec = np.empty((0, get_n_fft_bins(512)), dtype=np.complex128)
+  res = get_mel_spectrogram(empty_spec, SR, N_FFT, M=20, dtype="float32")
+
+  assert res.shape == (0, 20)
+  assert res.dtype == np.float32
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    get_mel_spectrogram(get_X_km(), SR, N_FFT, dtype="float16")
+
+
 def create_outputs() -> None:
   targets = []
 
@@ -109,6 +109,20 @@ def test_empty_spec_returns_empty() -> None:
   assert res.shape == (20, 0)
 
 
+def test_float32_returns_single_precision_close_to_float64() -> None:
+  for params in [{}, {"remove_silence": True, "silence_threshold": -7}]:
+    expected = get_mfccs(get_X_kn(), **params)
+    result = get_mfccs(get_X_kn(), dtype="float32", **params)
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-4)
+
+
+def test_invalid_dtype_raises_error() -> None:
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    get_mfccs(get_X_kn(), dtype="float16")
+
+
 def create_outputs() -> None:
   # silence removal
   loudness_max = get_loudness_vals_X_kn(get_X_kn()).max()
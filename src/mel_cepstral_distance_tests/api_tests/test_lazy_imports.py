@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+DEFERRED_MODULES = (
+  "scipy.io",
+  "scipy.signal",
+  "scipy.fft",
+  "scipy.spatial",
+  "fastdtw",
+  "concurrent.futures.process",
+)
+
+
+def test_import_does_not_import_deferred_modules() -> None:
+  code = "import sys, mel_cepstral_distance; print(' '.join(sys.modules))"
+  modules = subprocess.run(
+    [sys.executable, "-c", code], capture_output=True, check=True, text=True
+  ).stdout.split()
+
+  for module in DEFERRED_MODULES:
+    assert module not in modules
@@ -0,0 +1,191 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from mel_cepstral_distance.api import (
+  MCDExtractor,
+  compare_audio_files,
+  get_amplitude_spectrogram,
+  get_mel_spectrogram,
+  get_mfccs,
+)
+
+TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
+
+AUDIO_A = TEST_DIR / "A.wav"
+AUDIO_B = TEST_DIR / "B.wav"
+
+
+def test_features_are_same_as_get_functions() -> None:
+  sample_rate = 16000
+  extractor = MCDExtractor(
+    sample_rate, n_fft=64, win_len=32, hop_len=16, window="hamming", fmax=7000, M=30
+  )
+
+  amp_spec = extractor.spectrogram(AUDIO_A)
+  expected_amp_spec = get_amplitude_spectrogram(
+    AUDIO_A, sample_rate=sample_rate, n_fft=64, win_len=32, hop_len=16, window="hamming"
+  )
+  np.testing.assert_array_equal(amp_spec, expected_amp_spec)
+
+  mel_spec = extractor.mel(amp_spec)
+  expected_mel_spec = get_mel_spectrogram(
+    expected_amp_spec, sample_rate, 64, M=30, fmax=7000
+  )
+  np.testing.assert_array_equal(mel_spec, expected_mel_spec)
+
+  mfccs = extractor.mfcc(mel_spec)
+  expected_mfccs = get_mfccs(expected_mel_spec)
+  np.testing.assert_allclose(mfccs, expected_mfccs, rtol=0, atol=1e-12)
+
+
+def test_features_with_silence_removal_are_same_as_get_functions() -> None:
+  sr, _ = wavfile.read(AUDIO_A)
+  extractor = MCDExtractor(sr)
+
+  amp_spec = extractor.spectrogram(AUDIO_A, remove_silence=True, silence_threshold=0.01)
+  expected_amp_spec = get_amplitude_spectrogram(
+    AUDIO_A, remove_silence=True, silence_threshold=0.01
+  )
+  np.testing.assert_array_equal(amp_spec, expected_amp_spec)
+
+  mel_spec = extractor.mel(amp_spec, remove_silence=True, silence_threshold=0.1)
+  expected_mel_spec = get_mel_spectrogram(
+    expected_amp_spec, sr, 32, remove_silence=True, silence_threshold=0.1
+  )
+  np.testing.assert_array_equal(mel_spec, expected_mel_spec)
+
+  mfccs = extractor.mfcc(mel_spec, remove_silence=True, silence_threshold=-7)
+  expected_mfccs = get_mfccs(
+    expected_mel_spec, remove_silence=True, silence_threshold=-7
+  )
+  np.testing.assert_allclose(mfccs, expected_mfccs, rtol=0, atol=1e-12)
+
+
+def test_compare_returns_same_as_compare_audio_files() -> None:
+  sample_rate = 16000
+  extractor = MCDExtractor(sample_rate, M=30)
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"align_target": "mel", "remove_silence": "mel"},
+    {"remove_silence": "sig", "dtw_radius": None, "dtw_backend": "multires"},
+  ]:
+    if params.get("remove_silence", "no") != "no":
+      params["silence_threshold_A"] = 0.01 if params["remove_silence"] == "sig" else -7
+      params["silence_threshold_B"] = params["silence_threshold_A"]
+
+    result = extractor.compare(AUDIO_A, AUDIO_B, **params)
+    expected = compare_audio_files(
+      AUDIO_A, AUDIO_B, sample_rate=sample_rate, M=30, **params
+    )
+    assert result == expected
+
+
+def test_signal_methods_return_same_as_file_methods() -> None:
+  extractor = MCDExtractor(16000)
+  sr_A, signal_A = wavfile.read(AUDIO_A)
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+
+  np.testing.assert_array_equal(
+    extractor.spectrogram_from_signal(
+      signal_A, sr_A, remove_silence=True, silence_threshold=0.01
+    ),
+    extractor.spectrogram(AUDIO_A, remove_silence=True, silence_threshold=0.01),
+  )
+  for params in [{}, {"aligning": "pad", "align_target": "mel"}]:
+    result = extractor.compare_signals(signal_A, sr_A, signal_B, sr_B, **params)
+    assert result == extractor.compare(AUDIO_A, AUDIO_B, **params)
+
+
+def test_float32_features_are_single_precision_and_close_to_float64() -> None:
+  extractor = MCDExtractor(16000)
+  extractor_32 = MCDExtractor(16000, dtype="float32")
+
+  amp_spec = extractor_32.spectrogram(AUDIO_A)
+  assert amp_spec.dtype == np.complex64
+  expected_amp_spec = extractor.spectrogram(AUDIO_A)
+  np.testing.assert_allclose(
+    amp_spec, expected_amp_spec, rtol=0, atol=1e-5 * np.max(np.abs(expected_amp_spec))
+  )
+
+  # the inputs are converted to the precision of the extractor
+  mel_spec = extractor_32.mel(expected_amp_spec)
+  assert mel_spec.dtype == np.float32
+  expected_mel_spec = extractor.mel(expected_amp_spec)
+  np.testing.assert_allclose(mel_spec, expected_mel_spec, rtol=0, atol=1e-4)
+
+  mfccs = extractor_32.mfcc(expected_mel_spec)
+  assert mfccs.dtype == np.float32
+  np.testing.assert_allclose(
+    mfccs, extractor.mfcc(expected_mel_spec), rtol=0, atol=1e-4
+  )
+
+  for params in [{}, {"aligning": "pad", "align_target": "spec"}]:
+    mcd, pen = extractor_32.compare(AUDIO_A, AUDIO_B, **params)
+    expected_mcd, expected_pen = extractor.compare(AUDIO_A, AUDIO_B, **params)
+    assert mcd == pytest.approx(expected_mcd, rel=1e-5)
+    assert pen == expected_pen
+
+
+def test_precomputed_matrices_are_read_only() -> None:
+  extractor = MCDExtractor(16000)
+  assert extractor.win.shape == (extractor.n_fft_samples,)
+  assert extractor.w_n_m.shape == (extractor.M, extractor.n_fft_samples // 2 + 1)
+  assert extractor.cos_terms.shape == (extractor.M, extractor.M)
+  for matrix in (extractor.win, extractor.w_n_m, extractor.cos_terms):
+    with pytest.raises(ValueError):
+      matrix[0] = 0
+
+
+def test_extractor_for_native_sample_rate_covers_same_frequencies() -> None:
+  extractor = MCDExtractor(16000, n_fft=64, fmin=100, M=30)
+  native_extractor = extractor._get_extractor_for_native_sample_rate(44100)
+
+  assert native_extractor is extractor._get_extractor_for_native_sample_rate(44100)
+  assert native_extractor.sample_rate == 44100
+  assert native_extractor.n_fft == 64
+  assert (native_extractor.fmin, native_extractor.fmax) == (100, 8000)
+  assert native_extractor.w_n_m.shape == (30, 2822 // 2 + 1)
+
+
+def test_fmax_defaults_to_nyquist() -> None:
+  extractor = MCDExtractor(16000)
+  assert extractor.fmax == 8000
+
+
+def test_invalid_params_raise_error() -> None:
+  with pytest.raises(ValueError, match="sample_rate must be > 0"):
+    MCDExtractor(0)
+  with pytest.raises(ValueError, match="hop_len must be > 0"):
+    MCDExtractor(16000, hop_len=0)
+  with pytest.raises(ValueError, match="window must be 'hamming' or 'hanning'"):
+    MCDExtractor(16000, window="none")
+  with pytest.raises(ValueError, match=r"fmax must be in \(0, sample_rate // 2\]"):
+    MCDExtractor(16000, fmax=8001)
+  with pytest.raises(ValueError, match=r"fmin must be in \[0, fmax\)"):
+    MCDExtractor(16000, fmin=8000)
+  with pytest.raises(ValueError, match="M must be > 0"):
+    MCDExtractor(16000, M=0)
+  with pytest.raises(ValueError, match="dtype must be 'float64' or 'float32'"):
+    MCDExtractor(16000, dtype="float16")
+
+
+def test_mel_with_wrong_number_of_bins_raises_error() -> None:
+  extractor = MCDExtractor(16000, n_fft=32)
+  with pytest.raises(ValueError, match="must match the number of frequency bins"):
+    extractor.mel(np.ones((10, 100), dtype=np.complex128))
+
+
+def test_mfcc_with_wrong_number_of_mel_bands_raises_error() -> None:
+  extractor = MCDExtractor(16000, M=20)
+  with pytest.raises(ValueError, match=r"must have M \(20\) mel-bands"):
+    extractor.mfcc(np.ones((10, 30)))
+
+
+def test_compare_with_invalid_D_raises_error() -> None:
+  extractor = MCDExtractor(16000, M=20)
+  with pytest.raises(ValueError, match=r"D must be <= number of mel-bands \(20\)"):
+    extractor.compare(AUDIO_A, AUDIO_B, D=21)
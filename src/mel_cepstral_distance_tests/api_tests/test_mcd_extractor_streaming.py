@@ -0,0 +1,146 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from mel_cepstral_distance.api import MCDExtractor
+
+TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
+
+AUDIO_A = TEST_DIR / "A.wav"
+AUDIO_B = TEST_DIR / "B.wav"
+
+
+def get_extractor() -> MCDExtractor:
+  sr, _ = wavfile.read(AUDIO_A)
+  return MCDExtractor(sr, n_fft=32, win_len=32, hop_len=8, M=20)
+
+
+def test_iter_spectrogram_is_same_as_spectrogram() -> None:
+  extractor = get_extractor()
+  for params in [
+    {},
+    {"norm_audio": False},
+    {"remove_silence": True, "silence_threshold": 0.01},
+  ]:
+    chunks = list(extractor.iter_spectrogram(AUDIO_A, block_len=100, **params))
+    assert len(chunks) > 1
+    np.testing.assert_array_equal(
+      np.concatenate(chunks), extractor.spectrogram(AUDIO_A, **params)
+    )
+
+
+def test_iter_mel_is_same_as_mel() -> None:
+  extractor = get_extractor()
+  chunks = list(
+    extractor.iter_mel(
+      AUDIO_A, remove_silence="spec", silence_threshold=0.01, block_len=100
+    )
+  )
+  expected = extractor.mel(
+    extractor.spectrogram(AUDIO_A), remove_silence=True, silence_threshold=0.01
+  )
+  np.testing.assert_allclose(np.concatenate(chunks), expected, rtol=1e-12)
+
+
+def test_iter_mfcc_is_same_as_mfcc() -> None:
+  extractor = get_extractor()
+  chunks = list(
+    extractor.iter_mfcc(
+      AUDIO_A, remove_silence="mfcc", silence_threshold=-7, block_len=100
+    )
+  )
+  mfccs = extractor.mfcc(extractor.mel(extractor.spectrogram(AUDIO_A)))
+  expected = mfccs[:, mfccs[0] >= -7]
+  assert 0 < expected.shape[1] < mfccs.shape[1]
+  np.testing.assert_allclose(np.concatenate(chunks, axis=1), expected, atol=1e-12)
+
+
+def test_compare_streaming_is_same_as_compare_with_padding() -> None:
+  extractor = get_extractor()
+  for params in [
+    {},
+    {"align_target": "spec", "s": 0, "D": 20},
+    {"align_target": "mel", "remove_silence": "mel"},
+    {"remove_silence": "sig"},
+    {"remove_silence": "mfcc", "norm_audio": False},
+  ]:
+    if params.get("remove_silence", "no") != "no":
+      params["silence_threshold_A"] = 0.01 if params["remove_silence"] == "sig" else -7
+      params["silence_threshold_B"] = params["silence_threshold_A"]
+
+    for audio_A, audio_B in [(AUDIO_A, AUDIO_B), (AUDIO_B, AUDIO_A)]:
+      mcd, pen = extractor.compare_streaming(audio_A, audio_B, block_len=250, **params)
+      expected_mcd, expected_pen = extractor.compare(
+        audio_A, audio_B, aligning="pad", **params
+      )
+      assert mcd == pytest.approx(expected_mcd, rel=1e-12)
+      assert pen == expected_pen
+
+
+def test_float32_compare_streaming_is_close_to_float64() -> None:
+  sr, _ = wavfile.read(AUDIO_A)
+  extractor = get_extractor()
+  extractor_32 = MCDExtractor(
+    sr, n_fft=32, win_len=32, hop_len=8, M=20, dtype="float32"
+  )
+  for params in [{}, {"align_target": "spec"}]:
+    mcd, pen = extractor_32.compare_streaming(AUDIO_A, AUDIO_B, block_len=250, **params)
+    expected_mcd, expected_pen = extractor.compare_streaming(
+      AUDIO_A, AUDIO_B, block_len=250, **params
+    )
+    assert mcd == pytest.approx(expected_mcd, rel=1e-5)
+    assert pen == expected_pen
+
+
+def test_compare_streaming_removing_all_frames_returns_nan_nan() -> None:
+  extractor = get_extractor()
+  mcd, pen = extractor.compare_streaming(
+    AUDIO_A,
+    AUDIO_B,
+    remove_silence="mfcc",
+    silence_threshold_A=100,
+    silence_threshold_B=-100,
+  )
+  assert np.isnan(mcd)
+  assert np.isnan(pen)
+
+
+def test_compare_streaming_empty_audio_returns_nan_nan() -> None:
+  extractor = get_extractor()
+  with TemporaryDirectory(prefix="test_mcd_extractor_streaming") as tmp_dir:
+    empty_audio = Path(tmp_dir) / "empty.wav"
+    wavfile.write(empty_audio, extractor.sample_rate, np.empty(0, dtype=np.int16))
+    mcd, pen = extractor.compare_streaming(AUDIO_A, empty_audio)
+  assert np.isnan(mcd)
+  assert np.isnan(pen)
+
+
+def test_different_sample_rate_raises_error() -> None:
+  sr, _ = wavfile.read(AUDIO_A)
+  extractor = MCDExtractor(sr // 2)
+  with pytest.raises(ValueError, match="must match the sample rate of the extractor"):
+    extractor.iter_spectrogram(AUDIO_A)
+  with pytest.raises(ValueError, match="must match the sample rate of the extractor"):
+    extractor.compare_streaming(AUDIO_A, AUDIO_B)
+
+
+def test_invalid_params_raise_error() -> None:
+  extractor = get_extractor()
+  with pytest.raises(ValueError, match="block_len must be > 0"):
+    extractor.iter_spectrogram(AUDIO_A, block_len=0)
+  with pytest.raises(ValueError, match="silence_threshold must be set"):
+    extractor.iter_mel(AUDIO_A, remove_silence="mel")
+  with pytest.raises(ValueError, match="remove_silence must be 'no', 'sig', 'spec'"):
+    extractor.iter_mel(AUDIO_A, remove_silence="mfcc", silence_threshold=0)
+  with pytest.raises(ValueError, match="cannot remove silence from MFCCs"):
+    extractor.compare_streaming(
+      AUDIO_A,
+      AUDIO_B,
+      align_target="mel",
+      remove_silence="mfcc",
+      silence_threshold_A=0,
+      silence_threshold_B=0,
+    )
@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from mel_cepstral_distance.api import (
+  compare_audio_files,
+  compare_audio_signals,
+  pairwise_mcd,
+)
+from mel_cepstral_distance.cache import MemoryFeatureCache
+
+TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
+
+AUDIO_A = TEST_DIR / "A.wav"
+AUDIO_B = TEST_DIR / "B.wav"
+
+
+def test_returns_same_as_compare_audio_files() -> None:
+  items = [AUDIO_A, AUDIO_B, AUDIO_A]
+  for params in [
+    {},
+    {"aligning": "pad", "align_target": "spec"},
+    {"align_target": "mel", "remove_silence": "mel", "silence_threshold": -7},
+    {"remove_silence": "sig", "silence_threshold": 0.01, "sample_rate": 16000},
+  ]:
+    MCD, penalty = pairwise_mcd(items, **params)
+
+    assert MCD.shape == penalty.shape == (3, 3)
+    compare_params = dict(params)
+    if "silence_threshold" in compare_params:
+      compare_params["silence_threshold_A"] = compare_params["silence_threshold"]
+      compare_params["silence_threshold_B"] = compare_params.pop("silence_threshold")
+    for i, j in [(0, 1), (0, 2), (1, 2)]:
+      expected_mcd, expected_pen = compare_audio_files(
+        items[i], items[j], **compare_params
+      )
+      assert MCD[i, j] == MCD[j, i] == expected_mcd
+      assert penalty[i, j] == penalty[j, i] == expected_pen
+    np.testing.assert_array_equal(np.diag(MCD), 0)
+    np.testing.assert_array_equal(np.diag(penalty), 0)
+
+
+def test_signals_return_same_as_compare_audio_signals() -> None:
+  sr_A, signal_A = wavfile.read(AUDIO_A)
+  sr_B, signal_B = wavfile.read(AUDIO_B)
+  MCD, penalty = pairwise_mcd([(signal_A, sr_A), AUDIO_B, (signal_B[:50000], sr_B)])
+
+  for (i, j), (signal_i, signal_j) in [
+    ((0, 1), (signal_A, signal_B)),
+    ((0, 2), (signal_A, signal_B[:50000])),
+    ((1, 2), (signal_B, signal_B[:50000])),
+  ]:
+    expected_mcd, expected_pen = compare_audio_signals(signal_i, sr_A, signal_j, sr_B)
+    assert MCD[i, j] == expected_mcd
+    assert penalty[i, j] == expected_pen
+
+
+def test_not_symmetric_compares_both_orders() -> None:
+  items = [AUDIO_A, AUDIO_B]
+  MCD, penalty = pairwise_mcd(items, symmetric=False)
+
+  for i, j in [(0, 1), (1, 0)]:
+    expected_mcd, expected_pen = compare_audio_files(items[i], items[j])
+    assert MCD[i, j] == expected_mcd
+    assert penalty[i, j] == expected_pen
+
+
+def test_features_are_extracted_once_per_item() -> None:
+  cache = MemoryFeatureCache(2**30)
+  pairwise_mcd([AUDIO_A, AUDIO_B, AUDIO_A, AUDIO_B], feature_cache=cache)
+  # one lookup per item instead of two per pair
+  assert cache.misses == 2
+  assert cache.hits == 2
+
+
+def test_parallel_returns_same_as_serial() -> None:
+  items = [AUDIO_A, AUDIO_B, AUDIO_A, AUDIO_B]
+  progress_serial: List[Tuple[int, int]] = []
+  progress_parallel: List[Tuple[int, int]] = []
+
+  expected_MCD, expected_penalty = pairwise_mcd(
+    items, progress=lambda done, total: progress_serial.append((done, total))
+  )
+  MCD, penalty = pairwise_mcd(
+    items,
+    n_jobs=2,
+    progress=lambda done, total: progress_parallel.append((done, total)),
+  )
+
+  np.testing.assert_array_equal(MCD, expected_MCD)
+  np.testing.assert_array_equal(penalty, expected_penalty)
+  assert progress_serial == [(done, 6) for done in range(1, 7)]
+  assert progress_parallel[-1] == (6, 6)
+
+
+def test_empty_items_contain_nan() -> None:
+  MCD, penalty = pairwise_mcd([AUDIO_A, (np.empty(0, dtype=np.int16), 22050), AUDIO_B])
+  assert np.isnan(MCD[1]).all()
+  assert np.isnan(MCD[:, 1]).all()
+  assert np.isnan(penalty[1]).all()
+  assert MCD[0, 2] > 0
+
+
+def test_no_items_return_empty_matrices() -> None:
+  MCD, penalty = pairwise_mcd([])
+  assert MCD.shape == penalty.shape == (0, 0)
+
+
+def test_invalid_n_jobs_raises_error() -> None:
+  with pytest.raises(ValueError, match="n_jobs must be >= 1 or -1"):
+    pairwise_mcd([AUDIO_A, AUDIO_B], n_jobs=0)
+
+
+def test_multichannel_signal_raises_error() -> None:
+  _, signal = wavfile.read(AUDIO_A)
+  with pytest.raises(ValueError, match="signal 1 must have 1 dimension but got 2"):
+    pairwise_mcd([AUDIO_A, (np.stack((signal, signal), axis=1), 22050)])
@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mel_cepstral_distance.cache import FeatureCache
+
+
+def create_file(path: Path, content: bytes) -> Path:
+  path.write_bytes(content)
+  return path
+
+
+def test_load_returns_saved_features(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path / "cache")
+  features = np.arange(12, dtype=np.float64).reshape(3, 4)
+  cache.save("key", features)
+
+  result = cache.load("key")
+
+  assert result is not None
+  np.testing.assert_array_equal(result, features)
+  assert result.dtype == features.dtype
+
+
+def test_load_of_missing_key_returns_none(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path)
+  assert cache.load("key") is None
+
+
+def test_key_depends_on_params_content_and_mtime(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path / "cache")
+  audio = create_file(tmp_path / "a.wav", b"abc")
+  key = cache.get_key(audio, {"M": 20, "window": "hanning"})
+
+  assert key == cache.get_key(audio, {"window": "hanning", "M": 20})
+  assert key != cache.get_key(audio, {"M": 20, "window": "hamming"})
+
+  stat = os.stat(audio)
+  os.utime(audio, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+  assert key != cache.get_key(audio, {"M": 20, "window": "hanning"})
+
+  os.utime(audio, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+  create_file(audio, b"abd")
+  os.utime(audio, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+  assert key != cache.get_key(audio, {"M": 20, "window": "hanning"})
+
+
+def test_least_recently_used_entries_are_removed(tmp_path: Path) -> None:
+  features = np.zeros(100)
+  cache = FeatureCache(tmp_path)
+  cache.save("a", features)
+  entry_size = cache.get_size()
+  cache.max_size = 2 * entry_size
+
+  cache.save("b", features)
+  os.utime(tmp_path / "a.npy", ns=(0, 1))
+  os.utime(tmp_path / "b.npy", ns=(0, 2))
+  # marks a as used after b
+  assert cache.load("a") is not None
+  cache.save("c", features)
+
+  assert cache.load("a") is not None
+  assert cache.load("b") is None
+  assert cache.load("c") is not None
+  assert cache.get_size() == 2 * entry_size
+
+
+def test_features_larger_than_max_size_are_not_saved(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path, max_size=100)
+  cache.save("key", np.zeros(100))
+
+  assert cache.load("key") is None
+  assert cache.get_size() == 0
+
+
+def test_clear_removes_all_entries(tmp_path: Path) -> None:
+  cache = FeatureCache(tmp_path)
+  cache.save("a", np.zeros(3))
+  cache.save("b", np.zeros((0, 20)))
+
+  cache.clear()
+
+  assert cache.get_size() == 0
+  assert cache.load("a") is None
+
+
+def test_invalid_max_size_raises_error(tmp_path: Path) -> None:
+  with pytest.raises(ValueError, match="max_size must be None or > 0"):
+    FeatureCache(tmp_path, max_size=0)
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mel_cepstral_distance.cache import MemoryFeatureCache
+
+
+def test_load_returns_saved_features_read_only() -> None:
+  cache = MemoryFeatureCache(max_size=1000)
+  features = np.arange(12, dtype=np.float64).reshape(3, 4)
+  cache.save("key", features)
+
+  result = cache.load("key")
+
+  assert result is not None
+  np.testing.assert_array_equal(result, features)
+  with pytest.raises(ValueError):
+    result[0, 0] = 1
+
+
+def test_counts_hits_and_misses() -> None:
+  cache = MemoryFeatureCache(max_size=1000)
+  assert cache.load("key") is None
+  cache.save("key", np.zeros(3))
+  assert cache.load("key") is not None
+  assert cache.load("key") is not None
+
+  assert cache.hits == 2
+  assert cache.misses == 1
+  assert cache.evictions == 0
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+  cache = MemoryFeatureCache(max_size=2 * 800)
+  cache.save("a", np.zeros(100))
+  cache.save("b", np.zeros(100))
+  # marks a as used after b
+  assert cache.load("a") is not None
+  cache.save("c", np.zeros(100))
+
+  assert cache.evictions == 1
+  assert cache.get_size() == 2 * 800
+  assert cache.load("b") is None
+  assert cache.load("a") is not None
+  assert cache.load("c") is not None
+
+
+def test_saving_existing_key_replaces_entry() -> None:
+  cache = MemoryFeatureCache(max_size=1000)
+  cache.save("a", np.zeros(100))
+  cache.save("a", np.ones(50))
+
+  assert cache.get_size() == 400
+  np.testing.assert_array_equal(cache.load("a"), np.ones(50))
+
+
+def test_features_larger_than_max_size_are_not_saved() -> None:
+  cache = MemoryFeatureCache(max_size=100)
+  cache.save("key", np.zeros(100))
+
+  assert cache.load("key") is None
+  assert cache.get_size() == 0
+  assert cache.evictions == 0
+
+
+def test_key_depends_on_path_params_and_mtime(tmp_path: Path) -> None:
+  cache = MemoryFeatureCache(max_size=1000)
+  audio = tmp_path / "a.wav"
+  audio.write_bytes(b"abc")
+  other_audio = tmp_path / "b.wav"
+  other_audio.write_bytes(b"abc")
+  key = cache.get_key(audio, {"M": 20})
+
+  assert key == cache.get_key(str(audio), {"M": 20})
+  assert key != cache.get_key(other_audio, {"M": 20})
+  assert key != cache.get_key(audio, {"M": 30})
+
+  stat = os.stat(audio)
+  os.utime(audio, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+  assert key != cache.get_key(audio, {"M": 20})
+
+
+def test_invalid_max_size_raises_error() -> None:
+  with pytest.raises(ValueError, match="max_size must be > 0"):
+    MemoryFeatureCache(max_size=0)
@@ -20,6 +20,7 @@ def norm_w_n_m(
 ) -> npt.NDArray:
   """Normalizes the Mel filter bank"""
   assert method in ["slaney", "sum"]
+  w_n_m = w_n_m.copy()
   M, n_fft = w_n_m.shape
   if method == "slaney":
     enorm = 2.0 / (hz_points[2:] - hz_points[:-2])
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from mel_cepstral_distance import computation
+from mel_cepstral_distance.alignment import get_dtw_path
+from mel_cepstral_distance.computation import get_MCD_k, get_MCD_k_along_path
+
+
+def test_returns_same_as_stretched_mfccs() -> None:
+  rng = np.random.default_rng(1)
+  MC_X_ik = rng.standard_normal((20, 30))
+  MC_Y_ik = rng.standard_normal((20, 45))
+  path = get_dtw_path(MC_X_ik[1:13], MC_Y_ik[1:13])
+  expected = get_MCD_k(MC_X_ik[:, path[:, 0]], MC_Y_ik[:, path[:, 1]], 1, 13)
+
+  result = get_MCD_k_along_path(MC_X_ik, MC_Y_ik, path, 1, 13)
+
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_chunked_returns_same_as_unchunked(monkeypatch: pytest.MonkeyPatch) -> None:
+  rng = np.random.default_rng(1)
+  MC_X_ik = rng.standard_normal((20, 30))
+  MC_Y_ik = rng.standard_normal((20, 45))
+  path = get_dtw_path(MC_X_ik, MC_Y_ik)
+  expected = get_MCD_k_along_path(MC_X_ik, MC_Y_ik, path, 0, 20)
+
+  monkeypatch.setattr(computation, "PATH_CHUNK_SIZE", 7)
+  result = get_MCD_k_along_path(MC_X_ik, MC_Y_ik, path, 0, 20)
+
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_single_precision_input_returns_single_precision() -> None:
+  MC_X_ik = np.ones((4, 3), dtype=np.float32)
+  MC_Y_ik = np.zeros((4, 2), dtype=np.float32)
+  path = np.array([[0, 0], [1, 1], [2, 1]])
+
+  result = get_MCD_k_along_path(MC_X_ik, MC_Y_ik, path, 0, 4)
+
+  assert result.dtype == np.float32
+  np.testing.assert_array_equal(result, [2, 2, 2])
@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
-from mel_cepstral_distance.computation import get_MC_X_ik
+from mel_cepstral_distance import computation
+from mel_cepstral_distance.computation import get_cos_terms, get_MC_X_ik
 
 
 def get_MC_X_ik_from_paper(X_kn: np.ndarray, M: int) -> np.ndarray:
@@ -102,3 +104,62 @@ def test_basic_input_one_dim() -> None:
   assert np.allclose(result, expected), f"Expected {expected}, but got {result}."
   # Compare with the paper's implementation
   assert np.allclose(result, get_MC_X_ik_from_paper(X_kn, M))
+
+
+def test_single_precision_input_returns_single_precision() -> None:
+  X_kn = np.random.default_rng(1).standard_normal((12, 6))
+  expected = get_MC_X_ik(X_kn, 6)
+  result = get_MC_X_ik(X_kn.astype(np.float32), 6)
+
+  assert result.dtype == np.float32
+  np.testing.assert_allclose(result, expected, rtol=0, atol=1e-5)
+
+
+def test_rows_s_to_D_return_same_as_slice_of_all_rows() -> None:
+  X_kn = np.random.default_rng(1).standard_normal((12, 20))
+  expected = get_MC_X_ik(X_kn, 16)
+
+  result = get_MC_X_ik(X_kn, 16, s=1, D=13)
+
+  assert result.shape == (12, 12)
+  np.testing.assert_array_equal(result, expected[1:13])
+
+
+def test_dct_returns_same_as_matmul() -> None:
+  X_kn = np.random.default_rng(1).standard_normal((12, 20))
+  for s, D in [(0, 16), (1, 13), (3, 16), (15, 16)]:
+    expected = get_MC_X_ik(X_kn, 16, s=s, D=D, dct_backend="matmul")
+    result = get_MC_X_ik(X_kn, 16, s=s, D=D, dct_backend="fft")
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+    assert np.allclose(result, get_MC_X_ik_from_paper(X_kn, 16)[s:D])
+
+
+def test_dct_with_single_precision_input_returns_single_precision() -> None:
+  X_kn = np.random.default_rng(1).standard_normal((12, 6))
+  expected = get_MC_X_ik(X_kn, 6, dct_backend="matmul")
+  result = get_MC_X_ik(X_kn.astype(np.float32), 6, dct_backend="fft")
+
+  assert result.dtype == np.float32
+  np.testing.assert_allclose(result, expected, rtol=0, atol=1e-5)
+
+
+def test_auto_uses_dct_for_many_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+  X_kn = np.random.default_rng(1).standard_normal((12, 20))
+  monkeypatch.setattr(computation, "DCT_FFT_MIN_ROWS", 10)
+
+  np.testing.assert_array_equal(
+    get_MC_X_ik(X_kn, 16, s=1, D=13),
+    get_MC_X_ik(X_kn, 16, s=1, D=13, dct_backend="fft"),
+  )
+  np.testing.assert_array_equal(
+    get_MC_X_ik(X_kn, 16, s=1, D=5),
+    get_MC_X_ik(X_kn, 16, s=1, D=5, dct_backend="matmul"),
+  )
+
+
+def test_cos_terms_are_memoized_and_read_only() -> None:
+  result = get_cos_terms(16)
+
+  assert get_cos_terms(16) is result
+  assert not result.flags.writeable
@@ -1,5 +1,7 @@
 import numpy as np
+import pytest
 
+from mel_cepstral_distance import computation
 from mel_cepstral_distance.computation import get_X_km
 
 
@@ -178,3 +180,72 @@ def test_stft_with_truncation() -> None:
   assert np.allclose(result, expected), (
     f"Expected array:\n{expected}\nbut got:\n{result}"
   )
+
+
+def test_long_signal_frames_are_same_as_sliced_frames() -> None:
+  S = np.random.default_rng(0).standard_normal(10000)
+  n_fft = 512
+  win_len = 400
+  hop_length = 160
+  window = "hanning"
+  result = get_X_km(S, n_fft, win_len, hop_length, window)
+
+  expected = np.array(
+    [
+      np.fft.rfft(np.hanning(n_fft)[:win_len] * S[k : k + win_len], n=n_fft)
+      for k in range(0, len(S) - win_len, hop_length)
+    ]
+  )
+
+  assert result.shape == expected.shape == (60, 257)
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_signal_shorter_than_window_returns_no_frames() -> None:
+  S = np.array([1, 2, 3, 4])
+  result = get_X_km(S, 4, 4, 2, "hanning")
+
+  assert result.shape == (0, 3)
+  assert result.dtype == np.complex128
+
+
+def test_frames_are_transformed_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+  S = np.random.default_rng(1).standard_normal(1000)
+  expected = get_X_km(S, 64, 64, 16, "hamming")
+
+  monkeypatch.setattr(computation, "STFT_CHUNK_SIZE", 7)
+  result = get_X_km(S, 64, 64, 16, "hamming")
+
+  assert result.shape == (59, 33)
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_norm_divisor_is_same_as_dividing_signal() -> None:
+  S = np.random.default_rng(2).integers(-(2**15), 2**15, 1000, dtype=np.int16)
+  max_abs = np.max(np.abs(S))
+  result = get_X_km(S, 64, 48, 16, "hanning", norm_divisor=max_abs)
+  expected = get_X_km(S / max_abs, 64, 48, 16, "hanning")
+
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_float32_returns_single_precision_close_to_float64() -> None:
+  S = np.random.default_rng(3).integers(-(2**15), 2**15, 5000, dtype=np.int16)
+  max_abs = np.max(np.abs(S))
+  for norm_divisor in [None, max_abs]:
+    expected = get_X_km(S, 64, 48, 16, "hanning", norm_divisor=norm_divisor)
+    result = get_X_km(
+      S, 64, 48, 16, "hanning", norm_divisor=norm_divisor, dtype="float32"
+    )
+
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(
+      result, expected, rtol=0, atol=1e-5 * np.max(np.abs(expected))
+    )
+
+
+def test_float32_signal_shorter_than_window_returns_single_precision() -> None:
+  result = get_X_km(np.array([1, 2, 3, 4]), 4, 4, 2, "hanning", dtype="float32")
+
+  assert result.shape == (0, 3)
+  assert result.dtype == np.complex64
@@ -1,6 +1,13 @@
 import numpy as np
+import pytest
 
-from mel_cepstral_distance.computation import get_w_n_m, get_X_kn
+from mel_cepstral_distance import computation
+from mel_cepstral_distance.computation import (
+  get_w_n_m,
+  get_w_n_m_bands,
+  get_X_kn,
+  get_X_kn_from_energy,
+)
 
 
 def get_X_kn_from_paper(X_km: np.ndarray, w_n_m: np.ndarray) -> np.ndarray:
@@ -156,3 +163,76 @@ def test_high_and_fminuencies() -> None:
   )
   # Compare with the paper's implementation
   assert np.allclose(result, get_X_kn_from_paper(X_km, w_n_m))
+
+
+def test_single_precision_input_returns_single_precision() -> None:
+  X_km = np.random.default_rng(1).standard_normal((12, 5)) * 100
+  w_n_m = get_w_n_m(48000, 8, 4, 100, 12000)
+  expected = get_X_kn(X_km, w_n_m)
+  result = get_X_kn(X_km.astype(np.complex64), w_n_m)
+
+  assert result.dtype == np.float32
+  np.testing.assert_allclose(result, expected, rtol=1e-5)
+
+
+def test_chunked_energy_returns_same_as_unchunked(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  rng = np.random.default_rng(1)
+  X_km = rng.standard_normal((25, 5)) + 1j * rng.standard_normal((25, 5))
+  w_n_m = get_w_n_m(48000, 8, 4, 100, 12000)
+  expected = get_X_kn(X_km, w_n_m)
+
+  monkeypatch.setattr(computation, "ENERGY_CHUNK_SIZE", 4)
+  result = get_X_kn(X_km, w_n_m)
+
+  np.testing.assert_array_equal(result, expected)
+  assert np.allclose(result, get_X_kn_from_paper(X_km, w_n_m))
+
+
+def test_from_energy_returns_same_as_from_amplitudes() -> None:
+  rng = np.random.default_rng(1)
+  X_km = rng.standard_normal((12, 5)) + 1j * rng.standard_normal((12, 5))
+  w_n_m = get_w_n_m(48000, 8, 4, 100, 12000)
+  expected = get_X_kn(X_km, w_n_m)
+
+  result = get_X_kn_from_energy(np.abs(X_km) ** 2, w_n_m)
+
+  np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_from_single_precision_energy_returns_single_precision() -> None:
+  X_km_energy = np.random.default_rng(1).random((12, 5)).astype(np.float32)
+  w_n_m = get_w_n_m(48000, 8, 4, 100, 12000)
+
+  result = get_X_kn_from_energy(X_km_energy, w_n_m)
+
+  assert result.dtype == np.float32
+
+
+def test_banded_filterbank_returns_same_as_dense(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  rng = np.random.default_rng(1)
+  X_km = rng.standard_normal((100, 1025)) + 1j * rng.standard_normal((100, 1025))
+  w_n_m = get_w_n_m(44100, 2048, 40, 0, 22050)
+  result = get_X_kn(X_km, w_n_m)
+  result_from_energy = get_X_kn_from_energy(np.abs(X_km) ** 2, w_n_m)
+
+  monkeypatch.setattr(computation, "BANDED_MIN_FRAMES", 10**6)
+  expected = get_X_kn(X_km, w_n_m)
+
+  np.testing.assert_allclose(result, expected, atol=1e-12)
+  np.testing.assert_allclose(result_from_energy, expected, atol=1e-12)
+
+
+def test_banded_filterbank_keeps_single_precision() -> None:
+  rng = np.random.default_rng(1)
+  X_km = rng.standard_normal((100, 1025)) + 1j * rng.standard_normal((100, 1025))
+  w_n_m = get_w_n_m(44100, 2048, 40, 0, 22050)
+  expected = get_X_kn(X_km, w_n_m)
+
+  result = get_X_kn(X_km.astype(np.complex64), w_n_m, get_w_n_m_bands(w_n_m))
+
+  assert result.dtype == np.float32
+  np.testing.assert_allclose(result, expected, rtol=1e-5)
@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
 from mel_cepstral_distance.computation import get_w_n_m
+from mel_cepstral_distance.helper import get_hz_points
 
 
 def test_basic_mel_filterbank() -> None:
@@ -110,3 +112,40 @@ def test_zero_sum_band() -> None:
   assert np.allclose(result, expected), (
     f"Expected array:\n{expected}\nbut got:\n{result}"
   )
+
+
+def get_w_n_m_with_loop(
+  sample_rate: int, n_fft: int, M: int, fmin: float, fmax: float
+) -> np.ndarray:
+  hz_points = get_hz_points(fmin, fmax, M)
+  bins = np.floor((n_fft + 1) * hz_points / sample_rate).astype(int)
+  w_n_m = np.zeros((M, n_fft // 2 + 1))
+  for n in range(1, M + 1):
+    left = bins[n - 1]
+    center = bins[n]
+    right = bins[n + 1]
+    w_n_m[n - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+    w_n_m[n - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+  return w_n_m
+
+
+def test_returns_same_as_loop() -> None:
+  for sample_rate, n_fft, M, fmin, fmax in [
+    (8000, 16, 2, 0, 4000),
+    (16000, 4, 2, 0, 8000),
+    (22050, 512, 20, 0, 11025),
+    (22050, 512, 80, 300, 4000),
+    (44100, 2048, 128, 100, 22050),
+  ]:
+    result = get_w_n_m(sample_rate, n_fft, M, fmin, fmax)
+    expected = get_w_n_m_with_loop(sample_rate, n_fft, M, fmin, fmax)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_returns_memoized_read_only_array() -> None:
+  result = get_w_n_m(16000, 512, 10, 300, 8000)
+
+  assert get_w_n_m(16000, 512, 10, 300, 8000) is result
+  assert not result.flags.writeable
+  with pytest.raises(ValueError):
+    result[0, 0] = 1
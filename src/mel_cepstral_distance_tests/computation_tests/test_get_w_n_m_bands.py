@@ -0,0 +1,67 @@
+import numpy as np
+
+from mel_cepstral_distance.computation import (
+  apply_w_n_m_bands,
+  get_w_n_m,
+  get_w_n_m_bands,
+  use_w_n_m_bands,
+)
+
+
+def test_bands_contain_all_nonzero_weights() -> None:
+  w_n_m = get_w_n_m(44100, 2048, 40, 0, 22050)
+  bands = get_w_n_m_bands(w_n_m)
+
+  assert len(bands) == 8
+  restored = np.zeros_like(w_n_m)
+  for filters, bins, weights in bands:
+    restored[filters, bins] = weights.T
+  np.testing.assert_array_equal(restored, w_n_m)
+
+
+def test_applying_bands_returns_same_as_dense() -> None:
+  w_n_m = get_w_n_m(44100, 2048, 40, 0, 22050)
+  X_km_energy = np.random.default_rng(1).random((100, w_n_m.shape[1]))
+
+  result = apply_w_n_m_bands(
+    X_km_energy, get_w_n_m_bands(w_n_m), out=np.empty((100, 40))
+  )
+
+  np.testing.assert_allclose(result, X_km_energy @ w_n_m.T, rtol=1e-12)
+
+
+def test_more_bands_than_filters_returns_one_band_per_filter() -> None:
+  w_n_m = get_w_n_m(16000, 512, 3, 0, 8000)
+  bands = get_w_n_m_bands(w_n_m)
+
+  assert [filters for filters, _, _ in bands] == [
+    slice(0, 1),
+    slice(1, 2),
+    slice(2, 3),
+  ]
+
+
+def test_filters_without_weights_return_empty_bins() -> None:
+  w_n_m = get_w_n_m(16000, 512, 4, 0, 8000).copy()
+  w_n_m[:2] = 0
+  bands = get_w_n_m_bands(w_n_m, n_bands=2)
+
+  assert bands[0][1] == slice(257, 257)
+  X_km_energy = np.ones((3, 257))
+  result = apply_w_n_m_bands(X_km_energy, bands, out=np.empty((3, 4)))
+  np.testing.assert_allclose(result, X_km_energy @ w_n_m.T, rtol=1e-12)
+
+
+def test_dense_is_used_for_few_frames_or_few_filters() -> None:
+  w_n_m_many_filters = get_w_n_m(44100, 2048, 80, 0, 22050)
+  w_n_m_one_filter = get_w_n_m(44100, 2048, 1, 0, 22050)
+
+  assert use_w_n_m_bands(
+    w_n_m_many_filters, get_w_n_m_bands(w_n_m_many_filters), n_frames=1000
+  )
+  assert not use_w_n_m_bands(
+    w_n_m_many_filters, get_w_n_m_bands(w_n_m_many_filters), n_frames=10
+  )
+  assert not use_w_n_m_bands(
+    w_n_m_one_filter, get_w_n_m_bands(w_n_m_one_filter), n_frames=1000
+  )
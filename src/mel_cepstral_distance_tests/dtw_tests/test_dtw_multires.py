@@ -0,0 +1,43 @@
+import numpy as np
+from fastdtw.fastdtw import fastdtw
+from scipy.spatial.distance import euclidean
+
+from mel_cepstral_distance.dtw import dtw_multires
+
+
+def test_identical_sequences_return_diagonal() -> None:
+  seq = np.array([[1, 5], [2, 4], [3, 3], [4, 2], [5, 1]])
+  distance, path = dtw_multires(seq, seq, radius=1)
+  assert distance == 0
+  assert np.array_equal(path, np.array([[0, 0], [1, 1], [2, 2], [3, 3], [4, 4]]))
+
+
+def test_different_lengths() -> None:
+  seq_1 = np.array([[1, 5], [3, 3], [5, 1]])
+  seq_2 = np.array([[1, 5], [2, 4], [3, 3], [4, 2], [5, 1]])
+  _, path = dtw_multires(seq_1, seq_2, radius=1)
+  assert np.array_equal(path, np.array([[0, 0], [1, 1], [1, 2], [2, 3], [2, 4]]))
+
+
+def test_single_frames() -> None:
+  distance, path = dtw_multires(np.array([[3.0, 4.0]]), np.array([[0.0, 0.0]]), 1)
+  assert distance == 5
+  assert np.array_equal(path, np.array([[0, 0]]))
+
+
+def test_matches_fastdtw() -> None:
+  rng = np.random.default_rng(1234)
+  for _ in range(50):
+    len_1, len_2 = rng.integers(1, 80, size=2)
+    n_features = rng.integers(1, 6)
+    radius = int(rng.integers(1, 5))
+    seq_1 = rng.normal(size=(len_1, n_features))
+    seq_2 = rng.normal(size=(len_2, n_features))
+
+    expected_distance, expected_path = fastdtw(
+      seq_1, seq_2, dist=euclidean, radius=radius
+    )
+    distance, path = dtw_multires(seq_1, seq_2, radius)
+
+    assert np.isclose(distance, expected_distance)
+    assert np.array_equal(path, np.array(expected_path))
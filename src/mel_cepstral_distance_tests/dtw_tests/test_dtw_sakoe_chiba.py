@@ -0,0 +1,59 @@
+import numpy as np
+
+from mel_cepstral_distance.dtw import (
+  dtw_multires,
+  dtw_multires_with_path_costs,
+  dtw_sakoe_chiba,
+  dtw_sakoe_chiba_with_path_costs,
+)
+
+
+def test_identical_sequences_return_diagonal() -> None:
+  seq = np.array([[1, 5], [2, 4], [3, 3], [4, 2], [5, 1]])
+  distance, path = dtw_sakoe_chiba(seq, seq, radius=1)
+  assert distance == 0
+  assert np.array_equal(path, np.array([[0, 0], [1, 1], [2, 2], [3, 3], [4, 4]]))
+
+
+def test_path_is_continuous_and_monotonic() -> None:
+  rng = np.random.default_rng(1234)
+  seq_1 = rng.normal(size=(40, 3))
+  seq_2 = rng.normal(size=(97, 3))
+  _, path = dtw_sakoe_chiba(seq_1, seq_2, radius=1)
+  steps = np.diff(path, axis=0)
+  assert np.array_equal(path[0], [0, 0])
+  assert np.array_equal(path[-1], [39, 96])
+  assert np.all((steps >= 0) & (steps <= 1))
+  assert np.all(steps.sum(axis=1) >= 1)
+
+
+def test_path_stays_within_band() -> None:
+  rng = np.random.default_rng(1234)
+  seq_1 = rng.normal(size=(50, 3))
+  seq_2 = rng.normal(size=(50, 3))
+  _, path = dtw_sakoe_chiba(seq_1, seq_2, radius=2)
+  assert np.all(np.abs(path[:, 0] - path[:, 1]) <= 2)
+
+
+def test_none_radius_returns_optimal_distance() -> None:
+  rng = np.random.default_rng(1234)
+  seq_1 = rng.normal(size=(30, 4))
+  seq_2 = rng.normal(size=(45, 4))
+  distance, _ = dtw_sakoe_chiba(seq_1, seq_2, radius=None)
+  full_distance, _ = dtw_multires(seq_1, seq_2, radius=45)
+  band_distance, _ = dtw_sakoe_chiba(seq_1, seq_2, radius=3)
+  assert np.isclose(distance, full_distance)
+  assert band_distance >= distance
+
+
+def test_path_costs_are_distances_of_the_frames_along_the_path() -> None:
+  rng = np.random.default_rng(1234)
+  seq_1 = rng.normal(size=(40, 3))
+  seq_2 = rng.normal(size=(97, 3))
+  for distance, path, path_costs in (
+    dtw_sakoe_chiba_with_path_costs(seq_1, seq_2, radius=3),
+    dtw_multires_with_path_costs(seq_1, seq_2, radius=2),
+  ):
+    expected = np.linalg.norm(seq_1[path[:, 0]] - seq_2[path[:, 1]], axis=1)
+    np.testing.assert_allclose(path_costs, expected, rtol=1e-12)
+    np.testing.assert_allclose(distance, np.sum(path_costs), rtol=1e-12)
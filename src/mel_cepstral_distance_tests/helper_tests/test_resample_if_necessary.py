@@ -0,0 +1,38 @@
+import numpy as np
+
+from mel_cepstral_distance.helper import resample_if_necessary
+
+
+def get_sine(freq: float, sr: int, n_samples: int) -> np.ndarray:
+  return np.sin(2 * np.pi * freq * np.arange(n_samples) / sr)
+
+
+def test_same_sample_rate_returns_input() -> None:
+  audio = np.ones(10)
+  assert resample_if_necessary(audio, 16000, 16000) is audio
+  assert resample_if_necessary(audio, 16000, 16000, "polyphase") is audio
+
+
+def test_polyphase_returns_same_number_of_samples_as_fft() -> None:
+  audio = np.random.default_rng(0).standard_normal(10007)
+  for sr, target_sr in [(44100, 22050), (44100, 16000), (16000, 22050), (8000, 48000)]:
+    result = resample_if_necessary(audio, sr, target_sr, "polyphase")
+    expected = resample_if_necessary(audio, sr, target_sr, "fft")
+    assert result.shape == expected.shape == (int(10007 * target_sr / sr),)
+
+
+def test_polyphase_resamples_sine() -> None:
+  audio = get_sine(440, 44100, 44101)
+  result = resample_if_necessary(audio, 44100, 16000, "polyphase")
+  expected = get_sine(440, 16000, len(result))
+
+  # the beginning and end are affected by the filter
+  np.testing.assert_allclose(result[100:-100], expected[100:-100], atol=1e-3)
+
+
+def test_polyphase_resamples_int16_to_float() -> None:
+  audio = (get_sine(440, 22050, 2205) * 10000).astype(np.int16)
+  result = resample_if_necessary(audio, 22050, 16000, "polyphase")
+
+  assert result.dtype == np.float64
+  assert np.max(np.abs(result[50:-50])) > 9000
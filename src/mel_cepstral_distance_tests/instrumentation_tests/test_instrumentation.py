@@ -0,0 +1,130 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from mel_cepstral_distance.api import compare_audio_files, compare_mfccs
+from mel_cepstral_distance.instrumentation import (
+  StageEvent,
+  StageTimingCollector,
+  add_stage_hook,
+  instrument,
+  remove_stage_hook,
+  run_stage,
+)
+
+TEST_DIR = Path("src/mel_cepstral_distance_tests/api_tests")
+
+AUDIO_A = TEST_DIR / "A.wav"
+AUDIO_B = TEST_DIR / "B.wav"
+
+
+def test_run_stage_without_hooks_returns_result() -> None:
+  assert run_stage("stage", np.add, 1, 2) == 3
+
+
+def test_run_stage_passes_shapes_and_nbytes_to_hooks() -> None:
+  events: List[StageEvent] = []
+  with instrument(events.append):
+    result = run_stage("stage", np.concatenate, (np.zeros(3), np.zeros(2)))
+    run_stage("divmod", np.divmod, np.ones((4, 2)), 2)
+
+  assert len(result) == 5
+  assert events[0].stage == "stage"
+  assert events[0].duration >= 0
+  assert events[0].input_shapes == ()
+  assert events[0].nbytes == 5 * 8
+  assert events[1].input_shapes == ((4, 2),)
+  assert events[1].nbytes == 2 * 4 * 2 * 8
+
+
+def test_instrument_removes_hook_after_exception() -> None:
+  events: List[StageEvent] = []
+  with pytest.raises(RuntimeError), instrument(events.append):
+    raise RuntimeError()
+
+  run_stage("stage", np.zeros, 3)
+
+  assert events == []
+
+
+def test_remove_stage_hook() -> None:
+  events: List[StageEvent] = []
+  add_stage_hook(events.append)
+  run_stage("stage", np.zeros, 3)
+  remove_stage_hook(events.append)
+  run_stage("stage", np.zeros, 3)
+
+  assert len(events) == 1
+
+
+def test_remove_unregistered_hook_raises_error() -> None:
+  with pytest.raises(ValueError):
+    remove_stage_hook(print)
+
+
+def test_compare_audio_files_reports_all_stages() -> None:
+  with instrument(StageTimingCollector()) as collector:
+    compare_audio_files(
+      AUDIO_A,
+      AUDIO_B,
+      sample_rate=16000,
+      remove_silence="sig",
+      silence_threshold_A=0.01,
+      silence_threshold_B=0.01,
+      dtw_backend="multires",
+    )
+
+  counts = {stage: len(durations) for stage, durations in collector.durations.items()}
+  assert counts == {
+    "read": 2,
+    "resampling": 2,
+    "silence_removal": 2,
+    "stft": 2,
+    "filterbank": 2,
+    "dct": 2,
+    "dtw": 1,
+  }
+
+
+def test_compare_mfccs_with_padding_reports_padding_and_distance() -> None:
+  events: List[StageEvent] = []
+  mfccs_A = np.ones((20, 10))
+  mfccs_B = np.ones((20, 12))
+  with instrument(events.append):
+    compare_mfccs(mfccs_A, mfccs_B, aligning="pad")
+
+  assert [event.stage for event in events] == ["padding", "distance"]
+  assert events[0].input_shapes == ((15, 10), (15, 12))
+
+
+def test_collector_summary() -> None:
+  collector = StageTimingCollector()
+  for duration in (1.0, 2.0, 3.0, 4.0):
+    collector(StageEvent("dtw", duration, (), 10))
+  collector(StageEvent("stft", 20.0, (), 100))
+
+  summary = collector.summary(percentiles=(50, 99.9))
+
+  assert list(summary) == ["stft", "dtw"]
+  assert summary["dtw"]["count"] == 4
+  assert summary["dtw"]["total"] == 10.0
+  assert summary["dtw"]["mean"] == 2.5
+  assert summary["dtw"]["max"] == 4.0
+  assert summary["dtw"]["p50"] == 2.5
+  assert summary["dtw"]["p99.9"] == pytest.approx(3.997)
+  assert summary["dtw"]["max_nbytes"] == 10
+
+
+def test_collector_reset() -> None:
+  collector = StageTimingCollector()
+  collector(StageEvent("dtw", 1.0, (), 10))
+  collector.reset()
+
+  assert collector.summary() == {}
+
+
+def test_collector_summary_invalid_percentile_raises_error() -> None:
+  with pytest.raises(ValueError):
+    StageTimingCollector().summary(percentiles=(101,))
@@ -0,0 +1,74 @@
+import numpy as np
+
+from mel_cepstral_distance.silence import (
+  detect_non_silence_rms,
+  get_loudness_vals_rms,
+  remove_silence_rms,
+)
+
+
+def test_removes_silent_blocks_including_tail() -> None:
+  audio = np.array([0, 0, 1, 1, 0, 0, 1], dtype=np.int16)
+  result = remove_silence_rms(audio, threshold_rms=0.5, min_silence_samples=2)
+
+  np.testing.assert_array_equal(result, np.array([1, 1, 1], dtype=np.float32))
+  assert result.dtype == np.float32
+
+
+def test_keeps_blocks_with_rms_equal_to_threshold() -> None:
+  audio = np.array([0.5, -0.5, 0.1, 0.1])
+  result = remove_silence_rms(audio, threshold_rms=0.5, min_silence_samples=2)
+
+  np.testing.assert_array_equal(result, np.array([0.5, -0.5], dtype=np.float32))
+
+
+def test_zero_threshold_returns_input() -> None:
+  audio = np.array([0, 0, 1], dtype=np.int16)
+  result = remove_silence_rms(audio, threshold_rms=0, min_silence_samples=2)
+
+  assert result is audio
+
+
+def test_only_silence_returns_empty_float32() -> None:
+  audio = np.zeros(10)
+  result = remove_silence_rms(audio, threshold_rms=0.1, min_silence_samples=3)
+
+  assert result.shape == (0,)
+  assert result.dtype == np.float32
+
+
+def test_large_int16_values_do_not_overflow() -> None:
+  audio = np.full(4, 30000, dtype=np.int16)
+  result = get_loudness_vals_rms(audio, min_silence_samples=3)
+
+  np.testing.assert_allclose(result, [30000, 30000])
+
+
+def test_result_is_same_as_blockwise_computation() -> None:
+  rng = np.random.default_rng(0)
+  audio = (rng.standard_normal(10007) * rng.uniform(0, 1, 10007)).astype(np.float32)
+  min_silence_samples = 400
+  threshold_rms = 0.4
+
+  expected = []
+  for start in range(0, len(audio), min_silence_samples):
+    segment = audio[start : start + min_silence_samples]
+    if np.sqrt(np.mean(segment**2)) >= threshold_rms:
+      expected.append(segment)
+
+  result = remove_silence_rms(audio, threshold_rms, min_silence_samples)
+
+  np.testing.assert_array_equal(result, np.concatenate(expected))
+
+
+def test_mask_selects_removed_samples() -> None:
+  rng = np.random.default_rng(1)
+  audio = rng.standard_normal(1001) * rng.uniform(0, 1, 1001)
+  mask = detect_non_silence_rms(audio, threshold_rms=0.5, min_silence_samples=100)
+
+  assert mask.shape == audio.shape
+  assert mask.dtype == bool
+  assert 0 < mask.sum() < len(audio)
+  np.testing.assert_array_equal(
+    audio.astype(np.float32)[mask], remove_silence_rms(audio, 0.5, 100)
+  )
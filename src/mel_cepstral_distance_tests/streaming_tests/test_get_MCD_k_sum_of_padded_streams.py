@@ -0,0 +1,56 @@
+import numpy as np
+
+from mel_cepstral_distance.computation import get_MCD_k
+from mel_cepstral_distance.streaming import get_MCD_k_sum_of_padded_streams
+
+
+def split_frames(MC_X_ik: np.ndarray, chunk_sizes: list) -> list:
+  bounds = np.cumsum(chunk_sizes)[:-1]
+  return np.split(MC_X_ik, bounds, axis=1)
+
+
+def test_sum_is_same_as_for_padded_matrices() -> None:
+  rng = np.random.default_rng(0)
+  MC_X_ik = rng.standard_normal((20, 30))
+  MC_Y_ik = rng.standard_normal((20, 45))
+  MC_pad_i = rng.standard_normal(20)
+
+  MC_X_ik_padded = np.concatenate(
+    (MC_X_ik, np.repeat(MC_pad_i[:, np.newaxis], 15, axis=1)), axis=1
+  )
+  expected = np.sum(get_MCD_k(MC_X_ik_padded, MC_Y_ik, 1, 16))
+
+  result, n_frames_X, n_frames_Y = get_MCD_k_sum_of_padded_streams(
+    split_frames(MC_X_ik, [7, 0, 10, 13]),
+    split_frames(MC_Y_ik, [20, 20, 5]),
+    1,
+    16,
+    MC_pad_i,
+  )
+
+  np.testing.assert_allclose(result, expected, rtol=1e-12)
+  assert n_frames_X == 30
+  assert n_frames_Y == 45
+
+
+def test_first_stream_longer() -> None:
+  MC_X_ik = np.ones((3, 4))
+  MC_Y_ik = np.zeros((3, 1))
+
+  result, n_frames_X, n_frames_Y = get_MCD_k_sum_of_padded_streams(
+    [MC_X_ik], [MC_Y_ik], 0, 3, np.zeros(3)
+  )
+
+  np.testing.assert_allclose(result, 4 * np.sqrt(3))
+  assert n_frames_X == 4
+  assert n_frames_Y == 1
+
+
+def test_empty_streams() -> None:
+  result, n_frames_X, n_frames_Y = get_MCD_k_sum_of_padded_streams(
+    [], [], 0, 3, np.zeros(3)
+  )
+
+  assert result == 0
+  assert n_frames_X == 0
+  assert n_frames_Y == 0
@@ -0,0 +1,46 @@
+import numpy as np
+
+from mel_cepstral_distance.computation import get_window, get_X_km
+from mel_cepstral_distance.streaming import iter_X_km
+
+
+def get_streamed_X_km(
+  S: np.ndarray, block_size: int, n_fft: int, win_len: int, hop_length: int
+) -> np.ndarray:
+  blocks = [S[start : start + block_size] for start in range(0, len(S), block_size)]
+  win = get_window("hanning", n_fft)
+  chunks = list(iter_X_km(blocks, n_fft, win_len, hop_length, "hanning", win))
+  if len(chunks) == 0:
+    return np.empty((0, n_fft // 2 + 1), dtype=np.complex128)
+  return np.concatenate(chunks)
+
+
+def test_frames_are_same_as_get_X_km() -> None:
+  S = np.random.default_rng(0).standard_normal(20000)
+  for n_fft, win_len, hop_length in [(512, 512, 128), (512, 300, 200), (256, 512, 64)]:
+    expected = get_X_km(S, n_fft, win_len, hop_length, "hanning")
+    for block_size in [1, 100, 512, 1000, 20000]:
+      result = get_streamed_X_km(S, block_size, n_fft, win_len, hop_length)
+      np.testing.assert_array_equal(result, expected)
+
+
+def test_hop_longer_than_window_skips_samples_across_blocks() -> None:
+  S = np.random.default_rng(1).standard_normal(5000)
+  expected = get_X_km(S, 64, 64, 300, "hanning")
+  result = get_streamed_X_km(S, 50, 64, 64, 300)
+  np.testing.assert_array_equal(result, expected)
+
+
+def test_each_chunk_contains_the_frames_completed_by_its_block() -> None:
+  S = np.arange(20, dtype=np.float64)
+  win = get_window("hanning", 4)
+  chunks = list(iter_X_km([S[:8], S[8:16], S[16:]], 4, 4, 2, "hanning", win))
+
+  # frames start before len(S) - win_len, i.e., at 0, 2, ..., 14
+  assert [len(chunk) for chunk in chunks] == [2, 4, 2]
+
+
+def test_signal_shorter_than_window_yields_nothing() -> None:
+  win = get_window("hanning", 8)
+  chunks = list(iter_X_km([np.ones(4), np.ones(4)], 8, 8, 2, "hanning", win))
+  assert chunks == []